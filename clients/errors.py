@@ -0,0 +1,10 @@
+from grpc import RpcError
+from httpx import HTTPError
+from pydantic import ValidationError
+
+# Ошибки запроса клиента: сетевые ошибки, таймауты, ошибки gRPC и ответы,
+# которые не удалось разобрать (например, тело 5xx ответа HTTP-шлюза)
+REQUEST_ERRORS = (RpcError, HTTPError, ValidationError)
+
+# Базовая пауза перед повтором запроса (в секундах), удваивается с каждой попыткой
+RETRY_BACKOFF = 0.1
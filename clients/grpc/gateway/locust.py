@@ -1,7 +1,14 @@
+from typing import Callable
+
 from locust import TaskSet, SequentialTaskSet
+from locust.env import Environment
 
 # Импортируем типы и билдеры для построения HTTP API клиентов
-from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient, build_accounts_gateway_locust_grpc_client
+from clients.grpc.gateway.accounts.client import (
+    AccountsGatewayGRPCClient,
+    build_accounts_gateway_grpc_client,
+    build_accounts_gateway_locust_grpc_client
+)
 from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient, build_cards_gateway_locust_grpc_client
 from clients.grpc.gateway.documents.client import (
     DocumentsGatewayGRPCClient,
@@ -11,7 +18,12 @@ from clients.grpc.gateway.operations.client import (
     OperationsGatewayGRPCClient,
     build_operations_gateway_locust_grpc_client
 )
-from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_locust_grpc_client
+from clients.grpc.gateway.users.client import (
+    UsersGatewayGRPCClient,
+    build_users_gateway_grpc_client,
+    build_users_gateway_locust_grpc_client
+)
+from tools.locust.fresh import FreshAccount
 
 
 class GatewayGRPCTaskSet(TaskSet):
@@ -63,3 +75,33 @@ class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
         self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
         self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
         self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
+
+
+def build_fresh_account_gateway_grpc_producer(
+        open_account: str,
+        environment: Environment | None
+) -> Callable[[], FreshAccount]:
+    """
+    Строит функцию создания свежего пользователя со счётом для пула FreshUsersPool.
+    Вызывается каждым производителем пула при запуске, поэтому у производителей свои клиенты.
+
+    :param open_account: Имя метода AccountsGatewayGRPCClient, открывающего счёт (например, "open_debit_card_account").
+    :param environment: Окружение Locust — запросы попадают в статистику Locust;
+        None — запросы выполняются обычными клиентами и не измеряются.
+    :return: Функция, которая создаёт пользователя, открывает ему счёт и возвращает оба ответа.
+    """
+    if environment is None:
+        users_gateway_client = build_users_gateway_grpc_client()
+        accounts_gateway_client = build_accounts_gateway_grpc_client()
+    else:
+        users_gateway_client = build_users_gateway_locust_grpc_client(environment)
+        accounts_gateway_client = build_accounts_gateway_locust_grpc_client(environment)
+
+    def produce() -> FreshAccount:
+        create_user_response = users_gateway_client.create_user()
+        open_account_response = getattr(accounts_gateway_client, open_account)(
+            user_id=create_user_response.user.id
+        )
+        return FreshAccount(create_user_response=create_user_response, open_account_response=open_account_response)
+
+    return produce
@@ -0,0 +1,86 @@
+from grpc import Channel
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from config import settings
+from contracts.services.cards.card_pb2 import CardType, CardStatus, CardPaymentSystem
+from contracts.services.cards.cards_service_pb2_grpc import CardsServiceStub
+from contracts.services.cards.rpc_create_card_pb2 import CreateCardRequest, CreateCardResponse
+from contracts.services.cards.rpc_get_cards_pb2 import GetCardsRequest, GetCardsResponse
+from tools.fakers import fake
+
+
+class CardsServiceGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для взаимодействия с внутренним CardsService (в обход gateway).
+    Используется для сидинга.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к CardsService.
+        """
+        super().__init__(channel)
+
+        self.stub = CardsServiceStub(channel)
+
+    def get_cards_api(self, request: GetCardsRequest) -> GetCardsResponse:
+        """
+        Низкоуровневый вызов метода GetCards через gRPC.
+
+        :param request: gRPC-запрос с ID счёта.
+        :return: Ответ от сервиса со списком карт.
+        """
+        return self.stub.GetCards(request)
+
+    def create_card_api(self, request: CreateCardRequest) -> CreateCardResponse:
+        """
+        Низкоуровневый вызов метода CreateCard через gRPC.
+
+        :param request: gRPC-запрос с данными новой карты.
+        :return: Ответ от сервиса с данными созданной карты.
+        """
+        return self.stub.CreateCard(request)
+
+    def get_cards(self, account_id: str) -> GetCardsResponse:
+        """
+        Получение всех карт счёта.
+
+        :param account_id: Идентификатор счёта.
+        :return: Ответ со списком карт.
+        """
+        request = GetCardsRequest(account_id=account_id)
+        return self.get_cards_api(request)
+
+    def create_card(self, account_id: str, card_type: CardType.ValueType) -> CreateCardResponse:
+        """
+        Создание активной карты заданного типа с фейковыми реквизитами.
+
+        :param account_id: Идентификатор счёта.
+        :param card_type: Тип карты (виртуальная или физическая).
+        :return: Ответ с информацией о созданной карте.
+        """
+        request = CreateCardRequest(
+            pin=fake.pin(),
+            cvv=fake.cvv(),
+            type=card_type,
+            status=CardStatus.CARD_STATUS_ACTIVE,
+            account_id=account_id,
+            card_number=fake.card_number(),
+            card_holder=fake.card_holder(),
+            expiry_date=fake.expiry_date(),
+            payment_system=fake.proto_enum(CardPaymentSystem)
+        )
+        return self.create_card_api(request)
+
+
+def build_cards_service_grpc_client() -> CardsServiceGRPCClient:
+    """
+    Фабрика для создания экземпляра CardsServiceGRPCClient.
+
+    :return: Инициализированный клиент для CardsService.
+    """
+    channel = build_service_grpc_client(settings.cards_service_grpc_client, service="cards")
+    return CardsServiceGRPCClient(channel=channel)
@@ -0,0 +1,18 @@
+from grpc import Channel, insecure_channel
+
+from tools.config.grpc import GRPCClientConfig
+
+
+def build_service_grpc_client(config: GRPCClientConfig | None, service: str) -> Channel:
+    """
+    gRPC клиент для внутреннего сервиса (в обход gateway).
+    Адрес берётся из pydantic-settings.
+
+    :param config: Настройки подключения к сервису.
+    :param service: Имя сервиса (для сообщения об ошибке).
+    :raises ValueError: Если адрес сервиса не задан в настройках.
+    """
+    if config is None:
+        raise ValueError(f"Address of internal service '{service}' is not configured in settings")
+
+    return insecure_channel(config.client_url)
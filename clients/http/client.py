@@ -1,6 +1,13 @@
-from typing import Any, TypedDict
+import random
+from typing import Any, Generic, TypedDict, TypeVar
 
 from httpx import Client, Response, QueryParams, URL
+from pydantic import BaseModel
+
+from clients.http.payloads import HTTPPayload, HTTPPayloads
+from tools.config.http import HTTPClientValidation
+
+T = TypeVar("T", bound=BaseModel)
 
 
 # Тип расширений, которые можно передать в запрос
@@ -9,15 +16,97 @@ class HTTPClientExtensions(TypedDict, total=False):
     route: str
 
 
+class HTTPLazyResponse(Generic[T]):
+    """
+    Ленивое представление ответа: хранит тело ответа в байтах и валидирует его
+    в pydantic-схему только при первом обращении к полю.
+
+    Если сценарий не использует результат запроса, ответ вообще не разбирается.
+    Если использует — поля доступны так же, как у схемы (response.operation.id).
+    Ошибка валидации (например, тело ответа 5xx) возникает при первом обращении к полю.
+    """
+    __slots__ = ("_schema", "_content", "_model")
+
+    def __init__(self, schema: type[T], content: bytes):
+        """
+        :param schema: Pydantic-схема ответа.
+        :param content: Тело ответа.
+        """
+        self._schema = schema
+        self._content = content
+        self._model: T | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.validate(), name)
+
+    def __bytes__(self) -> bytes:
+        return self._content
+
+    def __repr__(self) -> str:
+        return f"HTTPLazyResponse({self._schema.__name__}, {len(self._content)} bytes)"
+
+    def validate(self) -> T:
+        """
+        Валидирует тело ответа (один раз) и возвращает схему.
+        """
+        if self._model is None:
+            self._model = self._schema.model_validate_json(self._content)
+
+        return self._model
+
+
+class HTTPResponseParser:
+    """
+    Разбор ответов HTTP-клиента в pydantic-схемы.
+
+    Ответ валидируется прямо из байтов response.content: без декодирования тела в str,
+    которое делает response.text. В режимах sampled и skipped вместо схемы возвращается
+    HTTPLazyResponse, который валидируется только при обращении к полям.
+    """
+
+    def __init__(self, validation: HTTPClientValidation = HTTPClientValidation.FULL, sample_rate: float = 1.0):
+        """
+        :param validation: Режим валидации ответов.
+        :param sample_rate: Доля ответов, которые валидируются сразу в режиме sampled.
+        """
+        self.validation = validation
+        self.sample_rate = sample_rate
+
+    def parse(self, response: Response, schema: type[T]) -> T:
+        """
+        Разбирает ответ в схему в соответствии с режимом валидации.
+
+        :param response: Ответ httpx.
+        :param schema: Pydantic-схема ответа.
+        :return: Схема ответа или HTTPLazyResponse с тем же интерфейсом полей.
+        """
+        match self.validation:
+            case HTTPClientValidation.SKIPPED:
+                return HTTPLazyResponse(schema, response.content)  # type: ignore[return-value]
+            case HTTPClientValidation.SAMPLED if random.random() >= self.sample_rate:
+                return HTTPLazyResponse(schema, response.content)  # type: ignore[return-value]
+            case _:
+                return schema.model_validate_json(response.content)
+
+
 class HTTPClient:
     """
     Базовый HTTP API клиент, принимающий объект httpx.Client.
 
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param parser: разбор ответов в pydantic-схемы (по умолчанию — полная валидация)
+    :param payloads: пулы заранее сгенерированных тел запросов (по умолчанию выключены)
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(
+            self,
+            client: Client,
+            parser: HTTPResponseParser | None = None,
+            payloads: HTTPPayloads | None = None
+    ) -> None:
         self.client = client
+        self.parser = parser or HTTPResponseParser()
+        self.payloads = payloads or HTTPPayloads()
 
     def get(
             self,
@@ -50,3 +139,37 @@ class HTTPClient:
         :return: Объект Response с данными ответа.
         """
         return self.client.post(url=url, json=json, extensions=extensions)  # extensions передаётся в httpx.Client
+
+    def post_request(
+            self,
+            url: str | URL,
+            request: BaseModel | HTTPPayload,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет POST-запрос с телом из pydantic-схемы или готовым телом из пула (см. HTTPPayloads).
+
+        :param url: URL-адрес эндпоинта.
+        :param request: Схема запроса или готовое JSON-тело.
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        if isinstance(request, HTTPPayload):
+            return self.client.post(
+                url=url,
+                content=request.content,
+                headers={"Content-Type": "application/json"},
+                extensions=extensions
+            )
+
+        return self.post(url, json=request.model_dump(by_alias=True), extensions=extensions)
+
+    def parse(self, response: Response, schema: type[T]) -> T:
+        """
+        Разбирает ответ в pydantic-схему (см. HTTPResponseParser).
+
+        :param response: Объект Response.
+        :param schema: Pydantic-схема ответа.
+        :return: Схема ответа.
+        """
+        return self.parser.parse(response, schema)
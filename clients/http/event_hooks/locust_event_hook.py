@@ -3,15 +3,27 @@ import time
 from httpx import Request, Response, HTTPStatusError, HTTPError
 from locust.env import Environment
 
+from tools.locust.connections import get_http_connections
 
-def locust_request_event_hook(request: Request) -> None:
+
+def locust_request_event_hook(environment: Environment):
     """
-    HTTPX event hook, вызываемый перед отправкой запроса.
+    Возвращает HTTPX event hook, вызываемый перед отправкой запроса.
 
     Сохраняет текущее время в `request.extensions["start_time"]`,
     чтобы потом использовать его для расчёта времени ответа.
+    Запрос отмечается в полёте в `environment.http_connections`.
+
+    :param environment: Объект окружения Locust.
+    :return: Функция-хук для HTTPX request event hook.
     """
-    request.extensions["start_time"] = time.time()
+    connections = get_http_connections(environment)
+
+    def inner(request: Request) -> None:
+        request.extensions["start_time"] = time.time()
+        connections.start(request)
+
+    return inner
 
 
 def locust_response_event_hook(environment: Environment):
@@ -21,12 +33,15 @@ def locust_response_event_hook(environment: Environment):
     Использует `request.extensions["start_time"]` для вычисления времени отклика.
     Извлекает route из `request.extensions["route"]`, если задан.
     Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
+    Версия протокола и соединение ответа учитываются в `environment.http_connections`.
 
     :param environment: Объект окружения Locust, через который отправляются метрики.
     :return: Функция-хук для HTTPX response event hook.
     """
+    connections = get_http_connections(environment)
 
     def inner(response: Response) -> None:
+        connections.record(response)
         exception: HTTPError | HTTPStatusError | None = None
 
         try:
@@ -1,13 +1,44 @@
 import logging
+from functools import lru_cache
 
-from httpx import Client
+from httpx import BaseTransport, Client, Limits
 from locust.env import Environment
 
+from clients.http.client import HTTPResponseParser
+from clients.http.payloads import HTTPPayloads
 from clients.http.event_hooks.locust_event_hook import (
     locust_request_event_hook,
     locust_response_event_hook
 )
+from clients.http.transport import GeventHTTPTransport
 from config import settings
+from tools.config.http import HTTPClientPoolScope, HTTPClientTransport
+
+
+def build_gateway_http_limits() -> Limits:
+    """
+    Лимиты пула соединений HTTP-клиента для http-gateway.
+    Все параметры берутся из глобальных настроек.
+    """
+    return Limits(
+        max_connections=settings.gateway_http_client.max_connections,
+        max_keepalive_connections=settings.gateway_http_client.max_keepalive_connections,
+        keepalive_expiry=settings.gateway_http_client.keepalive_expiry
+    )
+
+
+def build_gateway_http_transport() -> BaseTransport | None:
+    """
+    Транспорт HTTP-клиента для http-gateway по настройке GATEWAY_HTTP_CLIENT.TRANSPORT.
+    Для стандартного транспорта httpx возвращает None — httpx создаст его сам с лимитами из limits.
+    """
+    if settings.gateway_http_client.transport == HTTPClientTransport.GEVENT:
+        return GeventHTTPTransport(
+            timeout=settings.gateway_http_client.timeout,
+            max_connections=settings.gateway_http_client.max_connections
+        )
+
+    return None
 
 
 def build_gateway_http_client() -> Client:
@@ -17,7 +48,11 @@ def build_gateway_http_client() -> Client:
     """
     return Client(
         timeout=settings.gateway_http_client.timeout,
-        base_url=settings.gateway_http_client.client_url
+        base_url=settings.gateway_http_client.client_url,
+        http1=settings.gateway_http_client.http1,
+        http2=settings.gateway_http_client.http2,
+        limits=build_gateway_http_limits(),
+        transport=build_gateway_http_transport()
     )
 
 
@@ -32,8 +67,58 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     return Client(
         timeout=settings.gateway_http_client.timeout,
         base_url=settings.gateway_http_client.client_url,
+        http1=settings.gateway_http_client.http1,
+        http2=settings.gateway_http_client.http2,
+        limits=build_gateway_http_limits(),
+        transport=build_gateway_http_transport(),
         event_hooks={
-            "request": [locust_request_event_hook],
+            "request": [locust_request_event_hook(environment)],
             "response": [locust_response_event_hook(environment)]
         }
     )
+
+
+def build_gateway_locust_http_parser() -> HTTPResponseParser:
+    """
+    Разбор ответов для клиентов Locust.
+    Режим валидации берётся из GATEWAY_HTTP_CLIENT.VALIDATION и VALIDATION_SAMPLE_RATE.
+    """
+    return HTTPResponseParser(
+        validation=settings.gateway_http_client.validation,
+        sample_rate=settings.gateway_http_client.validation_sample_rate
+    )
+
+
+@lru_cache(maxsize=None)
+def get_gateway_locust_http_payloads() -> HTTPPayloads:
+    """
+    Пулы заранее сгенерированных тел запросов для клиентов Locust, общие для всего процесса.
+    Размер пулов задаётся GATEWAY_HTTP_CLIENT.PAYLOAD_POOL_SIZE (0 — пулы выключены).
+    Доменные клиенты сами заполняют пулы своих схем запросов (HTTPPayloads.prepare).
+    """
+    return HTTPPayloads(size=settings.gateway_http_client.payload_pool_size)
+
+
+def build_gateway_locust_shared_http_client(environment: Environment) -> Client | None:
+    """
+    HTTP-клиент для Locust, который делят все доменные клиенты виртуального пользователя.
+
+    Область общего пула соединений задаётся GATEWAY_HTTP_CLIENT.POOL_SCOPE:
+    - client — общего клиента нет (None), каждый доменный клиент создаёт свой пул, как раньше
+    - user — новый клиент на каждого виртуального пользователя
+    - process — один клиент на процесс Locust, хранится в environment.gateway_http_client
+      (все виртуальные пользователи процесса работают в одном потоке gevent)
+
+    :param environment: Объект окружения Locust.
+    :return: Общий httpx.Client или None.
+    """
+    match settings.gateway_http_client.pool_scope:
+        case HTTPClientPoolScope.CLIENT:
+            return None
+        case HTTPClientPoolScope.PROCESS:
+            client = getattr(environment, "gateway_http_client", None)
+            if client is None:
+                client = environment.gateway_http_client = build_gateway_locust_http_client(environment)
+            return client
+        case _:
+            return build_gateway_locust_http_client(environment)
@@ -1,10 +1,11 @@
-from httpx import Response
+from httpx import Client, Response
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
 from clients.http.gateway.client import (
     build_gateway_http_client,
     build_gateway_locust_http_client,
+    build_gateway_locust_http_parser
 )
 from clients.http.gateway.documents.schema import (
     GetTariffDocumentResponseSchema,
@@ -38,18 +39,22 @@ class DocumentsGatewayHTTPClient(HTTPClient):
 
     def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse(response, GetTariffDocumentResponseSchema)
 
     def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse(response, GetContractDocumentResponseSchema)
 
 
 def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
     return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_documents_gateway_locust_http_client(environment: Environment) -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> DocumentsGatewayHTTPClient:
     return DocumentsGatewayHTTPClient(
-        client=build_gateway_locust_http_client(environment)
+        client=client or build_gateway_locust_http_client(environment),
+        parser=build_gateway_locust_http_parser()
     )
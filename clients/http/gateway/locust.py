@@ -1,7 +1,15 @@
+from typing import Callable
+
 from locust import TaskSet, SequentialTaskSet
+from locust.env import Environment
 
 # Импортируем типы и билдеры для построения HTTP API клиентов
-from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
+from clients.http.gateway.accounts.client import (
+    AccountsGatewayHTTPClient,
+    build_accounts_gateway_http_client,
+    build_accounts_gateway_locust_http_client
+)
+from clients.http.gateway.client import build_gateway_locust_shared_http_client
 from clients.http.gateway.cards.client import CardsGatewayHTTPClient, build_cards_gateway_locust_http_client
 from clients.http.gateway.documents.client import (
     DocumentsGatewayHTTPClient,
@@ -11,7 +19,12 @@ from clients.http.gateway.operations.client import (
     OperationsGatewayHTTPClient,
     build_operations_gateway_locust_http_client
 )
-from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from clients.http.gateway.users.client import (
+    UsersGatewayHTTPClient,
+    build_users_gateway_http_client,
+    build_users_gateway_locust_http_client
+)
+from tools.locust.fresh import FreshAccount
 
 
 class GatewayHTTPTaskSet(TaskSet):
@@ -34,11 +47,14 @@ class GatewayHTTPTaskSet(TaskSet):
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        # Один пул соединений на все доменные клиенты (см. GATEWAY_HTTP_CLIENT.POOL_SCOPE)
+        client = build_gateway_locust_shared_http_client(self.user.environment)
+
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, client)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment, client)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, client)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment, client)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment, client)
 
 
 class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
@@ -59,8 +75,42 @@ class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
         """
         Создание API клиентов для последовательного сценария.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        # Один пул соединений на все доменные клиенты (см. GATEWAY_HTTP_CLIENT.POOL_SCOPE)
+        client = build_gateway_locust_shared_http_client(self.user.environment)
+
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, client)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment, client)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, client)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment, client)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment, client)
+
+
+def build_fresh_account_gateway_http_producer(
+        open_account: str,
+        environment: Environment | None
+) -> Callable[[], FreshAccount]:
+    """
+    Строит функцию создания свежего пользователя со счётом для пула FreshUsersPool.
+    Вызывается каждым производителем пула при запуске, поэтому у производителей свои клиенты.
+
+    :param open_account: Имя метода AccountsGatewayHTTPClient, открывающего счёт (например, "open_debit_card_account").
+    :param environment: Окружение Locust — запросы попадают в статистику Locust;
+        None — запросы выполняются обычными клиентами и не измеряются.
+    :return: Функция, которая создаёт пользователя, открывает ему счёт и возвращает оба ответа.
+    """
+    if environment is None:
+        users_gateway_client = build_users_gateway_http_client()
+        accounts_gateway_client = build_accounts_gateway_http_client()
+    else:
+        client = build_gateway_locust_shared_http_client(environment)
+        users_gateway_client = build_users_gateway_locust_http_client(environment, client)
+        accounts_gateway_client = build_accounts_gateway_locust_http_client(environment, client)
+
+    def produce() -> FreshAccount:
+        create_user_response = users_gateway_client.create_user()
+        open_account_response = getattr(accounts_gateway_client, open_account)(
+            user_id=create_user_response.user.id
+        )
+        return FreshAccount(create_user_response=create_user_response, open_account_response=open_account_response)
+
+    return produce
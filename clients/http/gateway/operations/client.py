@@ -1,10 +1,13 @@
-from httpx import Response, QueryParams
+from httpx import Client, Response, QueryParams
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.payloads import HTTPPayload
 from clients.http.gateway.client import (
     build_gateway_http_client,
     build_gateway_locust_http_client,
+    build_gateway_locust_http_parser,
+    get_gateway_locust_http_payloads
 )
 
 from clients.http.gateway.operations.schema import (
@@ -32,6 +35,18 @@ from clients.http.gateway.operations.schema import (
 from tools.routes import APIRoutes
 
 
+# Схемы запросов создания операций: тела запросов генерируются заранее, в запросе подставляются только ID
+MAKE_OPERATION_REQUEST_SCHEMAS = (
+    MakeFeeOperationRequestSchema,
+    MakeTopUpOperationRequestSchema,
+    MakeCashbackOperationRequestSchema,
+    MakeTransferOperationRequestSchema,
+    MakePurchaseOperationRequestSchema,
+    MakeBillPaymentOperationRequestSchema,
+    MakeCashWithdrawalOperationRequestSchema
+)
+
+
 class OperationsGatewayHTTPClient(HTTPClient):
     """
     Клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
@@ -71,46 +86,46 @@ class OperationsGatewayHTTPClient(HTTPClient):
     # OPERATIONS API
     # -------------------------
 
-    def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema) -> Response:
-        return self.post(
+    def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema | HTTPPayload) -> Response:
+        return self.post_request(
             f"{APIRoutes.OPERATIONS}/make-fee-operation",
-            json=request.model_dump(by_alias=True)
+            request
         )
 
-    def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
-        return self.post(
+    def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema | HTTPPayload) -> Response:
+        return self.post_request(
             f"{APIRoutes.OPERATIONS}/make-top-up-operation",
-            json=request.model_dump(by_alias=True)
+            request
         )
 
-    def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
-        return self.post(
+    def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema | HTTPPayload) -> Response:
+        return self.post_request(
             f"{APIRoutes.OPERATIONS}/make-cashback-operation",
-            json=request.model_dump(by_alias=True)
+            request
         )
 
-    def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
-        return self.post(
+    def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema | HTTPPayload) -> Response:
+        return self.post_request(
             f"{APIRoutes.OPERATIONS}/make-transfer-operation",
-            json=request.model_dump(by_alias=True)
+            request
         )
 
-    def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
-        return self.post(
+    def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema | HTTPPayload) -> Response:
+        return self.post_request(
             f"{APIRoutes.OPERATIONS}/make-purchase-operation",
-            json=request.model_dump(by_alias=True)
+            request
         )
 
-    def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
-        return self.post(
+    def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema | HTTPPayload) -> Response:
+        return self.post_request(
             f"{APIRoutes.OPERATIONS}/make-bill-payment-operation",
-            json=request.model_dump(by_alias=True)
+            request
         )
 
-    def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
-        return self.post(
+    def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema | HTTPPayload) -> Response:
+        return self.post_request(
             f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation",
-            json=request.model_dump(by_alias=True)
+            request
         )
 
     # -------------------------
@@ -119,63 +134,72 @@ class OperationsGatewayHTTPClient(HTTPClient):
 
     def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
         response = self.get_operation_api(operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(response, GetOperationResponseSchema)
 
     def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
         response = self.get_operation_receipt_api(operation_id)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        return self.parse(response, GetOperationReceiptResponseSchema)
 
     def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
         query = GetOperationsQuerySchema(account_id=account_id)
         response = self.get_operations_api(query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.parse(response, GetOperationsResponseSchema)
 
     def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
         query = GetOperationsSummaryQuerySchema(account_id=account_id)
         response = self.get_operations_summary_api(query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        return self.parse(response, GetOperationsSummaryResponseSchema)
 
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
-        request = MakeFeeOperationRequestSchema(card_id=card_id, account_id=account_id)
+        request = self.payloads.build(MakeFeeOperationRequestSchema, card_id=card_id, account_id=account_id)
         response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(response, MakeFeeOperationResponseSchema)
 
     def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
-        request = MakeTopUpOperationRequestSchema(card_id=card_id, account_id=account_id)
+        request = self.payloads.build(MakeTopUpOperationRequestSchema, card_id=card_id, account_id=account_id)
         response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(response, MakeTopUpOperationResponseSchema)
 
     def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
-        request = MakeCashbackOperationRequestSchema(card_id=card_id, account_id=account_id)
+        request = self.payloads.build(MakeCashbackOperationRequestSchema, card_id=card_id, account_id=account_id)
         response = self.make_cashback_operation_api(request)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(response, MakeCashbackOperationResponseSchema)
 
     def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
-        request = MakeTransferOperationRequestSchema(card_id=card_id, account_id=account_id)
+        request = self.payloads.build(MakeTransferOperationRequestSchema, card_id=card_id, account_id=account_id)
         response = self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(response, MakeTransferOperationResponseSchema)
 
     def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
-        request = MakePurchaseOperationRequestSchema(card_id=card_id, account_id=account_id)
+        request = self.payloads.build(MakePurchaseOperationRequestSchema, card_id=card_id, account_id=account_id)
         response = self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(response, MakePurchaseOperationResponseSchema)
 
     def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
-        request = MakeBillPaymentOperationRequestSchema(card_id=card_id, account_id=account_id)
+        request = self.payloads.build(MakeBillPaymentOperationRequestSchema, card_id=card_id, account_id=account_id)
         response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(response, MakeBillPaymentOperationResponseSchema)
 
     def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
-        request = MakeCashWithdrawalOperationRequestSchema(card_id=card_id, account_id=account_id)
+        request = self.payloads.build(MakeCashWithdrawalOperationRequestSchema, card_id=card_id, account_id=account_id)
         response = self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return self.parse(response, MakeCashWithdrawalOperationResponseSchema)
 
 
 def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
     return OperationsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_operations_gateway_locust_http_client(environment: Environment) -> OperationsGatewayHTTPClient:
+def build_operations_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> OperationsGatewayHTTPClient:
+    payloads = get_gateway_locust_http_payloads()
+    for schema in MAKE_OPERATION_REQUEST_SCHEMAS:
+        payloads.prepare(schema, "card_id", "account_id")
+
     return OperationsGatewayHTTPClient(
-        client=build_gateway_locust_http_client(environment)
+        client=client or build_gateway_locust_http_client(environment),
+        parser=build_gateway_locust_http_parser(),
+        payloads=payloads
     )
@@ -1,16 +1,20 @@
-from httpx import Response
+from httpx import Client, Response
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.payloads import HTTPPayload
 from clients.http.gateway.client import (
     build_gateway_http_client,
-    build_gateway_locust_http_client
+    build_gateway_locust_http_client,
+    build_gateway_locust_http_parser,
+    get_gateway_locust_http_payloads
 )
 from clients.http.gateway.users.schema import (
     GetUserResponseSchema,
     CreateUserRequestSchema,
     CreateUserResponseSchema
 )
+from tools.fakers import fake
 from tools.routes import APIRoutes  # Импортируем enum APIRoutes
 
 
@@ -32,27 +36,28 @@ class UsersGatewayHTTPClient(HTTPClient):
             extensions=HTTPClientExtensions(route=f"{APIRoutes.USERS}/{{user_id}}")
         )
 
-    def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+    def create_user_api(self, request: CreateUserRequestSchema | HTTPPayload) -> Response:
         """
         Создание нового пользователя.
 
-        :param request: Pydantic-модель с данными нового пользователя.
+        :param request: Pydantic-модель с данными нового пользователя или готовое тело запроса из пула.
         :return: Ответ от сервера (объект httpx.Response).
         """
         # Вместо /api/v1/users используем APIRoutes.USERS
-        return self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
+        return self.post_request(APIRoutes.USERS, request)
 
     def get_user(self, user_id: str) -> GetUserResponseSchema:
         response = self.get_user_api(user_id)
         # Инициализируем модель через валидацию JSON строки
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return self.parse(response, GetUserResponseSchema)
 
     # Теперь используем pydantic-модель для аннотации
     def create_user(self) -> CreateUserResponseSchema:
-        # Генерация данных теперь происходит внутри схемы запроса
-        request = CreateUserRequestSchema()
+        # Генерация данных происходит внутри схемы запроса или заранее, в пуле тел запросов.
+        # Email передаётся явно: он должен быть уникальным в каждом запросе (UUID, без Faker)
+        request = self.payloads.build(CreateUserRequestSchema, email=fake.unique_email())
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return self.parse(response, CreateUserResponseSchema)
 
 
 def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
@@ -65,7 +70,10 @@ def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
 
 
 # Новый билдер для нагрузочного тестирования
-def build_users_gateway_locust_http_client(environment: Environment) -> UsersGatewayHTTPClient:
+def build_users_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient адаптированного под Locust.
 
@@ -73,6 +81,15 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий httpx.Client, пул соединений которого нужно переиспользовать
+        (по умолчанию создаётся свой клиент).
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    payloads = get_gateway_locust_http_payloads()
+    payloads.prepare(CreateUserRequestSchema, "email")
+
+    return UsersGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        parser=build_gateway_locust_http_parser(),
+        payloads=payloads
+    )
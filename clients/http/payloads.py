@@ -0,0 +1,135 @@
+import json
+import random
+import re
+from typing import NamedTuple, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class HTTPPayload(NamedTuple):
+    """
+    Готовое JSON-тело запроса.
+
+    Attributes:
+        content: Сериализованное тело запроса
+    """
+    content: bytes
+
+
+class HTTPPayloadTemplate:
+    """
+    Сериализованный запрос с местами для подстановки значений полей.
+
+    Тело запроса один раз сериализуется в JSON с плейсхолдерами вместо значений полей
+    и разбивается на части: подстановка значений — это склейка байтов без pydantic и Faker.
+    """
+    __slots__ = ("parts", "fields")
+
+    def __init__(self, request: BaseModel, fields: tuple[str, ...]):
+        """
+        :param request: Запрос, в котором значения полей fields заменены плейсхолдерами (см. get_placeholder).
+        :param fields: Поля, значения которых подставляются при каждом запросе.
+        """
+        content = request.model_dump_json(by_alias=True).encode()
+        tokens = {json.dumps(get_placeholder(field)).encode(): field for field in fields}
+
+        pattern = re.compile(b"|".join(re.escape(token) for token in tokens)) if tokens else None
+        chunks = pattern.split(content) if pattern else [content]
+
+        self.parts = tuple(chunks)
+        self.fields = tuple(tokens[token] for token in pattern.findall(content)) if pattern else ()
+
+    def render(self, values: dict[str, str]) -> HTTPPayload:
+        """
+        Подставляет значения полей в шаблон.
+
+        :param values: Значения полей (строки, экранируются как строки JSON).
+        :return: Готовое тело запроса.
+        """
+        chunks = [self.parts[0]]
+        for field, part in zip(self.fields, self.parts[1:]):
+            chunks.append(json.dumps(values[field]).encode())
+            chunks.append(part)
+
+        return HTTPPayload(content=b"".join(chunks))
+
+
+class HTTPPayloadPool:
+    """
+    Пул заранее сгенерированных тел запросов одного типа.
+
+    При создании пул size раз строит схему запроса (значения по умолчанию генерирует Faker)
+    и сериализует её в шаблон. Каждый запрос берёт случайный шаблон и подставляет в него ID,
+    поэтому данные запросов остаются разнообразными, а генерация не попадает в горячий путь.
+    """
+
+    def __init__(self, schema: type[BaseModel], fields: tuple[str, ...], size: int):
+        """
+        :param schema: Схема запроса.
+        :param fields: Поля, значения которых передаются при каждом запросе (ID и т.п.).
+        :param size: Сколько разных тел запросов сгенерировать.
+        """
+        placeholders = {field: get_placeholder(field) for field in fields}
+        # model_construct: плейсхолдеры не проходят валидацию полей (например, EmailStr),
+        # а значения остальных полей всё равно генерируются default_factory
+        self.templates = [
+            HTTPPayloadTemplate(schema.model_construct(**placeholders), fields)
+            for _ in range(size)
+        ]
+
+    def render(self, **values: str) -> HTTPPayload:
+        """
+        Возвращает тело запроса из случайного шаблона с подставленными значениями.
+
+        :param values: Значения полей.
+        :return: Готовое тело запроса.
+        """
+        return self.templates[random.randrange(len(self.templates))].render(values)
+
+
+class HTTPPayloads:
+    """
+    Пулы тел запросов по схемам, общие для всех клиентов процесса.
+
+    При size=0 пулы выключены: build создаёт схему запроса, как раньше.
+    """
+
+    def __init__(self, size: int = 0):
+        """
+        :param size: Сколько разных тел запросов каждого типа генерировать (0 — пулы выключены).
+        """
+        self.size = size
+        self.pools: dict[type[BaseModel], HTTPPayloadPool] = {}
+
+    def prepare(self, schema: type[BaseModel], *fields: str) -> None:
+        """
+        Заранее генерирует пул тел запросов схемы.
+
+        :param schema: Схема запроса.
+        :param fields: Поля, значения которых передаются при каждом запросе.
+        """
+        if self.size and schema not in self.pools:
+            self.pools[schema] = HTTPPayloadPool(schema=schema, fields=fields, size=self.size)
+
+    def build(self, schema: type[T], **values: str) -> T | HTTPPayload:
+        """
+        Возвращает тело запроса из пула или, если пул выключен, новую схему запроса.
+
+        :param schema: Схема запроса.
+        :param values: Значения полей запроса.
+        :return: Готовое тело запроса (HTTPPayload) или схема запроса.
+        """
+        pool = self.pools.get(schema)
+        if pool is None:
+            return schema(**values)
+
+        return pool.render(**values)
+
+
+def get_placeholder(field: str) -> str:
+    """
+    Возвращает плейсхолдер значения поля в шаблоне запроса.
+    """
+    return f"{{{{{field}}}}}"
@@ -0,0 +1,89 @@
+import socket
+
+from gevent import Timeout
+from geventhttpclient import HTTPClient as GeventHTTPClient
+from httpx import BaseTransport, ByteStream, Request, Response, NetworkError, TimeoutException
+
+
+class GeventHTTPTransport(BaseTransport):
+    """
+    Транспорт httpx на базе geventhttpclient — того же gevent-нативного HTTP-клиента,
+    что использует FastHttpUser в Locust.
+
+    httpx.Client по-прежнему собирает запрос, вызывает event_hooks и передаёт extensions
+    (в том числе route), а сетевой обмен и разбор ответа выполняются на C-парсере
+    geventhttpclient вместо чистого Python httpcore. Поэтому HTTPClient и доменные клиенты
+    работают без изменений, а генератор нагрузки тратит на запрос заметно меньше CPU.
+
+    Для каждого хоста держится свой пул из max_connections соединений.
+    Сетевые ошибки и таймауты превращаются в исключения httpx (NetworkError, TimeoutException),
+    чтобы их обработка не зависела от транспорта.
+    """
+
+    def __init__(self, timeout: float, max_connections: int | None = None):
+        """
+        :param timeout: Таймаут подключения и чтения ответа (в секундах).
+        :param max_connections: Размер пула соединений к одному хосту (None — 100, как в httpx).
+        """
+        self.timeout = timeout
+        self.max_connections = max_connections or 100
+        self.clients: dict[tuple[str, str, int | None], GeventHTTPClient] = {}
+
+    def get_client(self, request: Request) -> GeventHTTPClient:
+        """
+        Возвращает клиента (пул соединений) для хоста запроса, создавая его при первом обращении.
+        """
+        url = request.url
+        key = (url.scheme, url.host, url.port)
+
+        client = self.clients.get(key)
+        if client is None:
+            client = self.clients[key] = GeventHTTPClient(
+                host=url.host,
+                port=url.port,
+                ssl=url.scheme == "https",
+                concurrency=self.max_connections,
+                connection_timeout=self.timeout,
+                network_timeout=self.timeout
+            )
+
+        return client
+
+    def handle_request(self, request: Request) -> Response:
+        """
+        Выполняет запрос через geventhttpclient и возвращает ответ httpx.
+
+        Тело ответа читается целиком; Content-Encoding (gzip и т.д.) раскодирует httpx.
+        """
+        client = self.get_client(request)
+
+        try:
+            response = client.request(
+                method=request.method,
+                request_uri=request.url.raw_path.decode("ascii"),
+                body=request.read(),
+                headers=dict(request.headers)
+            )
+            try:
+                content = response.read()
+            finally:
+                response.release()
+        except (socket.timeout, Timeout) as error:
+            raise TimeoutException(str(error) or "Timed out", request=request) from error
+        except OSError as error:
+            raise NetworkError(str(error), request=request) from error
+
+        return Response(
+            status_code=response.status_code,
+            headers=list(response.items()),
+            stream=ByteStream(content),
+            extensions={"http_version": b"HTTP/1.1"}
+        )
+
+    def close(self) -> None:
+        """
+        Закрывает все пулы соединений.
+        """
+        for client in self.clients.values():
+            client.close()
+        self.clients.clear()
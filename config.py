@@ -1,9 +1,11 @@
 import locust.stats  # Модуль Locust, отвечающий за сбор и хранение статистики
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from tools.config.grpc import GRPCClientConfig
 from tools.config.http import HTTPClientConfig
 from tools.config.locust import LocustUserConfig
+from tools.config.seeds import SeedsConfig
 
 # Настройка списка процентилей, которые будут попадать в отчёты Locust
 locust.stats.PERCENTILES_TO_REPORT = [0.50, 0.60, 0.70, 0.80, 0.90, 0.95, 0.99, 1.0]
@@ -33,6 +35,13 @@ class Settings(BaseSettings):
     locust_user: LocustUserConfig  # Настройки виртуального пользователя
     gateway_http_client: HTTPClientConfig  # Настройки HTTP-клиента
     gateway_grpc_client: GRPCClientConfig  # Настройки gRPC-клиента
+    seeds: SeedsConfig = Field(default_factory=SeedsConfig)  # Настройки сидинга
+
+    # Адреса внутренних сервисов — нужны только для сидинга в обход gateway (SEEDS.CLIENT=services_grpc)
+    users_service_grpc_client: GRPCClientConfig | None = None
+    accounts_service_grpc_client: GRPCClientConfig | None = None
+    cards_service_grpc_client: GRPCClientConfig | None = None
+    operations_service_grpc_client: GRPCClientConfig | None = None
 
 
 # Глобальный объект настроек — его можно импортировать в любом месте проекта
@@ -2,38 +2,45 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.index import SeedsIndex
+from seeds.pool import SeedUserLease
+from seeds.records import SeedUser
 from seeds.scenarios.existing_user_make_purchase_operation import ExistingUserMakePurchaseOperationSeedsScenario
-from seeds.schema.result import SeedUserResult
+from tools.locust.seeds import init_seeds_pool
 from tools.locust.user import LocustBaseUser
 
 
 # Хук инициализации — вызывается перед началом запуска нагрузки
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    # Выполняем сидинг
-    seeds_scenario = ExistingUserMakePurchaseOperationSeedsScenario()
-    seeds_scenario.build()  # создаём пользователей, счета, карты и операции
-
-    # Загружаем результат сидинга (из файла JSON)
-    environment.seeds = seeds_scenario.load()
+    # Выполняем сидинг и выдаём данные виртуальным пользователям через пул аренды
+    init_seeds_pool(environment=environment, seeds_scenario=ExistingUserMakePurchaseOperationSeedsScenario())
 
 
 # TaskSet — сценарий пользователя. Каждый виртуальный пользователь выполняет эти задачи
 class MakePurchaseOperationTaskSet(GatewayGRPCTaskSet):
-    seed_user: SeedUserResult  # Типизированная ссылка на данные из сидинга
+    seed_user: SeedUser  # Типизированная ссылка на данные из сидинга
+    seed_user_lease: SeedUserLease
+    seeds_index: SeedsIndex  # Предрассчитанные индексы для выбора счетов, карт и операций
 
     def on_start(self) -> None:
         super().on_start()
-        # Получаем случайного пользователя из подготовленного списка
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        # Арендуем пользователя сидинга: пока он у нас, другим виртуальным пользователям он не выдаётся
+        self.seed_user_lease = self.user.environment.seeds.checkout()
+        self.seed_user = self.seed_user_lease.user
+        self.seeds_index = self.user.environment.seeds.index
+
+    def on_stop(self) -> None:
+        # Возвращаем пользователя сидинга в пул
+        self.user.environment.seeds.checkin(self.seed_user_lease)
 
     @task(1)
     def make_purchase_operation(self):
-        # Совершаем покупку по первой карте пользователя
-        self.operations_gateway_client.make_purchase_operation(
-            card_id=self.seed_user.credit_card_accounts[0].physical_cards[0].card_id,
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+        # Совершаем покупку по случайной физической карте кредитного счёта пользователя
+        card = self.seeds_index.cards["credit_card_accounts", "physical_cards"].get_random_record(
+            self.seed_user_lease.index
         )
+        self.operations_gateway_client.make_purchase_operation(card_id=card.card_id, account_id=card.account_id)
 
     @task(2)
     def get_accounts(self):
@@ -43,16 +50,14 @@ class MakePurchaseOperationTaskSet(GatewayGRPCTaskSet):
     @task(2)
     def get_operations(self):
         # Получаем список операций по счёту
-        self.operations_gateway_client.get_operations(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
-        )
+        account = self.seeds_index.accounts["credit_card_accounts"].get_random_record(self.seed_user_lease.index)
+        self.operations_gateway_client.get_operations(account_id=account.account_id)
 
     @task(2)
     def get_operations_summary(self):
         # Получаем статистику по операциям пользователя
-        self.operations_gateway_client.get_operations_summary(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
-        )
+        account = self.seeds_index.accounts["credit_card_accounts"].get_random_record(self.seed_user_lease.index)
+        self.operations_gateway_client.get_operations_summary(account_id=account.account_id)
 
 
 # Пользовательский класс, который будет запускать наш TaskSet
@@ -1,11 +1,23 @@
-from locust import task
+from locust import task, events
+from locust.env import Environment
 
-from clients.grpc.gateway.locust import GatewayGRPCSequentialTaskSet
+from clients.grpc.gateway.locust import GatewayGRPCSequentialTaskSet, build_fresh_account_gateway_grpc_producer
 from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import OpenSavingsAccountResponse
 from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserResponse
+from tools.locust.fresh import init_fresh_users_pool
 from tools.locust.user import LocustBaseUser
 
 
+# Хук инициализации теста: готовим пул свежих пользователей со счётом.
+# При SEEDS.FRESH_POOL_SIZE > 0 пользователи создаются фоновыми производителями вне измеряемого пути.
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    init_fresh_users_pool(
+        environment=environment,
+        build_produce=lambda env: build_fresh_account_gateway_grpc_producer("open_savings_account", env)
+    )
+
+
 class GetDocumentsSequentialTaskSet(GatewayGRPCSequentialTaskSet):
     """
     Нагрузочный сценарий, который последовательно:
@@ -23,16 +35,24 @@ class GetDocumentsSequentialTaskSet(GatewayGRPCSequentialTaskSet):
     def create_user(self):
         """
         Создаём нового пользователя и сохраняем результат для последующих шагов.
+        При SEEDS.FRESH_POOL_SIZE > 0 берём из пула готового пользователя с уже открытым сберегательным счётом.
         """
+        fresh_users = self.user.environment.fresh_users
+        if fresh_users is not None:
+            fresh_account = fresh_users.get()
+            self.create_user_response = fresh_account.create_user_response
+            self.open_savings_account_response = fresh_account.open_account_response
+            return
+
         self.create_user_response = self.users_gateway_client.create_user()
 
     @task
     def open_savings_account(self):
         """
         Открываем сберегательный счёт для созданного пользователя.
-        Проверяем, что предыдущий шаг был успешным.
+        Проверяем, что предыдущий шаг был успешным (пользователю из пула счёт уже открыт).
         """
-        if not self.create_user_response:
+        if not self.create_user_response or self.user.environment.fresh_users is not None:
             return
 
         self.open_savings_account_response = self.accounts_gateway_client.open_savings_account(
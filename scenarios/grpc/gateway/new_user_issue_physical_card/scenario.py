@@ -1,14 +1,26 @@
-from locust import task
+from locust import task, events
+from locust.env import Environment
 
-from clients.grpc.gateway.locust import GatewayGRPCSequentialTaskSet
+from clients.grpc.gateway.locust import GatewayGRPCSequentialTaskSet, build_fresh_account_gateway_grpc_producer
 
 from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserResponse
 from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import OpenDebitCardAccountResponse
 from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import IssuePhysicalCardResponse
 
+from tools.locust.fresh import init_fresh_users_pool
 from tools.locust.user import LocustBaseUser
 
 
+# Хук инициализации теста: готовим пул свежих пользователей со счётом.
+# При SEEDS.FRESH_POOL_SIZE > 0 пользователи создаются фоновыми производителями вне измеряемого пути.
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    init_fresh_users_pool(
+        environment=environment,
+        build_produce=lambda env: build_fresh_account_gateway_grpc_producer("open_debit_card_account", env)
+    )
+
+
 class IssuePhysicalCardSequentialTaskSet(GatewayGRPCSequentialTaskSet):
     # Здесь будем хранить результаты каждого шага
     create_user_response: CreateUserResponse | None = None
@@ -17,13 +29,21 @@ class IssuePhysicalCardSequentialTaskSet(GatewayGRPCSequentialTaskSet):
 
     @task
     def create_user(self):
+        # При SEEDS.FRESH_POOL_SIZE > 0 берём из пула свежего пользователя с уже открытым счётом
+        fresh_users = self.user.environment.fresh_users
+        if fresh_users is not None:
+            fresh_account = fresh_users.get()
+            self.create_user_response = fresh_account.create_user_response
+            self.open_debit_card_account_response = fresh_account.open_account_response
+            return
+
         # Создаём нового пользователя
         self.create_user_response = self.users_gateway_client.create_user()
 
     @task
     def open_debit_card_account(self):
-        # Счёт можно открыть только после создания пользователя
-        if not self.create_user_response:
+        # Счёт можно открыть только после создания пользователя; пользователю из пула счёт уже открыт
+        if not self.create_user_response or self.user.environment.fresh_users is not None:
             return
 
         self.open_debit_card_account_response = (
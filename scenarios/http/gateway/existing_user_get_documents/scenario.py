@@ -2,8 +2,11 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.index import SeedsIndex
+from seeds.pool import SeedUserLease
+from seeds.records import SeedUser
 from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
-from seeds.schema.result import SeedUserResult
+from tools.locust.seeds import init_seeds_pool
 from tools.locust.user import LocustBaseUser
 
 
@@ -11,46 +14,49 @@ from tools.locust.user import LocustBaseUser
 # Мы используем его, чтобы заранее прогнать сидинг и загрузить пользователей в память.
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    # Создаем экземпляр сидинг-сценария
-    seeds_scenario = ExistingUserGetDocumentsSeedsScenario()
-
-    # Выполняем генерацию данных, если они ещё не созданы
-    seeds_scenario.build()
-
-    # Загружаем сгенерированных пользователей в окружение Locust
-    environment.seeds = seeds_scenario.load()
+    # Выполняем сидинг и выдаём данные виртуальным пользователям через пул аренды
+    init_seeds_pool(environment=environment, seeds_scenario=ExistingUserGetDocumentsSeedsScenario())
 
 
 # Набор задач (TaskSet), который будет выполняться виртуальными пользователями.
 class GetDocumentsTaskSet(GatewayHTTPTaskSet):
     # Типизируем объект пользователя из сидинга
-    seed_user: SeedUserResult
+    seed_user: SeedUser
+    seed_user_lease: SeedUserLease
+    seeds_index: SeedsIndex  # Предрассчитанные индексы для выбора счетов, карт и операций
 
     # Метод вызывается при запуске каждой сессии пользователя (до начала задач)
     def on_start(self) -> None:
         super().on_start()
 
-        # Получаем следующего пользователя из списка (по порядку!)
-        self.seed_user = self.user.environment.seeds.get_next_user()
+        # Арендуем пользователя сидинга: пока он у нас, другим виртуальным пользователям он не выдаётся
+        self.seed_user_lease = self.user.environment.seeds.checkout()
+        self.seed_user = self.seed_user_lease.user
+        self.seeds_index = self.user.environment.seeds.index
+
+    def on_stop(self) -> None:
+        # Возвращаем пользователя сидинга в пул
+        self.user.environment.seeds.checkin(self.seed_user_lease)
 
     @task(1)
     def get_accounts(self):
         # Запрашиваем список счетов
-        self.accounts_gateway_client.get_accounts(user_id=self.seed_user.user_id)
+        lease = self.user.environment.seeds.access(self.seed_user_lease)
+        self.accounts_gateway_client.get_accounts(user_id=lease.user.user_id)
 
     @task(2)
     def get_tariff_document(self):
         # Загружаем тарифный документ по сберегательному счёту
-        self.documents_gateway_client.get_tariff_document(
-            account_id=self.seed_user.savings_accounts[0].account_id
-        )
+        lease = self.user.environment.seeds.access(self.seed_user_lease)
+        account = self.seeds_index.accounts["savings_accounts"].get_random_record(lease.index)
+        self.documents_gateway_client.get_tariff_document(account_id=account.account_id)
 
     @task(2)
     def get_contract_document(self):
         # Загружаем договор по дебетовой карте
-        self.documents_gateway_client.get_contract_document(
-            account_id=self.seed_user.debit_card_accounts[0].account_id
-        )
+        lease = self.user.environment.seeds.access(self.seed_user_lease)
+        account = self.seeds_index.accounts["debit_card_accounts"].get_random_record(lease.index)
+        self.documents_gateway_client.get_contract_document(account_id=account.account_id)
 
 
 # Конкретный пользовательский класс, у которого в качестве задач используется GetDocumentsTaskSet
@@ -2,50 +2,54 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.index import SeedsIndex
+from seeds.pool import SeedUserLease
+from seeds.records import SeedUser
 from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
-from seeds.schema.result import SeedUserResult
+from tools.locust.seeds import init_seeds_pool
 from tools.locust.user import LocustBaseUser
 
 
 # Хук инициализации — вызывается перед началом запуска нагрузки
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    # Сценарий с HTTP сидингом (теперь внутри него создаётся builder через build_http_seeds_builder)
-    seeds_scenario = ExistingUserGetOperationsSeedsScenario()
-
-    # Генерируем данные
-    seeds_scenario.build()
-
-    # Загружаем сидинг в память Locust
-    environment.seeds = seeds_scenario.load()
+    # Выполняем сидинг и выдаём данные виртуальным пользователям через пул аренды
+    init_seeds_pool(environment=environment, seeds_scenario=ExistingUserGetOperationsSeedsScenario())
 
 
 # TaskSet — сценарий поведения существующего пользователя
 class GetOperationsTaskSet(GatewayHTTPTaskSet):
-    seed_user: SeedUserResult
+    seed_user: SeedUser
+    seed_user_lease: SeedUserLease
+    seeds_index: SeedsIndex  # Предрассчитанные индексы для выбора счетов, карт и операций
 
     def on_start(self) -> None:
         super().on_start()
-        # Берем случайного подготовленного пользователя
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        # Арендуем пользователя сидинга: пока он у нас, другим виртуальным пользователям он не выдаётся
+        self.seed_user_lease = self.user.environment.seeds.checkout()
+        self.seed_user = self.seed_user_lease.user
+        self.seeds_index = self.user.environment.seeds.index
+
+    def on_stop(self) -> None:
+        # Возвращаем пользователя сидинга в пул
+        self.user.environment.seeds.checkin(self.seed_user_lease)
 
     @task(3)
     def get_accounts(self):
-        self.accounts_gateway_client.get_accounts(
-            user_id=self.seed_user.user_id
-        )
+        lease = self.user.environment.seeds.access(self.seed_user_lease)
+        self.accounts_gateway_client.get_accounts(user_id=lease.user.user_id)
 
     @task(5)
     def get_operations(self):
-        self.operations_gateway_client.get_operations(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
-        )
+        lease = self.user.environment.seeds.access(self.seed_user_lease)
+        account = self.seeds_index.accounts["credit_card_accounts"].get_random_record(lease.index)
+        self.operations_gateway_client.get_operations(account_id=account.account_id)
 
     @task(2)
     def get_operations_summary(self):
-        self.operations_gateway_client.get_operations_summary(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
-        )
+        lease = self.user.environment.seeds.access(self.seed_user_lease)
+        account = self.seeds_index.accounts["credit_card_accounts"].get_random_record(lease.index)
+        self.operations_gateway_client.get_operations_summary(account_id=account.account_id)
 
 
 # Виртуальный пользователь
@@ -2,32 +2,38 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.index import SeedsIndex
+from seeds.pool import SeedUserLease
+from seeds.records import SeedUser
 from seeds.scenarios.existing_user_issue_virtual_card import ExistingUserIssueVirtualCardSeedsScenario
-from seeds.schema.result import SeedUserResult
+from tools.locust.seeds import init_seeds_pool
 from tools.locust.user import LocustBaseUser
 
 
 # --- Выполняем сидинг до старта нагрузки ---
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    seeds_scenario = ExistingUserIssueVirtualCardSeedsScenario()
-
-    # Генерация данных
-    seeds_scenario.build()
-
-    # Загружаем набор подготовленных пользователей
-    environment.seeds = seeds_scenario.load()
+    # Выполняем сидинг и выдаём данные виртуальным пользователям через пул аренды
+    init_seeds_pool(environment=environment, seeds_scenario=ExistingUserIssueVirtualCardSeedsScenario())
 
 
 # --- TaskSet сценария ---
 class IssueVirtualCardTaskSet(GatewayHTTPTaskSet):
-    seed_user: SeedUserResult
+    seed_user: SeedUser
+    seed_user_lease: SeedUserLease
+    seeds_index: SeedsIndex  # Предрассчитанные индексы для выбора счетов, карт и операций
 
     def on_start(self) -> None:
         super().on_start()
 
-        # Берём случайного пользователя
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        # Арендуем пользователя сидинга: пока он у нас, другим виртуальным пользователям он не выдаётся
+        self.seed_user_lease = self.user.environment.seeds.checkout()
+        self.seed_user = self.seed_user_lease.user
+        self.seeds_index = self.user.environment.seeds.index
+
+    def on_stop(self) -> None:
+        # Возвращаем пользователя сидинга в пул
+        self.user.environment.seeds.checkin(self.seed_user_lease)
 
     @task(5)
     def get_accounts(self):
@@ -39,10 +45,11 @@ class IssueVirtualCardTaskSet(GatewayHTTPTaskSet):
     @task(1)
     def issue_virtual_card(self):
         # Выпуск новой виртуальной карты для дебетового счёта пользователя
-        # Передаём обязательный user_id и account_id
+        # Передаём обязательный user_id и account_id (оба из одной записи индекса)
+        account = self.seeds_index.accounts["debit_card_accounts"].get_random_record(self.seed_user_lease.index)
         self.cards_gateway_client.issue_virtual_card(
-            user_id=self.seed_user.user_id,
-            account_id=self.seed_user.debit_card_accounts[0].account_id
+            user_id=account.user_id,
+            account_id=account.account_id
         )
 
 
@@ -1,12 +1,24 @@
-from locust import task
+from locust import task, events
+from locust.env import Environment
 
-from clients.http.gateway.locust import GatewayHTTPSequentialTaskSet
+from clients.http.gateway.locust import GatewayHTTPSequentialTaskSet, build_fresh_account_gateway_http_producer
 from clients.http.gateway.users.schema import CreateUserResponseSchema
 from clients.http.gateway.accounts.schema import OpenDebitCardAccountResponseSchema
 from clients.http.gateway.cards.schema import IssuePhysicalCardResponseSchema
+from tools.locust.fresh import init_fresh_users_pool
 from tools.locust.user import LocustBaseUser
 
 
+# Хук инициализации теста: готовим пул свежих пользователей со счётом.
+# При SEEDS.FRESH_POOL_SIZE > 0 пользователи создаются фоновыми производителями вне измеряемого пути.
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    init_fresh_users_pool(
+        environment=environment,
+        build_produce=lambda env: build_fresh_account_gateway_http_producer("open_debit_card_account", env)
+    )
+
+
 class IssuePhysicalCardSequentialTaskSet(GatewayHTTPSequentialTaskSet):
     """
     Последовательный сценарий выпуска физической дебетовой карты новым пользователем.
@@ -28,16 +40,24 @@ class IssuePhysicalCardSequentialTaskSet(GatewayHTTPSequentialTaskSet):
         """
         Шаг 1: Создание нового пользователя.
         Создаёт пользователя через UsersGatewayClient.
+        При SEEDS.FRESH_POOL_SIZE > 0 берёт из пула готового пользователя с уже открытым счётом.
         """
+        fresh_users = self.user.environment.fresh_users
+        if fresh_users is not None:
+            fresh_account = fresh_users.get()
+            self.create_user_response = fresh_account.create_user_response
+            self.open_debit_account_response = fresh_account.open_account_response
+            return
+
         self.create_user_response = self.users_gateway_client.create_user()
 
     @task
     def open_debit_account(self):
         """
         Шаг 2: Открытие дебетового счёта.
-        Для нового пользователя создаётся дебетовый счёт.
+        Для нового пользователя создаётся дебетовый счёт (пользователю из пула счёт уже открыт).
         """
-        if not self.create_user_response:
+        if not self.create_user_response or self.user.environment.fresh_users is not None:
             return
 
         self.open_debit_account_response = (
@@ -1,12 +1,28 @@
-from locust import task
+from locust import task, events
+from locust.env import Environment
 
 from clients.http.gateway.accounts.schema import OpenDebitCardAccountResponseSchema
-from clients.http.gateway.locust import GatewayHTTPSequentialTaskSet
+from clients.http.gateway.locust import GatewayHTTPSequentialTaskSet, build_fresh_account_gateway_http_producer
 from clients.http.gateway.operations.schema import MakeTopUpOperationResponseSchema
 from clients.http.gateway.users.schema import CreateUserResponseSchema
+from tools.locust.fresh import init_fresh_users_pool
+from tools.locust.live import init_live_entities
 from tools.locust.user import LocustBaseUser
 
 
+# Хук инициализации теста: готовим пул свежих пользователей со счётом.
+# При SEEDS.FRESH_POOL_SIZE > 0 пользователи создаются фоновыми производителями вне измеряемого пути.
+# Созданные счета и операции публикуются в общие буферы процесса (SEEDS.LIVE_POOL_SIZE),
+# из которых задачи чтения выбирают свежие сущности всех виртуальных пользователей.
+@events.init.add_listener
+def init(environment: Environment, **kwargs):
+    init_live_entities(environment)
+    init_fresh_users_pool(
+        environment=environment,
+        build_produce=lambda env: build_fresh_account_gateway_http_producer("open_debit_card_account", env)
+    )
+
+
 # Класс сценария: описывает последовательный флоу нового пользователя
 class MakeTopUpOperationSequentialTaskSet(GatewayHTTPSequentialTaskSet):
     # Храним ответы от предыдущих шагов, чтобы использовать их в следующих задачах
@@ -16,19 +32,29 @@ class MakeTopUpOperationSequentialTaskSet(GatewayHTTPSequentialTaskSet):
 
     @task
     def create_user(self):
+        # При SEEDS.FRESH_POOL_SIZE > 0 берём из пула свежего пользователя с уже открытым счётом
+        fresh_users = self.user.environment.fresh_users
+        if fresh_users is not None:
+            fresh_account = fresh_users.get()
+            self.create_user_response = fresh_account.create_user_response
+            self.open_open_debit_card_account_response = fresh_account.open_account_response
+            self.user.environment.live.accounts.publish(self.open_open_debit_card_account_response.account.id)
+            return
+
         # Первый шаг — создать нового пользователя
         self.create_user_response = self.users_gateway_client.create_user()
 
     @task
     def open_debit_card_account(self):
-        # Невозможно открыть счёт без созданного пользователя
-        if not self.create_user_response:
+        # Невозможно открыть счёт без созданного пользователя; пользователю из пула счёт уже открыт
+        if not self.create_user_response or self.user.environment.fresh_users is not None:
             return
 
         # Открываем дебетовый счёт для нового пользователя
         self.open_open_debit_card_account_response = self.accounts_gateway_client.open_debit_card_account(
             user_id=self.create_user_response.user.id
         )
+        self.user.environment.live.accounts.publish(self.open_open_debit_card_account_response.account.id)
 
     @task
     def make_top_up_operation(self):
@@ -41,35 +67,45 @@ class MakeTopUpOperationSequentialTaskSet(GatewayHTTPSequentialTaskSet):
             card_id=self.open_open_debit_card_account_response.account.cards[0].id,
             account_id=self.open_open_debit_card_account_response.account.id
         )
+        self.user.environment.live.operations.publish(self.make_top_up_operation_response.operation.id)
 
     @task
     def get_operations(self):
-        # Получаем список операций по счёту
+        # Получаем список операций по недавно открытому счёту (своему, если буфер выключен)
         if not self.open_open_debit_card_account_response:
             return
 
         self.operations_gateway_client.get_operations(
-            account_id=self.open_open_debit_card_account_response.account.id
+            account_id=(
+                self.user.environment.live.accounts.sample()
+                or self.open_open_debit_card_account_response.account.id
+            )
         )
 
     @task
     def get_operations_summary(self):
-        # Получаем агрегированную статистику по операциям
+        # Получаем агрегированную статистику по операциям недавно открытого счёта
         if not self.open_open_debit_card_account_response:
             return
 
         self.operations_gateway_client.get_operations_summary(
-            account_id=self.open_open_debit_card_account_response.account.id
+            account_id=(
+                self.user.environment.live.accounts.sample()
+                or self.open_open_debit_card_account_response.account.id
+            )
         )
 
     @task
     def get_operation(self):
-        # Получаем детальную информацию по операции пополнения
+        # Получаем детальную информацию по недавней операции пополнения (своей, если буфер выключен)
         if not self.make_top_up_operation_response:
             return
 
         self.operations_gateway_client.get_operation(
-            operation_id=self.make_top_up_operation_response.operation.id
+            operation_id=(
+                self.user.environment.live.operations.sample()
+                or self.make_top_up_operation_response.operation.id
+            )
         )
 
 
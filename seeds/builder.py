@@ -1,15 +1,35 @@
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from clients.errors import REQUEST_ERRORS
 from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
 from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
 from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
 from clients.grpc.gateway.users.client import build_users_gateway_grpc_client, UsersGatewayGRPCClient
+from clients.grpc.services.accounts.client import build_accounts_service_grpc_client, AccountsServiceGRPCClient
+from clients.grpc.services.cards.client import build_cards_service_grpc_client, CardsServiceGRPCClient
+from clients.grpc.services.operations.client import (
+    build_operations_service_grpc_client,
+    OperationsServiceGRPCClient
+)
+from clients.grpc.services.users.client import build_users_service_grpc_client, UsersServiceGRPCClient
 from clients.http.gateway.accounts.client import build_accounts_gateway_http_client, AccountsGatewayHTTPClient
 from clients.http.gateway.cards.client import build_cards_gateway_http_client, CardsGatewayHTTPClient
+from clients.http.gateway.cards.schema import CardStatus as HTTPCardStatus, CardType as HTTPCardType
 from clients.http.gateway.operations.client import build_operations_gateway_http_client, OperationsGatewayHTTPClient
 from clients.http.gateway.users.client import build_users_gateway_http_client, UsersGatewayHTTPClient
+from config import settings
+from contracts.services.accounts.account_pb2 import AccountType
+from contracts.services.cards.card_pb2 import CardStatus, CardType
+from contracts.services.operations.operation_pb2 import OperationType
+from seeds.graph import SeedsGraph, SeedTask
+from seeds.limiter import SeedsLimiter, build_seeds_limiter
 from seeds.schema.plan import (
     SeedsPlan,
     SeedUsersPlan,
+    SeedCardsPlan,
     SeedAccountsPlan,
+    SeedOperationsPlan,
 )
 from seeds.schema.result import (
     SeedsResult,
@@ -18,6 +38,7 @@ from seeds.schema.result import (
     SeedAccountResult,
     SeedOperationResult
 )
+from tools.config.seeds import SeedsClient
 
 
 class SeedsBuilder:
@@ -30,20 +51,51 @@ class SeedsBuilder:
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        concurrency: Максимальное количество одновременных запросов к системе.
+            При значении 1 все сущности создаются последовательно.
+        limiter: Ограничитель запросов к системе (фиксированный или адаптивный лимит, повторы)
     """
 
+    # Вызовы клиентов, которыми создаётся каждая сущность плана, в порядке выполнения.
+    # Имена совпадают с именами методов в телеметрии сидинга; по ним оценивается план (seeds/estimator.py)
+    ENTITY_CALLS: dict[str, tuple[str, ...]] = {
+        "users": ("create_user",),
+        "deposit_accounts": ("open_deposit_account",),
+        "savings_accounts": ("open_savings_account",),
+        "debit_card_accounts": ("open_debit_card_account",),
+        "credit_card_accounts": ("open_credit_card_account",),
+        "physical_cards": ("issue_physical_card",),
+        "virtual_cards": ("issue_virtual_card",),
+        "top_up_operations": ("make_top_up_operation",),
+        "purchase_operations": ("make_purchase_operation",),
+        "transfer_operations": ("make_transfer_operation",),
+        "cash_withdrawal_operations": ("make_cash_withdrawal_operation",),
+    }
+    # Вызовы, которыми запрашивается карта существующего счёта при дозаполнении (get_account_card_id)
+    ACCOUNT_CARD_CALLS: tuple[str, ...] = ("get_accounts",)
+    # Вызовы проверки пользователя из дампа (check_user)
+    CHECK_USER_CALLS: tuple[str, ...] = ("get_accounts",)
+
     def __init__(
             self,
             users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
             cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
             accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            concurrency: int = 1,
+            limiter: SeedsLimiter | None = None
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
 
+        self.concurrency = concurrency
+        # Ограничитель количества одновременных запросов (in-flight) к системе.
+        # Слот занимается только на время самого вызова, поэтому вложенные задачи
+        # (пользователь -> счёт -> карты/операции) не блокируют друг друга.
+        self.limiter = limiter or SeedsLimiter(concurrency=concurrency)
+
     def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
         """
         Выпускает виртуальную карту для заданного пользователя и счёта.
@@ -55,7 +107,8 @@ class SeedsBuilder:
         Returns:
             SeedCardResult: Результат с ID выпущенной карты
         """
-        response = self.cards_gateway_client.issue_virtual_card(
+        response = self.limiter.call(
+            self.cards_gateway_client.issue_virtual_card,
             user_id=user_id,
             account_id=account_id
         )
@@ -72,7 +125,8 @@ class SeedsBuilder:
         Returns:
             SeedCardResult: Результат с ID выпущенной карты
         """
-        response = self.cards_gateway_client.issue_physical_card(
+        response = self.limiter.call(
+            self.cards_gateway_client.issue_physical_card,
             user_id=user_id,
             account_id=account_id
         )
@@ -89,7 +143,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_top_up_operation(
+        response = self.limiter.call(
+            self.operations_gateway_client.make_top_up_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -106,7 +161,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_transfer_operation(
+        response = self.limiter.call(
+            self.operations_gateway_client.make_transfer_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -123,7 +179,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_purchase_operation(
+        response = self.limiter.call(
+            self.operations_gateway_client.make_purchase_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -140,7 +197,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_cash_withdrawal_operation(
+        response = self.limiter.call(
+            self.operations_gateway_client.make_cash_withdrawal_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -156,7 +214,7 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID созданного счёта
         """
-        response = self.accounts_gateway_client.open_savings_account(user_id=user_id)
+        response = self.limiter.call(self.accounts_gateway_client.open_savings_account, user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
     def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
@@ -169,139 +227,490 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID созданного счёта
         """
-        response = self.accounts_gateway_client.open_deposit_account(user_id=user_id)
+        response = self.limiter.call(self.accounts_gateway_client.open_deposit_account, user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
-    def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+    def open_debit_card_account(self, user_id: str) -> tuple[str, str]:
         """
-        Открывает дебетовый счёт для пользователя и при необходимости:
-        - выпускает виртуальные карты
-        - выпускает физические карты
-        - выполняет операции пополнения (top-up)
-        - выполняет операции переводов
-        - выполняет операции покупки
-        - выполняет операции снятия наличных
+        Открывает дебетовый счёт для пользователя.
 
         Args:
-            plan: План создания дебетового счёта (кол-во карт, операций и т.п.)
             user_id: Идентификатор пользователя
 
         Returns:
-            SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
-        """
-        response = self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ]
-        )
+            tuple[str, str]: ID счёта и ID карты, выпущенной вместе со счётом
+        """
+        response = self.limiter.call(self.accounts_gateway_client.open_debit_card_account, user_id=user_id)
+        return response.account.id, response.account.cards[0].id
 
-    def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+    def open_credit_card_account(self, user_id: str) -> tuple[str, str]:
         """
-        Открывает кредитный счёт и выполняет действия согласно плану:
-        - выпускает виртуальные карты
-        - выпускает физические карты
-        - выполняет операции пополнения (top-up)
-        - выполняет операции переводов
-        - выполняет операции покупки
-        - выполняет операции снятия наличных
+        Открывает кредитный счёт для пользователя.
 
         Args:
-            plan: План создания кредитного счёта
             user_id: Идентификатор пользователя
 
         Returns:
-            SeedAccountResult: Результат с ID счёта и деталями операций
-        """
-        response = self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ]
-        )
+            tuple[str, str]: ID счёта и ID карты, выпущенной вместе со счётом
+        """
+        response = self.limiter.call(self.accounts_gateway_client.open_credit_card_account, user_id=user_id)
+        return response.account.id, response.account.cards[0].id
+
+    def create_user(self) -> str:
+        """
+        Создаёт пользователя.
+
+        Returns:
+            str: ID созданного пользователя
+        """
+        response = self.limiter.call(self.users_gateway_client.create_user)
+        return response.user.id
 
-    def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
+    def build_user(self, plan: SeedUsersPlan, index: int = 0) -> SeedUserResult:
         """
         Создаёт пользователя и согласно переданному плану:
         - открывает сберегательные и депозитные счета
         - создаёт дебетовые и кредитные счета с картами и операциями
 
+        Сущности создаются через граф задач (см. compile_user), поэтому независимые
+        счета, карты и операции в конкурентном режиме создаются параллельно.
+
         Args:
             plan: План генерации пользователя
+            index: Номер пользователя в плане (для выбора количеств из распределений)
 
         Returns:
             SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
         """
-        response = self.users_gateway_client.create_user()
-
-        return SeedUserResult(
-            user_id=response.user.id,
-            savings_accounts=[
-                self.build_savings_account_result(user_id=response.user.id)
-                for _ in range(plan.savings_accounts.count)
-            ],
-            deposit_accounts=[
-                self.build_deposit_account_result(user_id=response.user.id)
-                for _ in range(plan.deposit_accounts.count)
-            ],
-            debit_card_accounts=[
-                self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.debit_card_accounts.count)
-            ],
-            credit_card_accounts=[
-                self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.credit_card_accounts.count)
+        graph = SeedsGraph(concurrency=self.concurrency)
+        return next(graph.imap(lambda _: self.compile_user(graph=graph, plan=plan, index=index), [index]))
+
+    def get_account_card_id(self, user_id: str, account_id: str) -> str:
+        """
+        Возвращает ID активной карты карточного счёта для операций.
+
+        Нужен при дозаполнении уже существующего счёта: в результате сидинга
+        хранится только ID счёта, а операции выполняются по карте.
+        Порядок карт в ответе не гарантирован, поэтому карта выбирается по статусу:
+        предпочтительно виртуальная, как карта, выпущенная вместе со счётом.
+
+        Args:
+            user_id: Идентификатор пользователя
+            account_id: Идентификатор счёта
+
+        Returns:
+            str: ID карты счёта
+
+        Raises:
+            ValueError: Если счёт не найден или у него нет активных карт
+        """
+        response = self.limiter.call(self.accounts_gateway_client.get_accounts, user_id=user_id)
+
+        account = next((account for account in response.accounts if account.id == account_id), None)
+        if account is None:
+            raise ValueError(f"Account {account_id} not found for user {user_id}")
+
+        # Статусы и типы карт приходят enum'ами gRPC-контрактов или HTTP-схем, в зависимости от клиента
+        cards = [
+            card for card in account.cards
+            if card.status in (CardStatus.CARD_STATUS_ACTIVE, HTTPCardStatus.ACTIVE)
+        ]
+        if not cards:
+            raise ValueError(f"Account {account_id} has no active cards")
+
+        return min(cards, key=lambda card: card.type not in (CardType.CARD_TYPE_VIRTUAL, HTTPCardType.VIRTUAL)).id
+
+    def compile_top_up_card_account(
+            self,
+            graph: SeedsGraph,
+            plan: SeedAccountsPlan,
+            user: SeedTask[str],
+            account: SeedAccountResult
+    ) -> SeedTask[SeedAccountResult]:
+        """
+        Добавляет в граф задачи дозаполнения существующего карточного счёта до плана:
+        выпуск недостающих карт и выполнение недостающих операций. Лишние сущности не удаляются.
+
+        Args:
+            graph: Граф задач сидинга
+            plan: Новый план по картам и операциям счёта
+            user: Задача с ID пользователя
+            account: Ранее созданный счёт
+
+        Returns:
+            SeedTask[SeedAccountResult]: Итоговая задача, собирающая счёт с ранее созданными и новыми сущностями
+        """
+        missing = SeedAccountsPlan(
+            virtual_cards=SeedCardsPlan(count=max(plan.virtual_cards.count - len(account.virtual_cards), 0)),
+            physical_cards=SeedCardsPlan(count=max(plan.physical_cards.count - len(account.physical_cards), 0)),
+            top_up_operations=SeedOperationsPlan(
+                count=max(plan.top_up_operations.count - len(account.top_up_operations), 0)
+            ),
+            transfer_operations=SeedOperationsPlan(
+                count=max(plan.transfer_operations.count - len(account.transfer_operations), 0)
+            ),
+            purchase_operations=SeedOperationsPlan(
+                count=max(plan.purchase_operations.count - len(account.purchase_operations), 0)
+            ),
+            cash_withdrawal_operations=SeedOperationsPlan(
+                count=max(plan.cash_withdrawal_operations.count - len(account.cash_withdrawal_operations), 0)
+            )
+        )
+
+        has_missing_operations = (
+                missing.top_up_operations.count
+                or missing.transfer_operations.count
+                or missing.purchase_operations.count
+                or missing.cash_withdrawal_operations.count
+        )
+
+        # Карта счёта нужна только для операций, поэтому запрашиваем её лишь при необходимости
+        if has_missing_operations:
+            opened = graph.add(
+                lambda user_id: (
+                    account.account_id,
+                    self.get_account_card_id(user_id=user_id, account_id=account.account_id)
+                ),
+                user
+            )
+        else:
+            opened = graph.add(lambda: (account.account_id, ""), inline=True)
+
+        return self.compile_card_account_result(graph, missing, user, opened, existing=account)
+
+    def compile_top_up_user(
+            self,
+            graph: SeedsGraph,
+            plan: SeedUsersPlan,
+            user: SeedUserResult,
+            index: int
+    ) -> SeedTask[SeedUserResult]:
+        """
+        Компилирует дозаполнение существующего пользователя до плана в граф задач:
+        - открывает недостающие счета каждого типа
+        - дозаполняет уже открытые карточные счета картами и операциями
+
+        Если пользователь уже соответствует плану, запросы к системе не выполняются.
+
+        Args:
+            graph: Граф задач сидинга
+            plan: Новый план генерации пользователя
+            user: Ранее созданный пользователь
+            index: Номер пользователя в плане (для выбора количеств из распределений)
+
+        Returns:
+            SeedTask[SeedUserResult]: Итоговая задача, собирающая пользователя с ранее созданными и новыми сущностями
+        """
+        user_task = graph.add(lambda: user.user_id, inline=True)
+
+        savings_accounts = [
+            graph.add(lambda user_id: self.build_savings_account_result(user_id=user_id), user_task)
+            for _ in range(plan.savings_accounts.count - len(user.savings_accounts))
+        ]
+        deposit_accounts = [
+            graph.add(lambda user_id: self.build_deposit_account_result(user_id=user_id), user_task)
+            for _ in range(plan.deposit_accounts.count - len(user.deposit_accounts))
+        ]
+
+        def card_accounts(name: str, open_account: Callable[[str], tuple[str, str]]) -> list[SeedTask]:
+            # Сначала дозаполняются существующие карточные счета, затем открываются новые,
+            # продолжая нумерацию существующих
+            existing: list[SeedAccountResult] = getattr(user, name)
+            topped_up = [
+                self.compile_top_up_card_account(
+                    graph,
+                    plan.get_account_plan(name, index, account_index),
+                    user_task,
+                    account
+                )
+                for account_index, account in enumerate(existing)
+            ]
+            opened = [
+                self.compile_card_account(
+                    graph,
+                    plan.get_account_plan(name, index, account_index),
+                    user_task,
+                    open_account
+                )
+                for account_index in range(len(existing), getattr(plan, name).count)
             ]
+            return topped_up + opened
+
+        debit_card_accounts = card_accounts("debit_card_accounts", self.open_debit_card_account)
+        credit_card_accounts = card_accounts("credit_card_accounts", self.open_credit_card_account)
+        accounts = (savings_accounts, deposit_accounts, debit_card_accounts, credit_card_accounts)
+
+        return graph.add(
+            lambda user_id, *_: SeedUserResult(
+                user_id=user_id,
+                savings_accounts=user.savings_accounts + [task.result for task in savings_accounts],
+                deposit_accounts=user.deposit_accounts + [task.result for task in deposit_accounts],
+                debit_card_accounts=[task.result for task in debit_card_accounts],
+                credit_card_accounts=[task.result for task in credit_card_accounts]
+            ),
+            user_task,
+            *(task for group in accounts for task in group),
+            inline=True
+        )
+
+    def top_up_users(self, plan: SeedUsersPlan, users: Iterable[SeedUserResult]) -> Iterator[SeedUserResult]:
+        """
+        Лениво дозаполняет ранее созданных пользователей до нового плана.
+
+        Существующие пользователи дозаполняются недостающими счетами, картами и операциями,
+        недостающие пользователи создаются с нуля. Если в новом плане пользователей меньше,
+        лишние пользователи отбрасываются. Стоимость дозаполнения пропорциональна разнице
+        между планами, а не их полному размеру.
+
+        Args:
+            plan: Новый план генерации пользователя
+            users: Ранее созданные пользователи (можно читать лениво из дампа)
+
+        Returns:
+            Iterator[SeedUserResult]: Пользователи, соответствующие новому плану
+        """
+        graph = SeedsGraph(concurrency=self.concurrency)
+
+        count = 0
+        for user in graph.imap(
+                lambda item: self.compile_top_up_user(graph=graph, plan=plan, user=item[1], index=item[0]),
+                enumerate(islice(users, plan.count))
+        ):
+            count += 1
+            yield user
+
+        yield from self.build_users(plan=plan, count=plan.count - count, start=count)
+
+    def top_up(self, plan: SeedsPlan, result: SeedsResult) -> SeedsResult:
+        """
+        Дозаполняет ранее построенный результат сидинга до нового плана (см. top_up_users).
+
+        Args:
+            plan: Новый план генерации данных
+            result: Ранее построенный результат сидинга
+
+        Returns:
+            SeedsResult: Результат, соответствующий новому плану
+        """
+        return SeedsResult(users=list(self.top_up_users(plan=plan.users, users=result.users)))
+
+    def get_user_account_ids(self, user_id: str) -> set[str]:
+        """
+        Возвращает ID всех счетов пользователя, существующих в системе.
+
+        Args:
+            user_id: Идентификатор пользователя
+
+        Returns:
+            set[str]: ID счетов пользователя
+        """
+        response = self.limiter.call(self.accounts_gateway_client.get_accounts, user_id=user_id)
+        return {account.id for account in response.accounts}
+
+    def check_user(self, user: SeedUserResult) -> bool:
+        """
+        Проверяет, что созданный ранее пользователь и все его счета всё ещё существуют в системе.
+
+        Args:
+            user: Ранее созданный пользователь из дампа сидинга
+
+        Returns:
+            bool: True, если все счета пользователя найдены
+        """
+        expected_account_ids = {
+            account.account_id
+            for accounts in (
+                user.deposit_accounts,
+                user.savings_accounts,
+                user.debit_card_accounts,
+                user.credit_card_accounts
+            )
+            for account in accounts
+        }
+
+        try:
+            account_ids = self.get_user_account_ids(user_id=user.user_id)
+        except REQUEST_ERRORS:
+            return False
+
+        return expected_account_ids <= account_ids
+
+    def compile_card_account(
+            self,
+            graph: SeedsGraph,
+            plan: SeedAccountsPlan,
+            user: SeedTask[str],
+            open_account: Callable[[str], tuple[str, str]]
+    ) -> SeedTask[SeedAccountResult]:
+        """
+        Добавляет в граф задачи карточного счёта: открытие счёта и независимые
+        задачи выпуска карт и выполнения операций, зависящие только от счёта.
+
+        Args:
+            graph: Граф задач сидинга
+            plan: План по картам и операциям счёта
+            user: Задача создания пользователя (результат — ID пользователя)
+            open_account: Функция открытия счёта (open_debit_card_account или open_credit_card_account)
+
+        Returns:
+            SeedTask[SeedAccountResult]: Итоговая задача, собирающая результат счёта
+        """
+        account = graph.add(open_account, user)
+        return self.compile_card_account_result(graph, plan, user, account)
+
+    def compile_card_account_result(
+            self,
+            graph: SeedsGraph,
+            plan: SeedAccountsPlan,
+            user: SeedTask[str],
+            account: SeedTask[tuple[str, str]],
+            existing: SeedAccountResult | None = None
+    ) -> SeedTask[SeedAccountResult]:
+        """
+        Добавляет в граф задачи выпуска карт и выполнения операций карточного счёта,
+        зависящие только от счёта, и итоговую задачу, собирающую результат счёта.
+
+        Args:
+            graph: Граф задач сидинга
+            plan: План по картам и операциям счёта
+            user: Задача с ID пользователя
+            account: Задача с ID счёта и ID карты, по которой выполняются операции
+            existing: Ранее созданный счёт, к сущностям которого добавляются новые (при дозаполнении)
+
+        Returns:
+            SeedTask[SeedAccountResult]: Итоговая задача, собирающая результат счёта
+        """
+        existing = existing or SeedAccountResult(account_id="")
+
+        def card(build: Callable[..., SeedCardResult]) -> SeedTask[SeedCardResult]:
+            return graph.add(
+                lambda user_id, opened: build(user_id=user_id, account_id=opened[0]),
+                user,
+                account
+            )
+
+        def operation(build: Callable[..., SeedOperationResult]) -> SeedTask[SeedOperationResult]:
+            return graph.add(lambda opened: build(card_id=opened[1], account_id=opened[0]), account)
+
+        virtual_cards = [card(self.build_virtual_card_result) for _ in range(plan.virtual_cards.count)]
+        physical_cards = [card(self.build_physical_card_result) for _ in range(plan.physical_cards.count)]
+        top_up_operations = [
+            operation(self.build_top_up_operation_result) for _ in range(plan.top_up_operations.count)
+        ]
+        transfer_operations = [
+            operation(self.build_transfer_operation_result) for _ in range(plan.transfer_operations.count)
+        ]
+        purchase_operations = [
+            operation(self.build_purchase_operation_result) for _ in range(plan.purchase_operations.count)
+        ]
+        cash_withdrawal_operations = [
+            operation(self.build_cash_withdrawal_operation_result)
+            for _ in range(plan.cash_withdrawal_operations.count)
+        ]
+        leaves = (
+            virtual_cards,
+            physical_cards,
+            top_up_operations,
+            transfer_operations,
+            purchase_operations,
+            cash_withdrawal_operations
+        )
+
+        return graph.add(
+            lambda opened, *_: SeedAccountResult(
+                account_id=opened[0],
+                virtual_cards=existing.virtual_cards + [task.result for task in virtual_cards],
+                physical_cards=existing.physical_cards + [task.result for task in physical_cards],
+                top_up_operations=existing.top_up_operations + [task.result for task in top_up_operations],
+                transfer_operations=existing.transfer_operations + [task.result for task in transfer_operations],
+                purchase_operations=existing.purchase_operations + [task.result for task in purchase_operations],
+                cash_withdrawal_operations=(
+                        existing.cash_withdrawal_operations + [task.result for task in cash_withdrawal_operations]
+                )
+            ),
+            account,
+            *(task for group in leaves for task in group),
+            inline=True
+        )
+
+    def compile_user(self, graph: SeedsGraph, plan: SeedUsersPlan, index: int) -> SeedTask[SeedUserResult]:
+        """
+        Компилирует план пользователя в граф задач:
+        пользователь -> счета -> карты и операции карточных счетов.
+
+        Args:
+            graph: Граф задач сидинга
+            plan: План генерации пользователя
+            index: Номер пользователя в плане (для выбора количеств из распределений)
+
+        Returns:
+            SeedTask[SeedUserResult]: Итоговая задача, собирающая результат пользователя
+        """
+        user = graph.add(self.create_user)
+
+        savings_accounts = [
+            graph.add(lambda user_id: self.build_savings_account_result(user_id=user_id), user)
+            for _ in range(plan.savings_accounts.count)
+        ]
+        deposit_accounts = [
+            graph.add(lambda user_id: self.build_deposit_account_result(user_id=user_id), user)
+            for _ in range(plan.deposit_accounts.count)
+        ]
+        debit_card_accounts = [
+            self.compile_card_account(
+                graph,
+                plan.get_account_plan("debit_card_accounts", index, account_index),
+                user,
+                self.open_debit_card_account
+            )
+            for account_index in range(plan.debit_card_accounts.count)
+        ]
+        credit_card_accounts = [
+            self.compile_card_account(
+                graph,
+                plan.get_account_plan("credit_card_accounts", index, account_index),
+                user,
+                self.open_credit_card_account
+            )
+            for account_index in range(plan.credit_card_accounts.count)
+        ]
+        accounts = (savings_accounts, deposit_accounts, debit_card_accounts, credit_card_accounts)
+
+        return graph.add(
+            lambda user_id, *_: SeedUserResult(
+                user_id=user_id,
+                savings_accounts=[task.result for task in savings_accounts],
+                deposit_accounts=[task.result for task in deposit_accounts],
+                debit_card_accounts=[task.result for task in debit_card_accounts],
+                credit_card_accounts=[task.result for task in credit_card_accounts]
+            ),
+            user,
+            *(task for group in accounts for task in group),
+            inline=True
+        )
+
+    def build_users(self, plan: SeedUsersPlan, count: int, start: int = 0) -> Iterator[SeedUserResult]:
+        """
+        Лениво создаёт пользователей согласно плану и отдаёт их по мере готовности.
+
+        План каждого пользователя компилируется в граф задач (см. compile_user), и каждая
+        задача запускается, как только завершены её родители, с общим лимитом concurrency
+        одновременных запросов. Пользователи отдаются строго в порядке плана,
+        поэтому результат детерминирован.
+
+        Args:
+            plan: План генерации пользователя
+            count: Сколько пользователей создать
+            start: Номер первого создаваемого пользователя в плане
+                (при продолжении сидинга или дозаполнении)
+
+        Returns:
+            Iterator[SeedUserResult]: Созданные пользователи в порядке плана
+        """
+        graph = SeedsGraph(concurrency=self.concurrency)
+        return graph.imap(
+            lambda index: self.compile_user(graph=graph, plan=plan, index=index),
+            range(start, start + count)
         )
 
     def build(self, plan: SeedsPlan) -> SeedsResult:
@@ -310,13 +719,280 @@ class SeedsBuilder:
         - создаёт указанное количество пользователей
         - каждому пользователю присваиваются счета, карты и операции
 
+        Порядок пользователей в результате всегда совпадает с порядком в плане.
+
         Args:
             plan: Полный план генерации данных
 
         Returns:
             SeedsResult: Результат с данными всех созданных пользователей
         """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
+        return SeedsResult(users=list(self.build_users(plan=plan.users, count=plan.users.count)))
+
+
+class SeedsServicesBuilder(SeedsBuilder):
+    """
+    SeedsServicesBuilder — сидер, который создаёт данные напрямую во внутренних сервисах
+    users, accounts, cards и operations, минуя gateway.
+
+    Сидинг не проходит через оркестрацию gateway и не попадает в его метрики до начала теста.
+    Граф задач, лимиты, журнал и дозаполнение работают так же, как в SeedsBuilder:
+    переопределены только сами запросы к системе.
+
+    Важно: gateway может выполнять побочные действия, которых здесь нет
+    (например, пересчёт баланса счёта после операции). Вместе с карточным счётом,
+    как и в gateway, создаётся одна карта — по ней выполняются операции.
+
+    Attributes:
+        users_service_client: Клиент UsersService
+        accounts_service_client: Клиент AccountsService
+        cards_service_client: Клиент CardsService
+        operations_service_client: Клиент OperationsService
+    """
+
+    # Карточный счёт создаётся двумя вызовами: счёт, затем карта к нему (см. create_card_account).
+    # Методы сервисов общие для всех типов сущностей, поэтому в телеметрии вызовы учитываются
+    # по ключу с типом сущности (create_<тип>_account, create_<тип>_card, create_<тип>_operation)
+    ENTITY_CALLS: dict[str, tuple[str, ...]] = {
+        "users": ("create_user",),
+        "deposit_accounts": ("create_deposit_account",),
+        "savings_accounts": ("create_savings_account",),
+        "debit_card_accounts": ("create_debit_card_account", "create_virtual_card"),
+        "credit_card_accounts": ("create_credit_card_account", "create_virtual_card"),
+        "physical_cards": ("create_physical_card",),
+        "virtual_cards": ("create_virtual_card",),
+        "top_up_operations": ("create_top_up_operation",),
+        "purchase_operations": ("create_purchase_operation",),
+        "transfer_operations": ("create_transfer_operation",),
+        "cash_withdrawal_operations": ("create_cash_withdrawal_operation",),
+    }
+    ACCOUNT_CARD_CALLS: tuple[str, ...] = ("get_cards",)
+    CHECK_USER_CALLS: tuple[str, ...] = ("get_accounts",)
+
+    def __init__(
+            self,
+            users_service_client: UsersServiceGRPCClient,
+            accounts_service_client: AccountsServiceGRPCClient,
+            cards_service_client: CardsServiceGRPCClient,
+            operations_service_client: OperationsServiceGRPCClient,
+            concurrency: int = 1,
+            limiter: SeedsLimiter | None = None
+    ):
+        super().__init__(
+            users_gateway_client=None,
+            cards_gateway_client=None,
+            accounts_gateway_client=None,
+            operations_gateway_client=None,
+            concurrency=concurrency,
+            limiter=limiter
+        )
+
+        self.users_service_client = users_service_client
+        self.accounts_service_client = accounts_service_client
+        self.cards_service_client = cards_service_client
+        self.operations_service_client = operations_service_client
+
+    def create_card(self, account_id: str, card_type: CardType.ValueType, key: str) -> SeedCardResult:
+        """
+        Создаёт карту заданного типа для счёта.
+
+        :param key: Ключ вызова в телеметрии сидинга (например, create_virtual_card).
+        """
+        response = self.limiter.call(
+            self.cards_service_client.create_card,
+            account_id=account_id,
+            card_type=card_type,
+            key=key
+        )
+        return SeedCardResult(card_id=response.card.id)
+
+    def create_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            operation_type: OperationType.ValueType,
+            key: str
+    ) -> SeedOperationResult:
+        """
+        Создаёт операцию заданного типа по карте.
+
+        :param key: Ключ вызова в телеметрии сидинга (например, create_purchase_operation).
+        """
+        response = self.limiter.call(
+            self.operations_service_client.create_operation,
+            card_id=card_id,
+            account_id=account_id,
+            operation_type=operation_type,
+            key=key
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    def create_account(self, user_id: str, account_type: AccountType.ValueType, key: str) -> SeedAccountResult:
+        """
+        Создаёт счёт заданного типа для пользователя.
+
+        :param key: Ключ вызова в телеметрии сидинга (например, create_savings_account).
+        """
+        response = self.limiter.call(
+            self.accounts_service_client.create_account,
+            user_id=user_id,
+            account_type=account_type,
+            key=key
+        )
+        return SeedAccountResult(account_id=response.account.id)
+
+    def create_card_account(self, user_id: str, account_type: AccountType.ValueType, key: str) -> tuple[str, str]:
+        """
+        Создаёт карточный счёт и карту к нему.
+
+        :param key: Ключ вызова создания счёта в телеметрии сидинга (например, create_debit_card_account).
+
+        Returns:
+            tuple[str, str]: ID счёта и ID карты
+        """
+        account = self.create_account(user_id=user_id, account_type=account_type, key=key)
+        card = self.create_card(
+            account_id=account.account_id,
+            card_type=CardType.CARD_TYPE_VIRTUAL,
+            key="create_virtual_card"
+        )
+        return account.account_id, card.card_id
+
+    def create_user(self) -> str:
+        """
+        Создаёт пользователя в UsersService.
+        """
+        response = self.limiter.call(self.users_service_client.create_user)
+        return response.user.id
+
+    def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        """
+        Создаёт виртуальную карту счёта.
+        """
+        return self.create_card(
+            account_id=account_id,
+            card_type=CardType.CARD_TYPE_VIRTUAL,
+            key="create_virtual_card"
+        )
+
+    def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        """
+        Создаёт физическую карту счёта.
+        """
+        return self.create_card(
+            account_id=account_id,
+            card_type=CardType.CARD_TYPE_PHYSICAL,
+            key="create_physical_card"
+        )
+
+    def build_top_up_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Создаёт операцию пополнения.
+        """
+        return self.create_operation(
+            card_id=card_id,
+            account_id=account_id,
+            operation_type=OperationType.OPERATION_TYPE_TOP_UP,
+            key="create_top_up_operation"
+        )
+
+    def build_transfer_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Создаёт операцию перевода.
+        """
+        return self.create_operation(
+            card_id=card_id,
+            account_id=account_id,
+            operation_type=OperationType.OPERATION_TYPE_TRANSFER,
+            key="create_transfer_operation"
+        )
+
+    def build_purchase_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Создаёт операцию покупки.
+        """
+        return self.create_operation(
+            card_id=card_id,
+            account_id=account_id,
+            operation_type=OperationType.OPERATION_TYPE_PURCHASE,
+            key="create_purchase_operation"
+        )
+
+    def build_cash_withdrawal_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Создаёт операцию снятия наличных.
+        """
+        return self.create_operation(
+            card_id=card_id,
+            account_id=account_id,
+            operation_type=OperationType.OPERATION_TYPE_CASH_WITHDRAWAL,
+            key="create_cash_withdrawal_operation"
+        )
+
+    def build_savings_account_result(self, user_id: str) -> SeedAccountResult:
+        """
+        Создаёт сберегательный счёт.
+        """
+        return self.create_account(
+            user_id=user_id,
+            account_type=AccountType.ACCOUNT_TYPE_SAVINGS,
+            key="create_savings_account"
+        )
+
+    def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
+        """
+        Создаёт депозитный счёт.
+        """
+        return self.create_account(
+            user_id=user_id,
+            account_type=AccountType.ACCOUNT_TYPE_DEPOSIT,
+            key="create_deposit_account"
+        )
+
+    def open_debit_card_account(self, user_id: str) -> tuple[str, str]:
+        """
+        Создаёт дебетовый счёт с картой.
+        """
+        return self.create_card_account(
+            user_id=user_id,
+            account_type=AccountType.ACCOUNT_TYPE_DEBIT_CARD,
+            key="create_debit_card_account"
+        )
+
+    def open_credit_card_account(self, user_id: str) -> tuple[str, str]:
+        """
+        Создаёт кредитный счёт с картой.
+        """
+        return self.create_card_account(
+            user_id=user_id,
+            account_type=AccountType.ACCOUNT_TYPE_CREDIT_CARD,
+            key="create_credit_card_account"
+        )
+
+    def get_account_card_id(self, user_id: str, account_id: str) -> str:
+        """
+        Возвращает ID активной карты счёта для операций.
+
+        Порядок карт в ответе GetCards не гарантирован, поэтому карта выбирается по счёту и статусу:
+        предпочтительно виртуальная, как карта, созданная вместе со счётом (см. create_card_account).
+        """
+        response = self.limiter.call(self.cards_service_client.get_cards, account_id=account_id)
+
+        cards = [
+            card for card in response.cards
+            if card.account_id == account_id and card.status == CardStatus.CARD_STATUS_ACTIVE
+        ]
+        if not cards:
+            raise ValueError(f"Account {account_id} has no active cards")
+
+        return min(cards, key=lambda card: card.type != CardType.CARD_TYPE_VIRTUAL).id
+
+    def get_user_account_ids(self, user_id: str) -> set[str]:
+        """
+        Возвращает ID всех счетов пользователя в AccountsService.
+        """
+        response = self.limiter.call(self.accounts_service_client.get_accounts, user_id=user_id)
+        return {account.id for account in response.accounts}
 
 
 def build_grpc_seeds_builder() -> SeedsBuilder:
@@ -330,7 +1006,9 @@ def build_grpc_seeds_builder() -> SeedsBuilder:
         users_gateway_client=build_users_gateway_grpc_client(),
         cards_gateway_client=build_cards_gateway_grpc_client(),
         accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        operations_gateway_client=build_operations_gateway_grpc_client(),
+        concurrency=settings.seeds.concurrency,
+        limiter=build_seeds_limiter()
     )
 
 
@@ -345,5 +1023,41 @@ def build_http_seeds_builder():
         users_gateway_client=build_users_gateway_http_client(),
         cards_gateway_client=build_cards_gateway_http_client(),
         accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        operations_gateway_client=build_operations_gateway_http_client(),
+        concurrency=settings.seeds.concurrency,
+        limiter=build_seeds_limiter()
+    )
+
+
+def build_services_seeds_builder() -> SeedsServicesBuilder:
+    """
+    Фабрика для создания сидера, работающего напрямую с внутренними gRPC-сервисами.
+    Адреса сервисов берутся из настроек (USERS_SERVICE_GRPC_CLIENT.HOST и т.д.).
+
+    Returns:
+        SeedsServicesBuilder: Инициализированный сидер с клиентами внутренних сервисов
+    """
+    return SeedsServicesBuilder(
+        users_service_client=build_users_service_grpc_client(),
+        accounts_service_client=build_accounts_service_grpc_client(),
+        cards_service_client=build_cards_service_grpc_client(),
+        operations_service_client=build_operations_service_grpc_client(),
+        concurrency=settings.seeds.concurrency,
+        limiter=build_seeds_limiter()
     )
+
+
+def build_seeds_builder() -> SeedsBuilder:
+    """
+    Фабрика сидера по настройке SEEDS.CLIENT: gRPC gateway, HTTP gateway или внутренние сервисы.
+
+    Returns:
+        SeedsBuilder: Инициализированный сидер
+    """
+    match settings.seeds.client:
+        case SeedsClient.GATEWAY_HTTP:
+            return build_http_seeds_builder()
+        case SeedsClient.SERVICES_GRPC:
+            return build_services_seeds_builder()
+        case _:
+            return build_grpc_seeds_builder()
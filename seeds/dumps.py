@@ -1,7 +1,12 @@
 import json
+import os
 from pathlib import Path
+from typing import Iterator
 
-from seeds.schema.result import SeedsResult
+from seeds.records import SeedsRecords
+from seeds.schema.plan import SeedsPlan
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.telemetry import SeedsTelemetryReport
 from tools.logger import get_logger
 
 # Создаём логгер один раз
@@ -11,31 +16,305 @@ DUMPS_DIR = Path("./dumps")
 DUMPS_DIR.mkdir(exist_ok=True)
 
 
+class SeedsWriter:
+    """
+    Потоковая запись результата сидинга в формате JSONL: одна строка — один пользователь.
+
+    Пользователи записываются по мере создания, поэтому в памяти не нужно держать весь
+    результат целиком. Запись идёт во временный файл, который атомарно заменяет дамп
+    только при успешном завершении, так что прерванная запись не портит предыдущий дамп.
+    """
+
+    def __init__(self, scenario: str):
+        """
+        :param scenario: Имя сценария сидинга. Используется в имени файла дампа.
+        """
+        self.seeds_file = DUMPS_DIR / f"{scenario}_seeds.jsonl"
+        self.temp_file = DUMPS_DIR / f"{scenario}_seeds.jsonl.tmp"
+        self.file = None
+        self.count = 0
+
+    def __enter__(self) -> "SeedsWriter":
+        self.file = open(self.temp_file, "w", encoding="utf-8")
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        self.file.close()
+
+        if exc_type is not None:
+            self.temp_file.unlink(missing_ok=True)
+            return
+
+        os.replace(self.temp_file, self.seeds_file)
+        # Старый формат больше не актуален — удаляем, чтобы не загрузить его по ошибке
+        (DUMPS_DIR / self.seeds_file.name.replace(".jsonl", ".json")).unlink(missing_ok=True)
+
+        # Логирование после успешного сохранения
+        logger.debug(f"Seeding result saved to file: {self.seeds_file}, users: {self.count}")
+
+    def write(self, user: SeedUserResult) -> None:
+        """
+        Записывает одного пользователя в дамп.
+
+        :param user: Полностью созданный пользователь.
+        """
+        self.file.write(user.model_dump_json())
+        self.file.write("\n")
+        self.count += 1
+
+
 def save_seeds_result(result: SeedsResult, scenario: str) -> None:
     """
-    Сохраняет результат сидинга в JSON-файл.
+    Сохраняет результат сидинга в JSONL-файл.
     """
-    seeds_file = DUMPS_DIR / f"{scenario}_seeds.json"
+    with SeedsWriter(scenario=scenario) as writer:
+        for user in result.users:
+            writer.write(user)
+
 
-    with open(seeds_file, "w", encoding="utf-8") as f:
-        json.dump(result.model_dump(), f, indent=2, ensure_ascii=False)
+def get_seeds_result_file(scenario: str) -> Path:
+    """
+    Возвращает путь к дампу сидинга сценария.
+    Если есть только дамп старого формата (один JSON-документ), возвращается он.
+    """
+    seeds_file = DUMPS_DIR / f"{scenario}_seeds.jsonl"
+    legacy_seeds_file = DUMPS_DIR / f"{scenario}_seeds.json"
 
-    # Логирование после успешного сохранения
-    logger.debug(f"Seeding result saved to file: {seeds_file}")
+    if not seeds_file.exists() and legacy_seeds_file.exists():
+        return legacy_seeds_file
 
+    return seeds_file
 
-def load_seeds_result(scenario: str) -> SeedsResult:
+
+def seeds_result_exists(scenario: str) -> bool:
     """
-    Загружает результат сидинга из JSON-файла.
+    Проверяет, есть ли сохранённый результат сидинга для сценария.
     """
-    seeds_file = DUMPS_DIR / f"{scenario}_seeds.json"
+    return get_seeds_result_file(scenario=scenario).exists()
+
 
-    with open(seeds_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+def iter_seeds_users(scenario: str) -> Iterator[SeedUserResult]:
+    """
+    Лениво читает пользователей из дампа сидинга, по одному за раз.
+
+    Каждая строка JSONL валидируется сразу в SeedUserResult, без промежуточного dict.
+    Для дампов старого формата (один JSON-документ) файл читается целиком.
+    """
+    seeds_file = get_seeds_result_file(scenario=scenario)
 
-    result = SeedsResult(**data)
+    if seeds_file.suffix == ".json":
+        with open(seeds_file, "r", encoding="utf-8") as f:
+            yield from SeedsResult(**json.load(f)).users
+        return
+
+    with open(seeds_file, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield SeedUserResult.model_validate_json(line)
+
+
+def load_seeds_result(scenario: str) -> SeedsResult:
+    """
+    Загружает результат сидинга из JSONL-файла.
+    """
+    result = SeedsResult(users=list(iter_seeds_users(scenario=scenario)))
 
     # Логирование после успешной загрузки
-    logger.debug(f"Seeding result loaded from file: {seeds_file}")
+    logger.debug(f"Seeding result loaded for scenario: {scenario}, users: {len(result.users)}")
 
     return result
+
+
+def load_seeds_records(scenario: str) -> SeedsRecords:
+    """
+    Загружает результат сидинга из JSONL-файла в облегчённые записи для теста.
+
+    Строки разбираются через json.loads и сразу раскладываются в SeedUser, без валидации
+    pydantic: дамп уже был провалидирован при сидинге.
+    """
+    seeds_file = get_seeds_result_file(scenario=scenario)
+
+    with open(seeds_file, "rb") as f:
+        if seeds_file.suffix == ".json":
+            records = SeedsRecords.from_dicts(json.load(f).get("users", []))
+        else:
+            records = SeedsRecords.from_dicts(json.loads(line) for line in f if line.strip())
+
+    # Логирование после успешной загрузки
+    logger.debug(f"Seeding records loaded for scenario: {scenario}, users: {len(records)}")
+
+    return records
+
+
+def save_seeds_plan_hash(plan_hash: str, scenario: str) -> None:
+    """
+    Сохраняет хэш плана, по которому был построен дамп сидинга, рядом с самим дампом.
+    """
+    meta_file = DUMPS_DIR / f"{scenario}_seeds.meta.json"
+
+    with open(meta_file, "w", encoding="utf-8") as f:
+        json.dump({"plan_hash": plan_hash}, f)
+
+    logger.debug(f"Seeding plan hash saved to file: {meta_file}")
+
+
+def load_seeds_plan_hash(scenario: str) -> str | None:
+    """
+    Загружает хэш плана, по которому был построен дамп сидинга.
+
+    Возвращает None, если дампа или файла с хэшем нет.
+    """
+    meta_file = DUMPS_DIR / f"{scenario}_seeds.meta.json"
+
+    if not (seeds_result_exists(scenario=scenario) and meta_file.exists()):
+        return None
+
+    with open(meta_file, "r", encoding="utf-8") as f:
+        return json.load(f).get("plan_hash")
+
+
+def save_seeds_telemetry(report: SeedsTelemetryReport, scenario: str) -> None:
+    """
+    Сохраняет отчёт телеметрии сидинга рядом с дампом.
+    """
+    telemetry_file = DUMPS_DIR / f"{scenario}_seeds.telemetry.json"
+
+    with open(telemetry_file, "w", encoding="utf-8") as f:
+        f.write(report.model_dump_json(indent=2))
+
+    logger.debug(f"Seeding telemetry saved to file: {telemetry_file}")
+
+
+def load_seeds_telemetry(scenario: str) -> SeedsTelemetryReport | None:
+    """
+    Загружает отчёт телеметрии последнего сидинга сценария.
+
+    Возвращает None, если сидинг ещё не выполнялся.
+    """
+    telemetry_file = DUMPS_DIR / f"{scenario}_seeds.telemetry.json"
+
+    if not telemetry_file.exists():
+        return None
+
+    with open(telemetry_file, "rb") as f:
+        return SeedsTelemetryReport.model_validate_json(f.read())
+
+
+class SeedsJournal:
+    """
+    Append-only журнал сидинга в формате JSONL.
+
+    Первая строка журнала содержит план сидинга, каждая следующая — одного готового
+    пользователя (SeedUserResult). Каждая запись сбрасывается на диск сразу после создания
+    пользователя, поэтому прерванный сидинг можно продолжить с последнего записанного
+    пользователя, а не начинать заново.
+    """
+
+    def __init__(self, plan: SeedsPlan, scenario: str):
+        """
+        :param plan: План сидинга, для которого ведётся журнал.
+        :param scenario: Имя сценария сидинга. Используется в имени файла журнала.
+        """
+        self.plan = plan
+        self.scenario = scenario
+        self.journal_file = DUMPS_DIR / f"{scenario}_seeds.journal.jsonl"
+        self.file = None
+
+    def __enter__(self) -> "SeedsJournal":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def load(self) -> int:
+        """
+        Проверяет пользователей, уже записанных в журнал, и открывает журнал для дозаписи.
+
+        Если журнала нет или он был создан для другого плана, журнал начинается заново.
+        Недописанная последняя строка (например, после аварийного завершения) отбрасывается.
+        Сами пользователи в памяти не сохраняются — их можно прочитать через iter_users.
+
+        :return: Количество пользователей, созданных в предыдущих запусках.
+        """
+        count = 0
+        committed_size = 0
+
+        if self.journal_file.exists():
+            with open(self.journal_file, "rb") as f:
+                header = f.readline()
+                if header.endswith(b"\n") and self.is_plan_header(header):
+                    committed_size = f.tell()
+                    for line in f:
+                        if not line.endswith(b"\n"):
+                            break
+                        try:
+                            SeedUserResult.model_validate_json(line)
+                        except ValueError:
+                            break
+                        count += 1
+                        committed_size = f.tell()
+
+        if committed_size == 0:
+            self.file = open(self.journal_file, "wb")
+            self.write(json.dumps({"plan": self.plan.model_dump(mode="json")}).encode())
+        else:
+            # Отрезаем всё, что идёт после последней целой записи
+            self.file = open(self.journal_file, "r+b")
+            self.file.truncate(committed_size)
+            self.file.seek(committed_size)
+
+        logger.debug(f"Seeding journal opened: {self.journal_file}, committed users: {count}")
+
+        return count
+
+    def iter_users(self) -> Iterator[SeedUserResult]:
+        """
+        Лениво читает пользователей, записанных в журнал.
+        """
+        with open(self.journal_file, "rb") as f:
+            f.readline()  # Пропускаем заголовок с планом
+            for line in f:
+                yield SeedUserResult.model_validate_json(line)
+
+    def is_plan_header(self, line: bytes) -> bool:
+        """
+        Проверяет, что строка заголовка журнала содержит текущий план сидинга.
+        """
+        try:
+            header = json.loads(line)
+        except ValueError:
+            return False
+
+        return isinstance(header, dict) and header.get("plan") == self.plan.model_dump(mode="json")
+
+    def append(self, user: SeedUserResult) -> None:
+        """
+        Дописывает пользователя в журнал и сбрасывает запись на диск.
+
+        :param user: Полностью созданный пользователь.
+        """
+        self.write(user.model_dump_json().encode())
+
+    def write(self, line: bytes) -> None:
+        """
+        Записывает строку в журнал и дожидается её попадания на диск (fsync).
+        """
+        self.file.write(line + b"\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self) -> None:
+        """
+        Закрывает файл журнала, сам журнал при этом сохраняется.
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def remove(self) -> None:
+        """
+        Удаляет журнал после того, как итоговый результат сидинга сохранён.
+        """
+        self.close()
+        self.journal_file.unlink(missing_ok=True)
+        logger.debug(f"Seeding journal removed: {self.journal_file}")
@@ -0,0 +1,202 @@
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Iterable
+
+from pydantic import BaseModel
+
+from seeds.builder import SeedsBuilder
+from seeds.records import USER_ACCOUNTS, ACCOUNT_CARDS, ACCOUNT_OPERATIONS
+from seeds.schema.plan import SeedsPlan, SeedAccountsPlan
+from seeds.schema.result import SeedUserResult, SeedAccountResult
+
+# Карты и операции создаются только для карточных счетов (см. SeedsBuilder.compile_user)
+CARD_ACCOUNTS = ("debit_card_accounts", "credit_card_accounts")
+
+
+class SeedsPlanEstimate(BaseModel):
+    """
+    Оценка стоимости плана сидинга.
+
+    Attributes:
+        users (int): Сколько пользователей в плане.
+        existing_users (int): Сколько из них берётся из существующего дампа (SEEDS.CACHE, SEEDS.TOP_UP).
+        calls (dict[str, int]): Количество вызовов каждого метода клиентов сидинга.
+        entities (dict[str, int]): Количество создаваемых сущностей каждого вида
+            (счета по типам, карты и операции по видам).
+        total_calls (int): Общее количество вызовов.
+        concurrency (int): Количество одновременных запросов, для которого сделан прогноз.
+        work_seconds (float): Суммарное время всех вызовов (время последовательного сидинга).
+        critical_path_seconds (float): Самая длинная цепочка зависимых вызовов одного пользователя.
+        projected_seconds (float): Прогноз времени сидинга при заданной конкурентности
+            (вместе с последовательной проверкой пользователей дампа).
+    """
+    users: int
+    existing_users: int
+    calls: dict[str, int]
+    entities: dict[str, int]
+    total_calls: int
+    concurrency: int
+    work_seconds: float
+    critical_path_seconds: float
+    projected_seconds: float
+
+    def format_table(self) -> str:
+        """
+        Возвращает оценку в виде текстовой таблицы для лога.
+        """
+        width = max(map(len, (*self.calls, *self.entities, "method")))
+        lines = [f"{'method':<{width}}  {'calls':>10}"]
+        lines.extend(f"{method:<{width}}  {count:>10}" for method, count in self.calls.items())
+        lines.append(f"{'total':<{width}}  {self.total_calls:>10}")
+        lines.append("")
+        lines.append(f"{'entity':<{width}}  {'count':>10}")
+        lines.extend(f"{entity:<{width}}  {count:>10}" for entity, count in self.entities.items())
+        lines.append("")
+        lines.append(
+            f"existing_users={self.existing_users}, concurrency={self.concurrency}, work={self.work_seconds:.1f}s, "
+            f"critical_path={self.critical_path_seconds:.3f}s, projected={self.projected_seconds:.1f}s"
+        )
+        return "\n".join(lines)
+
+
+def load_seeds_latencies(latencies_file: Path) -> dict[str, float]:
+    """
+    Загружает задержки вызовов (в секундах) по методам клиентов сидинга из JSON-файла вида {"method": seconds}.
+
+    :param latencies_file: Путь к файлу.
+    :return: Словарь метод -> задержка.
+    """
+    with open(latencies_file, "r", encoding="utf-8") as f:
+        return {method: float(latency) for method, latency in json.load(f).items()}
+
+
+def estimate_seeds_plan(
+        plan: SeedsPlan,
+        builder: type[SeedsBuilder] | SeedsBuilder = SeedsBuilder,
+        concurrency: int = 1,
+        latencies: dict[str, float] | None = None,
+        default_latency: float = 0.05,
+        existing_users: Iterable[SeedUserResult] | None = None,
+        checks: int = 0
+) -> SeedsPlanEstimate:
+    """
+    Обходит план сидинга без запросов к системе и оценивает его стоимость.
+
+    Вызовы каждой сущности берутся из билдера (SeedsBuilder.ENTITY_CALLS): через gateway
+    и напрямую через сервисы сущности создаются разными методами, а имена методов совпадают
+    с телеметрией сидинга, поэтому к ним подходят задержки предыдущего запуска.
+
+    Количества карт и операций из распределений выбираются так же, как при сидинге
+    (SeedUsersPlan.get_account_plan детерминирован), поэтому количество вызовов точное.
+    Если переданы существующие пользователи дампа, они дозаполняются до плана
+    (как SeedsBuilder.top_up_users): считаются только недостающие сущности и запросы карты
+    существующего счёта. Дамп, уже соответствующий плану, не стоит ни одного вызова создания.
+
+    Время оценивается по задержкам методов: сидинг не может быть быстрее ни суммарной
+    работы, поделённой на concurrency, ни самой длинной цепочки зависимых вызовов
+    (пользователь -> счёт -> карта или операция). Проверка пользователей дампа выполняется
+    до сидинга последовательно и добавляется к прогнозу целиком.
+
+    :param plan: План сидинга.
+    :param builder: Билдер (или его класс), через который выполняется сидинг (SEEDS.CLIENT).
+    :param concurrency: Количество одновременных запросов (SEEDS.CONCURRENCY).
+    :param latencies: Задержки вызовов по методам (в секундах).
+    :param default_latency: Задержка методов, которых нет в latencies.
+    :param existing_users: Пользователи существующего дампа, которые переиспользуются или дозаполняются.
+    :param checks: Сколько пользователей дампа проверяется в системе (SEEDS.CACHE_CHECK_SAMPLE).
+    :return: Объект SeedsPlanEstimate.
+    """
+    latencies = latencies or {}
+
+    calls: Counter[str] = Counter()
+    entities: Counter[str] = Counter()
+
+    def call(methods: tuple[str, ...], count: int = 1) -> float:
+        """
+        Учитывает count выполнений цепочки вызовов и возвращает длительность одной цепочки.
+        """
+        for method in methods:
+            calls[method] += count
+        return sum(latencies.get(method, default_latency) for method in methods)
+
+    def build_account_entities(account_plan: SeedAccountsPlan, existing: SeedAccountResult | None) -> float:
+        """
+        Учитывает недостающие карты и операции карточного счёта и возвращает самую длинную цепочку.
+        """
+        longest_entity = 0.0
+        missing_operations = 0
+        for entity in (*ACCOUNT_CARDS, *ACCOUNT_OPERATIONS):
+            count = getattr(account_plan, entity).count
+            if existing is not None:
+                count = max(count - len(getattr(existing, entity)), 0)
+            if not count:
+                continue
+
+            entities[entity] += count
+            longest_entity = max(longest_entity, call(builder.ENTITY_CALLS[entity], count))
+            if entity in ACCOUNT_OPERATIONS:
+                missing_operations += count
+
+        # Для операций по существующему счёту сначала запрашивается его карта (get_account_card_id)
+        if existing is not None and missing_operations:
+            longest_entity += call(builder.ACCOUNT_CARD_CALLS)
+
+        return longest_entity
+
+    users_plan = plan.users
+    users = iter(existing_users or ())
+    existing_count = 0
+    critical_path = 0.0
+
+    for user_index in range(users_plan.count):
+        user = next(users, None)
+        if user is None:
+            entities["users"] += 1
+            user_path = call(builder.ENTITY_CALLS["users"])
+        else:
+            existing_count += 1
+            user_path = 0.0
+
+        longest_account = 0.0
+        for name in USER_ACCOUNTS:
+            existing_accounts: list[SeedAccountResult] = getattr(user, name) if user is not None else []
+
+            # Существующие карточные счета дозаполняются до плана (все, как в SeedsBuilder.compile_top_up_user)
+            if name in CARD_ACCOUNTS:
+                for account_index, account in enumerate(existing_accounts):
+                    account_plan = users_plan.get_account_plan(name, user_index, account_index)
+                    longest_account = max(longest_account, build_account_entities(account_plan, account))
+
+            for account_index in range(len(existing_accounts), getattr(users_plan, name).count):
+                entities[name] += 1
+                account_path = call(builder.ENTITY_CALLS[name])
+                if name in CARD_ACCOUNTS:
+                    account_plan = users_plan.get_account_plan(name, user_index, account_index)
+                    account_path += build_account_entities(account_plan, None)
+
+                longest_account = max(longest_account, account_path)
+
+        critical_path = max(critical_path, user_path + longest_account)
+
+    checked = min(checks, existing_count)
+    check_seconds = call(builder.CHECK_USER_CALLS, checked) * checked
+
+    calls = Counter({method: count for method, count in calls.items() if count})
+    work = sum(count * latencies.get(method, default_latency) for method, count in calls.items())
+
+    return SeedsPlanEstimate(
+        users=users_plan.count,
+        existing_users=existing_count,
+        calls=dict(calls.most_common()),
+        entities={
+            entity: entities[entity]
+            for entity in ("users", *USER_ACCOUNTS, *ACCOUNT_CARDS, *ACCOUNT_OPERATIONS)
+            if entities[entity]
+        },
+        total_calls=sum(calls.values()),
+        concurrency=concurrency,
+        work_seconds=work,
+        critical_path_seconds=critical_path,
+        projected_seconds=check_seconds + max((work - check_seconds) / concurrency, critical_path)
+    )
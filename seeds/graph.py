@@ -0,0 +1,180 @@
+import heapq
+from collections import deque
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar
+
+from gevent.pool import Group
+from gevent.queue import Queue
+
+A = TypeVar("A")
+T = TypeVar("T")
+
+
+class SeedTask(Generic[T]):
+    """
+    Узел графа сидинга — один запрос к системе (или локальная сборка результата).
+
+    Attributes:
+        run: Функция задачи, получает результаты родительских задач в порядке parents
+        parents: Задачи, которые должны завершиться до запуска этой задачи
+        children: Задачи, зависящие от этой задачи
+        inline: Выполнять задачу сразу в планировщике, не занимая слот in-flight
+            (для сборки результата без запросов к системе)
+        depth: Глубина узла в графе; более глубокие узлы запускаются раньше
+        waiting: Сколько родительских задач ещё не завершено
+        done: Задача завершена
+        result: Результат задачи
+    """
+    __slots__ = ("run", "parents", "children", "inline", "depth", "waiting", "done", "result")
+
+    def __init__(self, run: Callable[..., T], parents: tuple["SeedTask", ...], inline: bool):
+        self.run = run
+        self.parents = parents
+        self.children: list[SeedTask] = []
+        self.inline = inline
+        self.depth = max((parent.depth for parent in parents), default=-1) + 1
+        self.waiting = sum(1 for parent in parents if not parent.done)
+        self.done = False
+        self.result: T | None = None
+
+        for parent in parents:
+            parent.children.append(self)
+
+    def execute(self) -> T:
+        """
+        Выполняет задачу с результатами родительских задач.
+        """
+        return self.run(*(parent.result for parent in self.parents))
+
+
+class SeedsGraph:
+    """
+    Исполнитель графа задач сидинга.
+
+    План компилируется в граф зависимостей (пользователь -> счёт -> карты и операции),
+    и каждая задача запускается, как только завершены все её родители. Количество
+    одновременно выполняемых задач ограничено глобальным лимитом concurrency, поэтому
+    время сидинга стремится к глубине графа, а не к его размеру.
+
+    Из готовых задач первыми запускаются самые глубокие: так начатые пользователи
+    достраиваются раньше, чем начинаются новые, и результаты можно отдавать потоково.
+    Подграфы новых элементов компилируются лениво — только когда есть свободный слот
+    и нет более срочных задач, поэтому граф в памяти не растёт с размером плана.
+    """
+
+    def __init__(self, concurrency: int = 1):
+        """
+        :param concurrency: Максимальное количество одновременно выполняемых задач.
+            При значении 1 задачи выполняются последовательно в текущем greenlet.
+        """
+        self.concurrency = concurrency
+
+        self.ready: list[tuple[int, int, SeedTask]] = []
+        self.sequence = 0
+
+    def add(self, run: Callable[..., T], *parents: SeedTask, inline: bool = False) -> SeedTask[T]:
+        """
+        Добавляет задачу в граф.
+
+        :param run: Функция задачи, получает результаты родительских задач.
+        :param parents: Задачи, от которых зависит добавляемая задача.
+        :param inline: Выполнять задачу сразу, не занимая слот in-flight.
+        :return: Объект SeedTask.
+        """
+        task = SeedTask(run=run, parents=parents, inline=inline)
+        if task.waiting == 0:
+            self.schedule(task)
+
+        return task
+
+    def schedule(self, task: SeedTask) -> None:
+        """
+        Ставит задачу, все родители которой завершены, в очередь на выполнение.
+        """
+        if task.inline:
+            self.complete(task, task.execute())
+            return
+
+        # heapq — min-heap, поэтому глубина берётся со знаком минус
+        heapq.heappush(self.ready, (-task.depth, self.sequence, task))
+        self.sequence += 1
+
+    def complete(self, task: SeedTask, result: Any) -> None:
+        """
+        Отмечает задачу завершённой и ставит в очередь дочерние задачи, которые больше ничего не ждут.
+        """
+        task.result = result
+        task.done = True
+
+        for child in task.children:
+            child.waiting -= 1
+            if child.waiting == 0:
+                self.schedule(child)
+
+    def imap(self, compile: Callable[[A], SeedTask[T]], items: Iterable[A]) -> Iterator[T]:
+        """
+        Лениво компилирует элементы в подграфы, выполняет их и отдаёт результаты в порядке элементов.
+
+        Args:
+            compile: Добавляет в граф задачи элемента и возвращает итоговую задачу подграфа
+            items: Элементы для обработки
+
+        Returns:
+            Iterator[T]: Результаты итоговых задач в порядке элементов
+        """
+        items = iter(items)
+        exhausted = False
+        inflight = 0
+
+        outputs: deque[SeedTask[T]] = deque()
+        finished: Queue = Queue()
+        group = Group()
+
+        def run(task: SeedTask) -> None:
+            try:
+                finished.put((task, task.execute(), None))
+            except Exception as error:
+                finished.put((task, None, error))
+
+        try:
+            while True:
+                # Заполняем свободные слоты: сначала готовые задачи, затем новые элементы
+                while inflight < self.concurrency:
+                    if self.ready:
+                        _, _, task = heapq.heappop(self.ready)
+                        if self.concurrency == 1:
+                            self.complete(task, task.execute())
+                        else:
+                            group.spawn(run, task)
+                            inflight += 1
+                        continue
+
+                    active = sum(1 for output in outputs if not output.done)
+                    if exhausted or active >= self.concurrency:
+                        break
+
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+
+                    outputs.append(compile(item))
+
+                while outputs and outputs[0].done:
+                    yield outputs.popleft().result
+
+                if inflight == 0:
+                    if exhausted and not outputs:
+                        return
+                    continue
+
+                task, result, error = finished.get()
+                inflight -= 1
+                if error is not None:
+                    raise error
+
+                self.complete(task, result)
+        finally:
+            # При ошибке или прерывании не оставляем работающих greenlet'ов
+            group.kill()
+            self.ready.clear()
@@ -0,0 +1,167 @@
+import random
+from collections import defaultdict
+from functools import lru_cache
+from typing import Generic, NamedTuple, TypeVar
+
+from seeds.records import SeedsRecords, USER_ACCOUNTS, ACCOUNT_CARDS, ACCOUNT_OPERATIONS
+from seeds.store import SeedsStore, SeedsStoreShard
+
+R = TypeVar("R")
+
+# Сколько раскладок пользователей по таблицам индекса держать в кэше (SeedsIndex.get_user_tables)
+SEEDS_INDEX_CACHE_SIZE = 1024
+
+
+class SeedAccountRecord(NamedTuple):
+    """Запись индекса счетов."""
+    user_id: str
+    account_id: str
+
+
+class SeedCardRecord(NamedTuple):
+    """Запись индекса карт: карта вместе со счётом, к которому она выпущена."""
+    user_id: str
+    account_id: str
+    card_id: str
+
+
+class SeedOperationRecord(NamedTuple):
+    """Запись индекса операций: операция вместе со счётом, по которому она выполнена."""
+    user_id: str
+    account_id: str
+    operation_id: str
+
+
+class SeedsIndexRecordNotFoundError(LookupError):
+    """
+    У пользователя сидинга нет записей нужного вида (например, кредитного счёта с физической картой).
+    """
+
+
+class SeedsIndexTable(Generic[R]):
+    """
+    Таблица индекса одного вида записей (например, кредитные счета или физические карты
+    кредитных счетов), разбитая по пользователям сидинга.
+
+    Таблица ничего не хранит сама: записи пользователя берутся из его раскладки
+    (SeedsIndex.get_user_tables), которая строится при первом обращении.
+
+    Attributes:
+        index: Индекс, которому принадлежит таблица
+        key: Ключ таблицы в индексе
+    """
+    __slots__ = ("index", "key")
+
+    def __init__(self, index: "SeedsIndex", key: str | tuple[str | None, str]):
+        self.index = index
+        self.key = key
+
+    def get_user_records(self, index: int) -> list[R]:
+        """
+        Возвращает записи пользователя.
+
+        :param index: Индекс пользователя в результате сидинга.
+        :return: Список записей (пустой, если у пользователя таких записей нет).
+        """
+        return self.index.get_user_tables(index).get(self.key, [])
+
+    def get_random_record(self, index: int) -> R:
+        """
+        Возвращает случайную запись пользователя.
+
+        Записи других пользователей не выдаются: их могут арендовать другие виртуальные
+        пользователи, и сценарий нарушил бы эксклюзивность аренды.
+
+        :param index: Индекс пользователя в результате сидинга.
+        :return: Запись индекса.
+        :raises SeedsIndexRecordNotFoundError: Если у пользователя нет таких записей.
+        """
+        records = self.get_user_records(index)
+        if not records:
+            raise SeedsIndexRecordNotFoundError(f"Seeded user {index} has no {self.key} records")
+
+        return records[random.randrange(len(records))]
+
+
+class SeedsIndex:
+    """
+    Индексы результата сидинга для выбора данных в сценариях.
+
+    Задачи сценариев выбирают счета, карты и операции пользователя из таблиц за O(1),
+    не обходя дерево моделей и не завязываясь на жёсткие пути вроде
+    credit_card_accounts[0].physical_cards[0].
+
+    Индекс строится лениво по пользователям: сущности пользователя раскладываются
+    по таблицам при первом обращении к нему, а последние cache_size раскладок кэшируются.
+    Весь результат сидинга в память не копируется, поэтому с SeedsStore (SEEDS.BACKEND=mmap)
+    данные по-прежнему читаются из файла по требованию.
+
+    Таблицы (ключи — имена полей моделей результата):
+    - accounts[account_type] — счета, например accounts["credit_card_accounts"]
+    - cards[account_type, card_type] — карты со счётом, например
+      cards["credit_card_accounts", "physical_cards"] — кредитные счета с физической картой
+    - operations[account_type, operation_type] — операции со счётом, например
+      operations["credit_card_accounts", "purchase_operations"]
+    - operations[None, operation_type] — операции этого типа по всем типам счетов пользователя
+
+    Индексы пользователей в таблицах совпадают с индексами в результате сидинга,
+    поэтому их можно использовать вместе с SeedUserLease.index.
+    """
+
+    def __init__(self, seeds: SeedsRecords | SeedsStore | SeedsStoreShard, cache_size: int = SEEDS_INDEX_CACHE_SIZE):
+        """
+        :param seeds: Результат сидинга (SeedsRecords, SeedsStore или SeedsStoreShard).
+        :param cache_size: Сколько раскладок пользователей держать в кэше.
+        """
+        self.seeds = seeds
+        self.users = len(seeds)
+
+        self.accounts: dict[str, SeedsIndexTable[SeedAccountRecord]] = {
+            account_type: SeedsIndexTable(self, account_type) for account_type in USER_ACCOUNTS
+        }
+        self.cards: dict[tuple[str, str], SeedsIndexTable[SeedCardRecord]] = {
+            (account_type, card_type): SeedsIndexTable(self, (account_type, card_type))
+            for account_type in USER_ACCOUNTS
+            for card_type in ACCOUNT_CARDS
+        }
+        self.operations: dict[tuple[str | None, str], SeedsIndexTable[SeedOperationRecord]] = {
+            (account_type, operation_type): SeedsIndexTable(self, (account_type, operation_type))
+            for account_type in (*USER_ACCOUNTS, None)
+            for operation_type in ACCOUNT_OPERATIONS
+        }
+
+        self.get_user_tables = lru_cache(maxsize=cache_size)(self.build_user_tables)
+
+    def build_user_tables(self, index: int) -> dict[str | tuple[str | None, str], list]:
+        """
+        Раскладывает сущности пользователя по таблицам индекса.
+
+        :param index: Индекс пользователя в результате сидинга.
+        :return: Записи пользователя по ключам таблиц (пустые таблицы отсутствуют).
+        """
+        user = self.seeds.get_user(index)
+        tables: defaultdict[str | tuple[str | None, str], list] = defaultdict(list)
+
+        for account_type in USER_ACCOUNTS:
+            for account in getattr(user, account_type):
+                tables[account_type].append(SeedAccountRecord(user_id=user.user_id, account_id=account.account_id))
+
+                for card_type in ACCOUNT_CARDS:
+                    tables[account_type, card_type].extend(
+                        SeedCardRecord(user_id=user.user_id, account_id=account.account_id, card_id=card.card_id)
+                        for card in getattr(account, card_type)
+                    )
+
+                for operation_type in ACCOUNT_OPERATIONS:
+                    records = [
+                        SeedOperationRecord(
+                            user_id=user.user_id,
+                            account_id=account.account_id,
+                            operation_id=operation.operation_id
+                        )
+                        for operation in getattr(account, operation_type)
+                    ]
+                    tables[account_type, operation_type].extend(records)
+                    tables[None, operation_type].extend(records)
+
+        return dict(tables)
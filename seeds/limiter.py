@@ -0,0 +1,263 @@
+import time
+from collections import deque
+from typing import Any, Callable, TypeVar
+
+import gevent
+from gevent.event import AsyncResult
+from pydantic import BaseModel
+
+from clients.errors import REQUEST_ERRORS, RETRY_BACKOFF
+from config import settings
+from seeds.telemetry import SeedsTelemetry
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_LIMITER")
+
+T = TypeVar("T")
+
+# Сколько вызовов одного метода подряд должны превысить допустимую задержку, чтобы считать это перегрузкой:
+# одиночные выбросы задержки (GC, планировщик) не должны уменьшать лимит
+LATENCY_INFLATION_STREAK = 3
+
+
+class SeedsLimiterStats(BaseModel):
+    """
+    Статистика ограничителя запросов сидинга.
+
+    Attributes:
+        limit (int): Текущий лимит одновременных запросов (к чему сошёлся AIMD).
+        max_limit (int): Верхняя граница лимита.
+        requests (int): Сколько запросов выполнено успешно.
+        errors (int): Сколько запросов завершилось ошибкой.
+        retries (int): Сколько раз запросы повторялись.
+        decreases (int): Сколько раз лимит уменьшался из-за перегрузки.
+        throughput (float): Средняя пропускная способность (успешных запросов в секунду).
+        min_latency (float): Минимальная наблюдаемая задержка запроса (в секундах).
+    """
+    limit: int
+    max_limit: int
+    requests: int
+    errors: int
+    retries: int
+    decreases: int
+    throughput: float
+    min_latency: float
+
+
+class SeedsLimiter:
+    """
+    Ограничитель одновременных запросов сидинга к системе.
+
+    В фиксированном режиме работает как семафор на concurrency запросов.
+    В адаптивном режиме лимит подбирается по схеме AIMD (additive increase,
+    multiplicative decrease) в пределах 1..concurrency:
+    - пока перегрузки не было, лимит растёт на 1 за каждый успешный запрос (slow start)
+    - затем лимит растёт примерно на 1 за каждые limit успешных запросов
+    - при ошибке или при задержке больше latency_tolerance * минимальная задержка того же метода
+      у LATENCY_INFLATION_STREAK вызовов подряд лимит умножается на backoff
+
+    Базовая (минимальная) задержка ведётся отдельно для каждого ключа вызова (как
+    в телеметрии): иначе медленные методы (создание операций, выпуск карт) сравнивались бы
+    с самым быстрым (create_user) и постоянно считались бы перегрузкой.
+
+    Сигналы от запросов, начатых до последнего уменьшения, игнорируются,
+    чтобы одна волна таймаутов не обрушила лимит до единицы.
+    """
+
+    def __init__(
+            self,
+            concurrency: int = 1,
+            adaptive: bool = False,
+            latency_tolerance: float = 2.0,
+            backoff: float = 0.5,
+            retries: int = 0,
+            telemetry: SeedsTelemetry | None = None
+    ):
+        """
+        :param concurrency: Максимальное количество одновременных запросов.
+        :param adaptive: Подбирать лимит автоматически (AIMD).
+        :param latency_tolerance: Во сколько раз задержка может превысить минимальную до сигнала перегрузки.
+        :param backoff: Множитель лимита при перегрузке.
+        :param retries: Сколько раз повторять запрос, завершившийся ошибкой.
+        :param telemetry: Телеметрия вызовов по методам (по умолчанию — без вывода прогресса).
+        """
+        self.max_limit = concurrency
+        self.adaptive = adaptive
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.retries = retries
+        self.telemetry = telemetry or SeedsTelemetry()
+
+        self.limit = 1.0 if adaptive else float(concurrency)
+        self.slow_start = adaptive
+        self.epoch = 0
+
+        self.inflight = 0
+        self.waiters: deque[AsyncResult] = deque()
+
+        self.requests = 0
+        self.errors = 0
+        self.retried = 0
+        self.decreases = 0
+        self.min_latency = float("inf")
+        self.min_latencies: dict[str, float] = {}
+        self.inflated: dict[str, int] = {}
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+    def acquire(self) -> None:
+        """
+        Занимает слот запроса, ожидая, пока количество запросов станет меньше лимита.
+        """
+        if self.started_at is None:
+            self.started_at = time.perf_counter()
+
+        if not self.waiters and self.inflight < int(self.limit):
+            self.inflight += 1
+            return
+
+        # Слот передаётся ожидающему в release (inflight увеличивается там же)
+        waiter = AsyncResult()
+        self.waiters.append(waiter)
+        try:
+            waiter.get()
+        except BaseException:
+            if waiter.ready():
+                self.release()
+            else:
+                self.waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """
+        Освобождает слот запроса и передаёт свободные слоты ожидающим.
+        """
+        self.inflight -= 1
+        self.finished_at = time.perf_counter()
+        self.wake()
+
+    def wake(self) -> None:
+        """Передаёт ожидающим слоты, свободные в пределах текущего лимита."""
+        while self.waiters and self.inflight < int(self.limit):
+            self.inflight += 1
+            self.waiters.popleft().set()
+
+    def increase(self) -> None:
+        """Аддитивно увеличивает лимит после успешного запроса."""
+        if self.slow_start:
+            self.limit = min(self.limit + 1, self.max_limit)
+        else:
+            self.limit = min(self.limit + 1 / self.limit, self.max_limit)
+
+        self.wake()
+
+    def decrease(self, epoch: int) -> None:
+        """Мультипликативно уменьшает лимит при перегрузке (не чаще одного раза за эпоху)."""
+        if epoch != self.epoch:
+            return
+
+        self.limit = max(self.limit * self.backoff, 1.0)
+        self.slow_start = False
+        self.epoch += 1
+        self.decreases += 1
+
+    def call(self, func: Callable[..., T], *args: Any, key: str | None = None, **kwargs: Any) -> T:
+        """
+        Выполняет запрос к системе в пределах лимита.
+
+        Запросы, завершившиеся ошибкой из REQUEST_ERRORS (clients/errors.py), повторяются до retries раз
+        с экспоненциальной паузой. В адаптивном режиме задержка и ошибки запроса
+        используются для подстройки лимита. Задержка и ошибки каждого вызова учитываются
+        в телеметрии по ключу вызова.
+
+        :param func: Функция запроса (метод клиента).
+        :param args: Позиционные аргументы запроса.
+        :param key: Ключ вызова в телеметрии и базовой задержке (по умолчанию имя функции запроса).
+            Нужен, когда один метод клиента создаёт сущности разных типов.
+        :param kwargs: Именованные аргументы запроса.
+        :return: Ответ системы.
+        """
+        key = key or func.__name__
+        attempt = 0
+        while True:
+            self.acquire()
+            epoch = self.epoch
+            started_at = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except REQUEST_ERRORS:
+                self.release()
+                self.errors += 1
+                self.telemetry.record_error(key)
+                if self.adaptive:
+                    self.decrease(epoch)
+                if attempt >= self.retries:
+                    raise
+
+                gevent.sleep(RETRY_BACKOFF * 2 ** attempt)
+                attempt += 1
+                self.retried += 1
+                continue
+            except BaseException:
+                self.release()
+                raise
+
+            latency = time.perf_counter() - started_at
+            self.release()
+            self.requests += 1
+            self.min_latency = min(self.min_latency, latency)
+            self.telemetry.record(key, latency)
+
+            baseline = min(self.min_latencies.get(key, latency), latency)
+            self.min_latencies[key] = baseline
+
+            if self.adaptive:
+                if latency > baseline * self.latency_tolerance:
+                    self.inflated[key] = self.inflated.get(key, 0) + 1
+                    if self.inflated[key] >= LATENCY_INFLATION_STREAK:
+                        self.inflated[key] = 0
+                        self.decrease(epoch)
+                else:
+                    self.inflated[key] = 0
+                    self.increase()
+
+            return result
+
+    def get_stats(self) -> SeedsLimiterStats:
+        """
+        Собирает статистику ограничителя.
+
+        :return: Объект SeedsLimiterStats.
+        """
+        elapsed = (self.finished_at or 0.0) - (self.started_at or 0.0)
+
+        return SeedsLimiterStats(
+            limit=int(self.limit),
+            max_limit=self.max_limit,
+            requests=self.requests,
+            errors=self.errors,
+            retries=self.retried,
+            decreases=self.decreases,
+            throughput=self.requests / elapsed if elapsed > 0 else 0.0,
+            min_latency=self.min_latency if self.requests else 0.0
+        )
+
+    def log_stats(self) -> None:
+        """
+        Выводит статистику ограничителя в лог.
+        """
+        logger.info(f"Seeding limiter stats: {self.get_stats().model_dump_json()}")
+
+
+def build_seeds_limiter() -> SeedsLimiter:
+    """
+    Фабрика ограничителя запросов сидинга. Параметры берутся из settings.seeds.
+    """
+    return SeedsLimiter(
+        concurrency=settings.seeds.concurrency,
+        adaptive=settings.seeds.adaptive,
+        latency_tolerance=settings.seeds.adaptive_latency_tolerance,
+        backoff=settings.seeds.adaptive_backoff,
+        retries=settings.seeds.retries,
+        telemetry=SeedsTelemetry(progress_interval=settings.seeds.progress_interval)
+    )
@@ -0,0 +1,195 @@
+import math
+from array import array
+
+from gevent.queue import Queue, Empty
+from pydantic import BaseModel
+
+from seeds.index import SeedsIndex
+from seeds.sampler import SeedsSampler
+from seeds.records import SeedsRecords, SeedUser
+from seeds.store import SeedsStore, SeedsStoreShard
+from tools.config.seeds import SeedsPoolExhaustion
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_POOL")
+
+
+class SeedUsersPoolExhaustedError(Exception):
+    """
+    Все пользователи пула выданы, а политика исчерпания — FAIL (или истёк таймаут ожидания).
+    """
+
+
+class SeedUserLease:
+    """
+    Аренда пользователя из пула. Возвращается в пул через SeedUsersPool.checkin.
+
+    Attributes:
+        index: Индекс пользователя в результате сидинга
+        user: Арендованный пользователь
+    """
+    __slots__ = ("index", "user")
+
+    def __init__(self, index: int, user: SeedUser):
+        self.index = index
+        self.user = user
+
+
+class SeedUsersPoolStats(BaseModel):
+    """
+    Статистика использования пула пользователей.
+
+    Attributes:
+        users (int): Сколько пользователей в пуле.
+        leased (int): Сколько пользователей арендовано прямо сейчас.
+        checkouts (int): Сколько всего было выдач.
+        recycled (int): Сколько выдач пришлось на уже арендованных пользователей (политика RECYCLE).
+        coverage (float): Доля пользователей, которые были выданы хотя бы раз.
+        min_leases (int): Минимальное количество выдач одного пользователя.
+        max_leases (int): Максимальное количество выдач одного пользователя.
+        mean_leases (float): Среднее количество выдач на пользователя.
+        stdev_leases (float): Стандартное отклонение количества выдач (чем меньше, тем равномернее).
+    """
+    users: int
+    leased: int
+    checkouts: int
+    recycled: int
+    coverage: float
+    min_leases: int
+    max_leases: int
+    mean_leases: float
+    stdev_leases: float
+
+
+class SeedUsersPool:
+    """
+    Пул эксклюзивной аренды пользователей из результата сидинга.
+
+    В отличие от SeedsRecords.get_random_user, один пользователь одновременно выдаётся
+    только одному виртуальному пользователю Locust, а в отличие от SeedsRecords.get_next_user,
+    пользователей можно возвращать обратно. Выдача и возврат — O(1): в пуле хранятся
+    только индексы свободных пользователей, сами пользователи берутся из результата сидинга
+    (SeedsRecords, SeedsStore или SeedsStoreShard) в момент выдачи.
+
+    Что делать, если свободных пользователей не осталось, задаёт политика исчерпания:
+    - BLOCK — ждать, пока кто-то вернёт пользователя
+    - RECYCLE — выдать уже арендованного пользователя (по кругу)
+    - FAIL — бросить SeedUsersPoolExhaustedError
+
+    Вместе с пулом создаётся SeedsIndex (pool.index), из которого сценарии выбирают
+    счета, карты и операции арендованного пользователя (индекс строится по пользователям лениво).
+
+    Если передан sampler, задачи чтения через access() обращаются не к арендованному
+    пользователю, а к пользователю, выбранному с заданной популярностью ключей (Zipf,
+    горячий набор, скользящее окно). Так кэши системы видят реалистичный перекос обращений.
+    """
+
+    def __init__(
+            self,
+            seeds: SeedsRecords | SeedsStore | SeedsStoreShard,
+            exhaustion: SeedsPoolExhaustion = SeedsPoolExhaustion.RECYCLE,
+            timeout: float | None = None,
+            sampler: SeedsSampler | None = None
+    ):
+        """
+        :param seeds: Результат сидинга, из которого выдаются пользователи.
+        :param exhaustion: Политика при исчерпании свободных пользователей.
+        :param timeout: Максимальное время ожидания для политики BLOCK (None — без ограничения).
+        :param sampler: Распределение популярности пользователей для access (None — арендованный пользователь).
+        """
+        self.seeds = seeds
+        self.exhaustion = exhaustion
+        self.timeout = timeout
+        self.sampler = sampler
+        self.index = SeedsIndex(seeds)
+
+        self.free: Queue = Queue(items=range(len(seeds)))
+        # Количество активных аренд и общее количество выдач по каждому пользователю
+        self.active = array("I", bytes(4 * len(seeds)))
+        self.leases = array("I", bytes(4 * len(seeds)))
+
+        self.checkouts = 0
+        self.recycled = 0
+        self.recycle_cursor = 0
+
+    def checkout(self) -> SeedUserLease:
+        """
+        Выдаёт пользователя в эксклюзивную аренду.
+
+        :return: Объект SeedUserLease с арендованным пользователем.
+        :raises SeedUsersPoolExhaustedError: Если свободных пользователей нет и ждать нельзя.
+        """
+        try:
+            if self.exhaustion == SeedsPoolExhaustion.BLOCK:
+                index = self.free.get(timeout=self.timeout)
+            else:
+                index = self.free.get_nowait()
+        except Empty:
+            if self.exhaustion != SeedsPoolExhaustion.RECYCLE or len(self.seeds) == 0:
+                raise SeedUsersPoolExhaustedError(f"All {len(self.seeds)} seeded users are leased")
+
+            index = self.recycle_cursor
+            self.recycle_cursor = (self.recycle_cursor + 1) % len(self.seeds)
+            self.recycled += 1
+
+        self.active[index] += 1
+        self.leases[index] += 1
+        self.checkouts += 1
+
+        return SeedUserLease(index=index, user=self.seeds.get_user(index))
+
+    def checkin(self, lease: SeedUserLease) -> None:
+        """
+        Возвращает пользователя в пул. Пользователь снова становится свободным,
+        когда возвращены все его аренды.
+
+        :param lease: Аренда, полученная через checkout.
+        """
+        self.active[lease.index] -= 1
+        if self.active[lease.index] == 0:
+            self.free.put_nowait(lease.index)
+
+    def access(self, lease: SeedUserLease) -> SeedUserLease:
+        """
+        Выбирает пользователя для задачи чтения.
+
+        Без sampler возвращает саму аренду. С sampler возвращает неэксклюзивный доступ
+        к пользователю, выбранному по распределению популярности: его не нужно возвращать
+        через checkin, и для задач записи он не подходит.
+
+        :param lease: Аренда виртуального пользователя.
+        :return: Объект SeedUserLease с пользователем для чтения.
+        """
+        if self.sampler is None:
+            return lease
+
+        index = self.sampler.sample()
+        return SeedUserLease(index=index, user=self.seeds.get_user(index))
+
+    def get_stats(self) -> SeedUsersPoolStats:
+        """
+        Считает статистику равномерности использования пользователей.
+
+        :return: Объект SeedUsersPoolStats.
+        """
+        users = len(self.leases)
+        mean = self.checkouts / users if users else 0.0
+        variance = sum((leases - mean) ** 2 for leases in self.leases) / users if users else 0.0
+
+        return SeedUsersPoolStats(
+            users=users,
+            leased=sum(1 for active in self.active if active),
+            checkouts=self.checkouts,
+            recycled=self.recycled,
+            coverage=sum(1 for leases in self.leases if leases) / users if users else 0.0,
+            min_leases=min(self.leases, default=0),
+            max_leases=max(self.leases, default=0),
+            mean_leases=mean,
+            stdev_leases=math.sqrt(variance)
+        )
+
+    def log_stats(self) -> None:
+        """
+        Выводит статистику пула в лог.
+        """
+        logger.info(f"Seed users pool stats: {self.get_stats().model_dump_json()}")
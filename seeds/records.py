@@ -0,0 +1,254 @@
+import random
+from typing import Any, Iterable
+
+from seeds.schema.result import (
+    SeedsResult,
+    SeedUserResult,
+    SeedAccountResult,
+    SeedCardResult,
+    SeedOperationResult
+)
+
+# Группы счетов пользователя, карт и операций счёта (имена полей совпадают с моделями результата)
+USER_ACCOUNTS = ("deposit_accounts", "savings_accounts", "debit_card_accounts", "credit_card_accounts")
+ACCOUNT_CARDS = ("physical_cards", "virtual_cards")
+ACCOUNT_OPERATIONS = (
+    "top_up_operations",
+    "purchase_operations",
+    "transfer_operations",
+    "cash_withdrawal_operations"
+)
+
+
+class SeedCard:
+    """
+    Карта пользователя сидинга во время теста.
+
+    Attributes:
+        card_id: ID карты
+    """
+    __slots__ = ("card_id",)
+
+    def __init__(self, card_id: str):
+        self.card_id = card_id
+
+
+class SeedOperation:
+    """
+    Операция пользователя сидинга во время теста.
+
+    Attributes:
+        operation_id: ID операции
+    """
+    __slots__ = ("operation_id",)
+
+    def __init__(self, operation_id: str):
+        self.operation_id = operation_id
+
+
+class SeedAccount:
+    """
+    Счёт пользователя сидинга во время теста: ID счёта, карты и операции.
+
+    Поля совпадают с SeedAccountResult, но хранятся в __slots__ и кортежах:
+    без валидации, словаря атрибутов и служебных полей pydantic.
+    """
+    __slots__ = ("account_id", *ACCOUNT_CARDS, *ACCOUNT_OPERATIONS)
+
+    def __init__(
+            self,
+            account_id: str,
+            physical_cards: tuple[SeedCard, ...] = (),
+            virtual_cards: tuple[SeedCard, ...] = (),
+            top_up_operations: tuple[SeedOperation, ...] = (),
+            purchase_operations: tuple[SeedOperation, ...] = (),
+            transfer_operations: tuple[SeedOperation, ...] = (),
+            cash_withdrawal_operations: tuple[SeedOperation, ...] = ()
+    ):
+        self.account_id = account_id
+        self.physical_cards = physical_cards
+        self.virtual_cards = virtual_cards
+        self.top_up_operations = top_up_operations
+        self.purchase_operations = purchase_operations
+        self.transfer_operations = transfer_operations
+        self.cash_withdrawal_operations = cash_withdrawal_operations
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SeedAccount":
+        """
+        Создаёт счёт из словаря в формате дампа (результат json.loads строки дампа).
+        """
+        return cls(
+            data["account_id"],
+            *(tuple(SeedCard(card["card_id"]) for card in data.get(name, ())) for name in ACCOUNT_CARDS),
+            *(
+                tuple(SeedOperation(operation["operation_id"]) for operation in data.get(name, ()))
+                for name in ACCOUNT_OPERATIONS
+            )
+        )
+
+    @classmethod
+    def from_result(cls, account: SeedAccountResult) -> "SeedAccount":
+        """
+        Создаёт счёт из pydantic-модели результата сидинга.
+        """
+        return cls(
+            account.account_id,
+            *(tuple(SeedCard(card.card_id) for card in getattr(account, name)) for name in ACCOUNT_CARDS),
+            *(
+                tuple(SeedOperation(operation.operation_id) for operation in getattr(account, name))
+                for name in ACCOUNT_OPERATIONS
+            )
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Возвращает счёт в формате дампа.
+        """
+        data: dict[str, Any] = {"account_id": self.account_id}
+        for name in ACCOUNT_CARDS:
+            data[name] = [{"card_id": card.card_id} for card in getattr(self, name)]
+        for name in ACCOUNT_OPERATIONS:
+            data[name] = [{"operation_id": operation.operation_id} for operation in getattr(self, name)]
+        return data
+
+    def to_result(self) -> SeedAccountResult:
+        """
+        Возвращает счёт в виде pydantic-модели результата сидинга.
+        """
+        return SeedAccountResult.model_construct(
+            account_id=self.account_id,
+            **{
+                name: [SeedCardResult.model_construct(card_id=card.card_id) for card in getattr(self, name)]
+                for name in ACCOUNT_CARDS
+            },
+            **{
+                name: [
+                    SeedOperationResult.model_construct(operation_id=operation.operation_id)
+                    for operation in getattr(self, name)
+                ]
+                for name in ACCOUNT_OPERATIONS
+            }
+        )
+
+
+class SeedUser:
+    """
+    Пользователь сидинга во время теста: ID пользователя и счета каждого типа.
+
+    Поля совпадают с SeedUserResult, поэтому сценарии и индексы работают с ним так же
+    (seed_user.credit_card_accounts, account.physical_cards и т.д.).
+    """
+    __slots__ = ("user_id", *USER_ACCOUNTS)
+
+    def __init__(
+            self,
+            user_id: str,
+            deposit_accounts: tuple[SeedAccount, ...] = (),
+            savings_accounts: tuple[SeedAccount, ...] = (),
+            debit_card_accounts: tuple[SeedAccount, ...] = (),
+            credit_card_accounts: tuple[SeedAccount, ...] = ()
+    ):
+        self.user_id = user_id
+        self.deposit_accounts = deposit_accounts
+        self.savings_accounts = savings_accounts
+        self.debit_card_accounts = debit_card_accounts
+        self.credit_card_accounts = credit_card_accounts
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SeedUser":
+        """
+        Создаёт пользователя из словаря в формате дампа (результат json.loads строки дампа).
+        """
+        return cls(
+            data["user_id"],
+            *(tuple(SeedAccount.from_dict(account) for account in data.get(name, ())) for name in USER_ACCOUNTS)
+        )
+
+    @classmethod
+    def from_result(cls, user: SeedUserResult) -> "SeedUser":
+        """
+        Создаёт пользователя из pydantic-модели результата сидинга.
+        """
+        return cls(
+            user.user_id,
+            *(tuple(SeedAccount.from_result(account) for account in getattr(user, name)) for name in USER_ACCOUNTS)
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Возвращает пользователя в формате дампа.
+        """
+        data: dict[str, Any] = {"user_id": self.user_id}
+        for name in USER_ACCOUNTS:
+            data[name] = [account.to_dict() for account in getattr(self, name)]
+        return data
+
+    def to_result(self) -> SeedUserResult:
+        """
+        Возвращает пользователя в виде pydantic-модели результата сидинга.
+        """
+        return SeedUserResult.model_construct(
+            user_id=self.user_id,
+            **{name: [account.to_result() for account in getattr(self, name)] for name in USER_ACCOUNTS}
+        )
+
+
+class SeedsRecords:
+    """
+    Результат сидинга во время теста.
+
+    Повторяет интерфейс SeedsResult (len, get_user, get_next_user, get_random_user),
+    но хранит пользователей в SeedUser со __slots__ вместо pydantic-моделей: в несколько раз
+    меньше памяти на пользователя и загрузка без валидации. Pydantic-схема из seeds/schema/result.py
+    используется только на границе с файлами (сидинг, дампы), см. from_result и to_result.
+
+    Attributes:
+        users: Пользователи сидинга
+    """
+    __slots__ = ("users",)
+
+    def __init__(self, users: Iterable[SeedUser] = ()):
+        self.users: list[SeedUser] = list(users)
+
+    def __len__(self) -> int:
+        """Количество пользователей в результате сидинга."""
+        return len(self.users)
+
+    @classmethod
+    def from_dicts(cls, users: Iterable[dict[str, Any]]) -> "SeedsRecords":
+        """
+        Создаёт результат из словарей в формате дампа.
+        """
+        return cls(SeedUser.from_dict(user) for user in users)
+
+    @classmethod
+    def from_result(cls, result: SeedsResult) -> "SeedsRecords":
+        """
+        Создаёт результат из pydantic-модели результата сидинга.
+        """
+        return cls(SeedUser.from_result(user) for user in result.users)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """
+        Возвращает пользователей в формате дампа (например, для отправки по сети).
+        """
+        return [user.to_dict() for user in self.users]
+
+    def to_result(self) -> SeedsResult:
+        """
+        Возвращает результат в виде pydantic-модели результата сидинга.
+        """
+        return SeedsResult.model_construct(users=[user.to_result() for user in self.users])
+
+    def get_user(self, index: int) -> SeedUser:
+        """Возвращает пользователя по его индексу без удаления."""
+        return self.users[index]
+
+    def get_next_user(self) -> SeedUser:
+        """Возвращает и удаляет первого пользователя из списка."""
+        return self.users.pop(0)
+
+    def get_random_user(self) -> SeedUser:
+        """Возвращает случайного пользователя из списка без удаления."""
+        return random.choice(self.users)
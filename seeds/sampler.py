@@ -0,0 +1,145 @@
+import math
+import random
+import time
+from array import array
+
+from tools.config.seeds import SeedsAccessDistribution
+
+
+class SeedsAliasTable:
+    """
+    Таблица псевдонимов (метод Vose) для выбора индекса с заданными весами за O(1).
+
+    Строится один раз за O(n): каждому индексу соответствует корзина с вероятностью
+    остаться в нём (prob) и индексом-псевдонимом (alias), в который уходит остаток корзины.
+    Выбор — одна случайная корзина и одно сравнение.
+
+    Attributes:
+        prob: Вероятность выбрать сам индекс корзины
+        alias: Индекс, выбираемый с вероятностью 1 - prob
+    """
+    __slots__ = ("prob", "alias")
+
+    def __init__(self, weights: list[float]):
+        """
+        :param weights: Неотрицательные веса индексов (сумма должна быть больше нуля).
+        """
+        count = len(weights)
+        total = sum(weights)
+        if count == 0 or total <= 0:
+            raise ValueError("Alias table requires at least one positive weight")
+
+        scaled = [weight * count / total for weight in weights]
+        self.prob = array("d", bytes(8 * count))
+        self.alias = array("I", range(count))
+
+        small = [index for index, weight in enumerate(scaled) if weight < 1]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+
+        # Оставшиеся корзины заполнены целиком (с точностью до погрешности округления)
+        for index in (*small, *large):
+            self.prob[index] = 1.0
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def sample(self, rng: random.Random) -> int:
+        """
+        Выбирает индекс с вероятностью, пропорциональной его весу.
+
+        :param rng: Генератор случайных чисел.
+        :return: Индекс от 0 до len(weights) - 1.
+        """
+        index = rng.randrange(len(self.prob))
+        return index if rng.random() < self.prob[index] else self.alias[index]
+
+
+class SeedsSampler:
+    """
+    Выбор сущностей сидинга с заданным распределением популярности ключей.
+
+    Равномерный выбор даёт кэшам системы (Redis, PostgreSQL) нереалистично плоский
+    профиль обращений. Сэмплер позволяет задать перекос:
+    - UNIFORM — все ключи одинаково популярны
+    - ZIPF — популярность ключа ранга r пропорциональна 1 / r ** zipf_exponent
+    - HOT_SET — доля hot_fraction ключей получает долю hot_weight всех обращений
+    - WORKING_SET — обращения равномерны внутри окна из working_set_size ключей,
+      которое сдвигается на working_set_speed ключей в секунду
+
+    Ранги ключей назначаются случайной перестановкой с фиксированным seed, поэтому «горячие»
+    пользователи не совпадают с первыми созданными, а при одинаковом seed набор горячих
+    ключей воспроизводится между запусками. ZIPF и HOT_SET выбирают ключ через
+    SeedsAliasTable, WORKING_SET — арифметикой окна; оба варианта O(1) на выбор.
+    """
+
+    def __init__(
+            self,
+            count: int,
+            distribution: SeedsAccessDistribution = SeedsAccessDistribution.UNIFORM,
+            zipf_exponent: float = 1.0,
+            hot_fraction: float = 0.2,
+            hot_weight: float = 0.8,
+            working_set_size: int = 100,
+            working_set_speed: float = 1.0,
+            seed: int = 0
+    ):
+        """
+        :param count: Количество ключей (пользователей сидинга).
+        :param distribution: Распределение популярности ключей.
+        :param zipf_exponent: Показатель степени для ZIPF.
+        :param hot_fraction: Доля горячих ключей для HOT_SET.
+        :param hot_weight: Доля обращений к горячим ключам для HOT_SET.
+        :param working_set_size: Размер рабочего окна для WORKING_SET.
+        :param working_set_speed: Скорость сдвига окна WORKING_SET (ключей в секунду).
+        :param seed: Seed перестановки рангов ключей.
+        """
+        self.count = count
+        self.distribution = distribution
+        self.working_set_size = min(working_set_size, count)
+        self.working_set_speed = working_set_speed
+        self.started_at = time.monotonic()
+
+        self.rng = random.Random()
+        self.ranks = array("I", range(count))
+        random.Random(seed).shuffle(self.ranks)
+
+        self.table: SeedsAliasTable | None = None
+        if count == 0:
+            return
+
+        match distribution:
+            case SeedsAccessDistribution.ZIPF:
+                self.table = SeedsAliasTable([1 / rank ** zipf_exponent for rank in range(1, count + 1)])
+            case SeedsAccessDistribution.HOT_SET:
+                hot = min(max(math.ceil(count * hot_fraction), 1), count)
+                cold = count - hot
+                hot_key_weight = hot_weight / hot
+                cold_key_weight = (1 - hot_weight) / cold if cold else 0.0
+                self.table = SeedsAliasTable([hot_key_weight] * hot + [cold_key_weight] * cold)
+
+    def sample(self) -> int:
+        """
+        Выбирает индекс пользователя сидинга.
+
+        :return: Индекс пользователя в результате сидинга.
+        :raises IndexError: Если выбирать не из кого.
+        """
+        if self.count == 0:
+            raise IndexError("Cannot sample from empty seeds")
+
+        if self.table is not None:
+            return self.ranks[self.table.sample(self.rng)]
+
+        if self.distribution == SeedsAccessDistribution.WORKING_SET:
+            start = int((time.monotonic() - self.started_at) * self.working_set_speed)
+            return self.ranks[(start + self.rng.randrange(self.working_set_size)) % self.count]
+
+        return self.rng.randrange(self.count)
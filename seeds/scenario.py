@@ -1,9 +1,30 @@
+import random
 from abc import ABC, abstractmethod
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
 
-from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from config import settings
+from tools.config.seeds import SeedsBackend
+from seeds.builder import build_seeds_builder
+from seeds.dumps import (
+    save_seeds_result,
+    load_seeds_records,
+    iter_seeds_users,
+    save_seeds_plan_hash,
+    load_seeds_plan_hash,
+    save_seeds_telemetry,
+    load_seeds_telemetry,
+    seeds_result_exists,
+    get_seeds_result_file,
+    SeedsJournal,
+    SeedsWriter
+)
 from seeds.schema.plan import SeedsPlan
-from seeds.schema.result import SeedsResult
+from seeds.estimator import estimate_seeds_plan, load_seeds_latencies
+from seeds.records import SeedsRecords
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.store import SeedsStore, save_seeds_store, get_seeds_store_file, is_seeds_store_file
 from tools.logger import get_logger
 
 # Инициализируем логгер с именем SEEDS_SCENARIO
@@ -19,9 +40,10 @@ class SeedsScenario(ABC):
     def __init__(self):
         """
         Инициализация класса SeedsScenario.
-        Создаёт экземпляр билдера для генерации сидинговых данных через gRPC.
+        Создаёт экземпляр билдера для генерации сидинговых данных
+        через клиентов, выбранных в настройке SEEDS.CLIENT (по умолчанию — gRPC gateway).
         """
-        self.builder = build_grpc_seeds_builder()
+        self.builder = build_seeds_builder()
 
     @property
     @abstractmethod
@@ -52,29 +74,203 @@ class SeedsScenario(ABC):
         # Логируем успешное завершение
         logger.info(f"[{self.scenario}] Seeding result saved successfully.")
 
-    def load(self) -> SeedsResult:
+    def load(self) -> SeedsRecords | SeedsStore:
         """
         Загружает результаты сидинга из файла.
-        :return: Объект SeedsResult, содержащий данные, загруженные из файла.
+
+        Для теста дамп загружается не в pydantic-модели, а в облегчённые записи SeedsRecords.
+        При SEEDS.BACKEND=mmap вместо SeedsRecords возвращается SeedsStore: дамп один раз
+        конвертируется в бинарный файл, который затем открывается через mmap.
+        :return: Объект SeedsRecords или SeedsStore с данными, загруженными из файла.
         """
         # Логируем начало загрузки
         logger.info(f"[{self.scenario}] Loading seeding result from file.")
-        result = load_seeds_result(scenario=self.scenario)
+        if settings.seeds.backend == SeedsBackend.MMAP:
+            result = self.load_store()
+        else:
+            result = load_seeds_records(scenario=self.scenario)
         # Логируем успешную загрузку
         logger.info(f"[{self.scenario}] Seeding result loaded successfully.")
         return result
 
+    def load_store(self) -> SeedsStore:
+        """
+        Открывает бинарное хранилище сидинга, при необходимости пересобирая его из дампа.
+        :return: Объект SeedsStore.
+        """
+        store_file = get_seeds_store_file(scenario=self.scenario)
+        seeds_file = get_seeds_result_file(scenario=self.scenario)
+
+        # Хранилище пересобирается, если оно старше дампа или записано в прежнем формате
+        outdated = not store_file.exists() or store_file.stat().st_mtime < seeds_file.stat().st_mtime
+        if outdated or not is_seeds_store_file(store_file):
+            save_seeds_store(users=iter_seeds_users(scenario=self.scenario), scenario=self.scenario)
+
+        return SeedsStore.open(scenario=self.scenario)
+
+    def check_users(self, users: Iterable[SeedUserResult]) -> bool:
+        """
+        Проверяет, что выборка пользователей из дампа всё ещё существует в системе.
+        Размер выборки задаётся SEEDS.CACHE_CHECK_SAMPLE, значение 0 отключает проверку.
+        Выборка собирается за один проход (reservoir sampling), дамп целиком в память не загружается.
+        :param users: Пользователи, прочитанные из дампа.
+        :return: True, если все проверенные пользователи найдены.
+        """
+        sample_size = settings.seeds.cache_check_sample
+        if sample_size == 0:
+            return True
+
+        sample: list[SeedUserResult] = []
+        for index, user in enumerate(users):
+            if index < sample_size:
+                sample.append(user)
+                continue
+
+            position = random.randint(0, index)
+            if position < sample_size:
+                sample[position] = user
+
+        if not all(self.builder.check_user(user) for user in sample):
+            logger.warning(f"[{self.scenario}] Seeded users from dump were not found, dump is outdated.")
+            return False
+
+        return True
+
+    def is_cached(self) -> bool:
+        """
+        Проверяет, можно ли переиспользовать существующий дамп вместо повторного сидинга.
+        Дамп переиспользуется, если он построен по плану с тем же хэшем и прошёл проверку check_users.
+        :return: True, если дамп актуален.
+        """
+        if load_seeds_plan_hash(scenario=self.scenario) != self.plan.get_hash():
+            return False
+
+        return self.check_users(iter_seeds_users(scenario=self.scenario))
+
+    def can_top_up(self) -> bool:
+        """
+        Проверяет, есть ли существующий дамп, который можно дозаполнить до текущего плана.
+        :return: True, если дамп есть и он не устарел.
+        """
+        if not seeds_result_exists(scenario=self.scenario):
+            return False
+
+        return self.check_users(iter_seeds_users(scenario=self.scenario))
+
+    def build_journaled(self) -> Iterator[SeedUserResult]:
+        """
+        Генерирует данные с ведением журнала сидинга.
+
+        Каждый созданный пользователь сразу дописывается в журнал. Если предыдущий запуск
+        был прерван, уже созданные пользователи берутся из журнала, а билдер создаёт только
+        оставшихся. Пользователи отдаются по мере готовности, прогресс выводит вызывающий код (build).
+        :return: Все пользователи плана: сначала из журнала, затем созданные в этом запуске.
+        """
+        with SeedsJournal(plan=self.plan, scenario=self.scenario) as journal:
+            count = journal.load()
+            if count:
+                logger.info(
+                    f"[{self.scenario}] Resuming seeding from journal: "
+                    f"{count} of {self.plan.users.count} users already created."
+                )
+                # Журнал обрезан до последней целой записи, дозапись ещё не началась
+                yield from islice(journal.iter_users(), count)
+
+            for user in self.builder.build_users(
+                    plan=self.plan.users,
+                    count=self.plan.users.count - count,
+                    start=count
+            ):
+                journal.append(user)
+                yield user
+
+    def build_users(self) -> Iterator[SeedUserResult]:
+        """
+        Выбирает способ генерации и лениво отдаёт пользователей плана:
+        - дозаполнение существующего дампа (SEEDS.TOP_UP)
+        - генерация с журналом (SEEDS.JOURNAL)
+        - обычная генерация
+        :return: Пользователи плана в детерминированном порядке.
+        """
+        if settings.seeds.top_up and self.can_top_up():
+            logger.info(f"[{self.scenario}] Topping up existing seeding result.")
+            return self.builder.top_up_users(plan=self.plan.users, users=iter_seeds_users(scenario=self.scenario))
+
+        if settings.seeds.journal:
+            return self.build_journaled()
+
+        return self.builder.build_users(plan=self.plan.users, count=self.plan.users.count)
+
+    def estimate(self) -> None:
+        """
+        Оценивает план сидинга без запросов к системе и выводит оценку в лог:
+        количество вызовов каждого метода клиентов билдера (SEEDS.CLIENT), количество сущностей
+        и прогноз времени. Задержки вызовов берутся из SEEDS.DRY_RUN_LATENCIES_FILE, а если он не задан —
+        из телеметрии предыдущего сидинга сценария; остальные методы оцениваются по SEEDS.DRY_RUN_LATENCY.
+
+        Если дамп будет переиспользован (SEEDS.CACHE и тот же план) или дозаполнен (SEEDS.TOP_UP),
+        оценивается только работа над существующим дампом, при условии что его проверка пройдёт.
+        """
+        latencies = None
+        if settings.seeds.dry_run_latencies_file:
+            latencies = load_seeds_latencies(Path(settings.seeds.dry_run_latencies_file))
+        elif report := load_seeds_telemetry(scenario=self.scenario):
+            latencies = report.get_latencies()
+
+        existing_users = None
+        if seeds_result_exists(scenario=self.scenario) and (
+                (settings.seeds.cache and load_seeds_plan_hash(scenario=self.scenario) == self.plan.get_hash())
+                or settings.seeds.top_up
+        ):
+            existing_users = iter_seeds_users(scenario=self.scenario)
+
+        estimate = estimate_seeds_plan(
+            plan=self.plan,
+            builder=self.builder,
+            concurrency=settings.seeds.concurrency,
+            latencies=latencies,
+            default_latency=settings.seeds.dry_run_latency,
+            existing_users=existing_users,
+            checks=settings.seeds.cache_check_sample if existing_users is not None else 0
+        )
+        logger.info(f"[{self.scenario}] Seeding plan estimate (dry run):\n{estimate.format_table()}")
+
     def build(self) -> None:
         """
         Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+        Пользователи записываются в дамп по мере создания, весь результат в памяти не хранится.
+        При SEEDS.DRY_RUN план только оценивается (см. estimate), данные не создаются.
         """
+        if settings.seeds.dry_run:
+            self.estimate()
+            return
+
+        # Если дамп уже построен по этому плану, повторный сидинг не нужен
+        if settings.seeds.cache and self.is_cached():
+            logger.info(f"[{self.scenario}] Seeding result for current plan found in dumps, skipping generation.")
+            return
+
         # Преобразуем план сидинга в JSON для логов (без значений по умолчанию)
         plan_json = self.plan.model_dump_json(indent=2, exclude_defaults=True)
         # Логируем начало генерации
         logger.info(f"[{self.scenario}] Starting seeding data generation for plan: {plan_json}")
-        # Запускаем генерацию
-        result = self.builder.build(self.plan)
+        # Запускаем генерацию и сразу сохраняем пользователей в дамп
+        telemetry = self.builder.limiter.telemetry
+        telemetry.start()
+        with SeedsWriter(scenario=self.scenario) as writer:
+            for user in self.build_users():
+                writer.write(user)
+                telemetry.log_progress(users=writer.count, total=self.plan.users.count)
+        save_seeds_plan_hash(plan_hash=self.plan.get_hash(), scenario=self.scenario)
         # Логируем завершение генерации
-        logger.info(f"[{self.scenario}] Seeding data generation completed.")
-        # Сохраняем результат
-        self.save(result)
+        logger.info(f"[{self.scenario}] Seeding data generation completed, users saved: {writer.count}.")
+        # Логируем итоговый лимит одновременных запросов и пропускную способность сидинга
+        self.builder.limiter.log_stats()
+        # Сохраняем задержки и ошибки по методам рядом с дампом и выводим самые затратные методы
+        report = telemetry.get_report(users=writer.count)
+        save_seeds_telemetry(report=report, scenario=self.scenario)
+        logger.info(f"[{self.scenario}] Seeding telemetry by method:\n{report.format_table()}")
+
+        # Итоговый результат сохранён — журнал больше не нужен
+        if settings.seeds.journal:
+            SeedsJournal(plan=self.plan, scenario=self.scenario).remove()
@@ -1,9 +1,12 @@
+from config import settings
 from seeds.scenario import SeedsScenario
 from seeds.schema.plan import (
     SeedsPlan,
     SeedUsersPlan,
     SeedAccountsPlan,
     SeedOperationsPlan,
+    SeedCountDistribution,
+    SeedCountDistributionKind,
 )
 
 
@@ -19,6 +22,10 @@ class ExistingUserGetOperationsSeedsScenario(SeedsScenario):
         * 5 операций покупки
         * 1 операцию пополнения
         * 1 операцию снятия наличных
+
+    При SEEDS.SKEWED_OPERATIONS количество операций покупки на счёт распределено
+    по закону Zipf от 1 до 100 (в основном немного, но есть «тяжёлые» счета,
+    на которых видны медленные запросы).
     """
 
     @property
@@ -26,12 +33,23 @@ class ExistingUserGetOperationsSeedsScenario(SeedsScenario):
         """
         План сидинга — описание того, что нужно сгенерировать.
         """
+        purchase_operations = SeedOperationsPlan(count=5)
+        if settings.seeds.skewed_operations:
+            purchase_operations = SeedOperationsPlan(
+                distribution=SeedCountDistribution(
+                    kind=SeedCountDistributionKind.ZIPF,
+                    min_count=1,
+                    max_count=100,
+                    exponent=1.5
+                )
+            )
+
         return SeedsPlan(
             users=SeedUsersPlan(
                 count=300,
                 credit_card_accounts=SeedAccountsPlan(
                     count=1,
-                    purchase_operations=SeedOperationsPlan(count=5),
+                    purchase_operations=purchase_operations,
                     top_up_operations=SeedOperationsPlan(count=1),
                     cash_withdrawal_operations=SeedOperationsPlan(count=1),
                 ),
@@ -43,7 +61,11 @@ class ExistingUserGetOperationsSeedsScenario(SeedsScenario):
         """
         Имя сценария. Используется для генерации файла:
         dumps/existing_user_get_operations_seeds.json
+        (dumps/existing_user_get_operations_skewed_seeds.json при SEEDS.SKEWED_OPERATIONS).
         """
+        if settings.seeds.skewed_operations:
+            return "existing_user_get_operations_skewed"
+
         return "existing_user_get_operations"
 
 
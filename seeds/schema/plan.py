@@ -1,24 +1,131 @@
-from pydantic import BaseModel, Field
+import bisect
+import hashlib
+import itertools
+import json
+import random
+from enum import StrEnum
+from functools import lru_cache
+from typing import Self
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class SeedCountDistributionKind(StrEnum):
+    # Всегда count сущностей
+    FIXED = "fixed"
+    # Равномерно от min_count до max_count
+    UNIFORM = "uniform"
+    # Степенной закон (Zipf) на отрезке min_count..max_count: чаще всего min_count, редкие «тяжёлые» значения
+    ZIPF = "zipf"
+    # Логнормальное распределение с параметрами mu и sigma, обрезанное до min_count..max_count
+    LOGNORMAL = "lognormal"
+
+
+@lru_cache(maxsize=None)
+def get_zipf_cum_weights(exponent: float, size: int) -> tuple[float, ...]:
+    """
+    Возвращает накопленные веса распределения Zipf для рангов 1..size.
+    """
+    return tuple(itertools.accumulate(1 / rank ** exponent for rank in range(1, size + 1)))
 
 
-class SeedCardsPlan(BaseModel):
+class SeedCountDistribution(BaseModel):
+    """
+    Распределение количества сущностей (карт или операций) на один счёт.
+
+    Attributes:
+        kind (SeedCountDistributionKind): Вид распределения.
+        min_count (int): Нижняя граница количества.
+        max_count (int | None): Верхняя граница количества (обязательна для uniform, zipf и lognormal).
+        exponent (float): Показатель степени для zipf (чем больше, тем сильнее перекос).
+        mu (float): Параметр mu логнормального распределения.
+        sigma (float): Параметр sigma логнормального распределения.
+    """
+    kind: SeedCountDistributionKind = SeedCountDistributionKind.FIXED
+    min_count: int = Field(default=0, ge=0)
+    max_count: int | None = Field(default=None, ge=0)
+    exponent: float = Field(default=1.5, gt=0)
+    mu: float = 1.0
+    sigma: float = Field(default=1.0, gt=0)
+
+    @model_validator(mode="after")
+    def check_bounds(self) -> Self:
+        if self.kind != SeedCountDistributionKind.FIXED and self.max_count is None:
+            raise ValueError(f"max_count is required for {self.kind} distribution")
+        if self.max_count is not None and self.max_count < self.min_count:
+            raise ValueError("max_count must be greater than or equal to min_count")
+        return self
+
+    def sample(self, rng: random.Random, count: int) -> int:
+        """
+        Выбирает количество сущностей.
+
+        :param rng: Генератор случайных чисел (детерминированный, см. SeedUsersPlan.get_account_plan).
+        :param count: Фиксированное количество из плана (для kind=fixed).
+        :return: Количество сущностей.
+        """
+        match self.kind:
+            case SeedCountDistributionKind.UNIFORM:
+                return rng.randint(self.min_count, self.max_count)
+            case SeedCountDistributionKind.ZIPF:
+                cum_weights = get_zipf_cum_weights(self.exponent, self.max_count - self.min_count + 1)
+                return self.min_count + bisect.bisect(cum_weights, rng.random() * cum_weights[-1])
+            case SeedCountDistributionKind.LOGNORMAL:
+                return min(max(round(rng.lognormvariate(self.mu, self.sigma)), self.min_count), self.max_count)
+            case _:
+                return count
+
+
+class SeedCountPlan(BaseModel):
+    """
+    План по количеству сущностей: фиксированное число или распределение.
+
+    Attributes:
+        count (int): Сколько сущностей создать (если распределение не задано).
+        distribution (SeedCountDistribution | None): Распределение количества по счетам.
+    """
+    count: int = 0
+    distribution: SeedCountDistribution | None = None
+
+    def resolve(self, rng: random.Random) -> Self:
+        """
+        Возвращает план с фиксированным количеством, выбранным из распределения.
+        """
+        if self.distribution is None:
+            return self
+
+        return self.model_copy(update={"count": self.distribution.sample(rng, self.count), "distribution": None})
+
+
+class SeedCardsPlan(SeedCountPlan):
     """
     План по количеству создаваемых карт (физических или виртуальных).
 
     Attributes:
         count (int): Сколько карт нужно создать.
+        distribution (SeedCountDistribution | None): Распределение количества карт по счетам.
     """
-    count: int = 0
 
 
-class SeedOperationsPlan(BaseModel):
+class SeedOperationsPlan(SeedCountPlan):
     """
     План по количеству создаваемых операций для счёта.
 
     Attributes:
         count (int): Сколько операций нужно выполнить.
+        distribution (SeedCountDistribution | None): Распределение количества операций по счетам.
     """
-    count: int = 0
+
+
+# Группы карт и операций счёта в порядке выбора количеств из распределений
+SEED_ACCOUNT_COUNT_PLANS = (
+    "physical_cards",
+    "virtual_cards",
+    "top_up_operations",
+    "purchase_operations",
+    "transfer_operations",
+    "cash_withdrawal_operations"
+)
 
 
 class SeedAccountsPlan(BaseModel):
@@ -45,6 +152,18 @@ class SeedAccountsPlan(BaseModel):
     transfer_operations: SeedOperationsPlan = Field(default_factory=SeedOperationsPlan)
     cash_withdrawal_operations: SeedOperationsPlan = Field(default_factory=SeedOperationsPlan)
 
+    def has_distributions(self) -> bool:
+        """
+        Проверяет, задано ли распределение хотя бы для одной группы карт или операций.
+        """
+        return any(getattr(self, name).distribution is not None for name in SEED_ACCOUNT_COUNT_PLANS)
+
+    def resolve(self, rng: random.Random) -> "SeedAccountsPlan":
+        """
+        Возвращает план одного счёта с фиксированными количествами карт и операций.
+        """
+        return self.model_copy(update={name: getattr(self, name).resolve(rng) for name in SEED_ACCOUNT_COUNT_PLANS})
+
 
 class SeedUsersPlan(BaseModel):
     """
@@ -56,15 +175,36 @@ class SeedUsersPlan(BaseModel):
         savings_accounts (SeedAccountsPlan): План по сберегательным счетам.
         debit_card_accounts (SeedAccountsPlan): План по дебетовым картам.
         credit_card_accounts (SeedAccountsPlan): План по кредитным картам.
+        seed (int): Зерно для выбора количеств из распределений.
     """
 
     count: int = 0
+    seed: int = 0
 
     deposit_accounts: SeedAccountsPlan = Field(default_factory=SeedAccountsPlan)
     savings_accounts: SeedAccountsPlan = Field(default_factory=SeedAccountsPlan)
     debit_card_accounts: SeedAccountsPlan = Field(default_factory=SeedAccountsPlan)
     credit_card_accounts: SeedAccountsPlan = Field(default_factory=SeedAccountsPlan)
 
+    def get_account_plan(self, name: str, user_index: int, account_index: int) -> SeedAccountsPlan:
+        """
+        Возвращает план конкретного счёта с количествами, выбранными из распределений.
+
+        Выбор детерминирован: генератор инициализируется из seed, номера пользователя,
+        типа и номера счёта. Поэтому результат не зависит от порядка и конкурентности сидинга,
+        а при продолжении по журналу или дозаполнении счёт получает те же количества.
+
+        :param name: Тип счёта (имя поля плана, например "credit_card_accounts").
+        :param user_index: Номер пользователя в плане.
+        :param account_index: Номер счёта этого типа у пользователя.
+        :return: Объект SeedAccountsPlan без распределений.
+        """
+        plan: SeedAccountsPlan = getattr(self, name)
+        if not plan.has_distributions():
+            return plan
+
+        return plan.resolve(random.Random(f"{self.seed}:{user_index}:{name}:{account_index}"))
+
 
 class SeedsPlan(BaseModel):
     """
@@ -74,3 +214,14 @@ class SeedsPlan(BaseModel):
         users (SeedUsersPlan): План по генерации пользователей.
     """
     users: SeedUsersPlan = Field(default_factory=SeedUsersPlan)
+
+    def get_hash(self) -> str:
+        """
+        Возвращает хэш содержимого плана.
+
+        Хэш не зависит от порядка полей и используется, чтобы понять,
+        соответствует ли сохранённый дамп сидинга текущему плану.
+        """
+        # Поля со значениями по умолчанию не учитываются, поэтому новые поля плана не меняют хэш старых дампов
+        data = json.dumps(self.model_dump(mode="json", exclude_defaults=True), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
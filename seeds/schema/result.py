@@ -75,6 +75,14 @@ class SeedsResult(BaseModel):
     """
     users: list[SeedUserResult] = Field(default_factory=list)
 
+    def __len__(self) -> int:
+        """Количество пользователей в результате сидинга."""
+        return len(self.users)
+
+    def get_user(self, index: int) -> SeedUserResult:
+        """Возвращает пользователя по его индексу без удаления."""
+        return self.users[index]
+
     def get_next_user(self) -> SeedUserResult:
         """Возвращает и удаляет первого пользователя из списка."""
         return self.users.pop(0)
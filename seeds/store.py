@@ -0,0 +1,286 @@
+import mmap
+import os
+import random
+import struct
+from pathlib import Path
+from typing import Iterable
+
+from seeds.dumps import DUMPS_DIR
+from seeds.records import (
+    SeedUser,
+    SeedAccount,
+    SeedCard,
+    SeedOperation,
+    USER_ACCOUNTS,
+    ACCOUNT_CARDS,
+    ACCOUNT_OPERATIONS
+)
+from seeds.schema.result import SeedUserResult, SeedAccountResult
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_STORE")
+
+# Формат файла:
+# [MAGIC][запись пользователя 0][запись пользователя 1]...[индекс: смещения записей, u64 * N][футер]
+#
+# Запись пользователя — это ID пользователя и четыре группы счетов (deposit, savings, debit, credit).
+# Группа: u32 количество элементов, затем элементы. Счёт: ID и шесть групп ID карт/операций.
+# ID: u16 длина + байты в UTF-8.
+MAGIC = b"SEEDBIN2"
+COUNT = struct.Struct("<I")
+LENGTH = struct.Struct("<H")
+OFFSET = struct.Struct("<Q")
+FOOTER = struct.Struct("<QQ")  # смещение индекса, количество пользователей
+
+
+def get_seeds_store_file(scenario: str) -> Path:
+    """
+    Возвращает путь к бинарному хранилищу сидинга сценария.
+    """
+    return DUMPS_DIR / f"{scenario}_seeds.bin"
+
+
+def encode_id(value: str) -> bytes:
+    """
+    Кодирует ID как u16 длину и байты UTF-8.
+    """
+    data = value.encode("utf-8")
+    if len(data) > 0xFFFF:
+        raise ValueError(f"Seed ID is too long for the seeds store: {len(data)} bytes")
+    return LENGTH.pack(len(data)) + data
+
+
+def encode_ids(values: list[str]) -> bytes:
+    """
+    Кодирует группу ID: u32 количество и сами ID.
+    """
+    return COUNT.pack(len(values)) + b"".join(encode_id(value) for value in values)
+
+
+def encode_account(account: SeedAccount | SeedAccountResult) -> bytes:
+    """
+    Кодирует счёт: ID счёта, затем группы ID карт и операций.
+    """
+    parts = [encode_id(account.account_id)]
+    parts.extend(encode_ids([card.card_id for card in getattr(account, name)]) for name in ACCOUNT_CARDS)
+    parts.extend(
+        encode_ids([operation.operation_id for operation in getattr(account, name)])
+        for name in ACCOUNT_OPERATIONS
+    )
+    return b"".join(parts)
+
+
+def encode_user(user: SeedUser | SeedUserResult) -> bytes:
+    """
+    Кодирует пользователя: ID пользователя, затем группы счетов каждого типа.
+    """
+    parts = [encode_id(user.user_id)]
+    for name in USER_ACCOUNTS:
+        accounts = getattr(user, name)
+        parts.append(COUNT.pack(len(accounts)))
+        parts.extend(encode_account(account) for account in accounts)
+    return b"".join(parts)
+
+
+def is_seeds_store_file(store_file: Path) -> bool:
+    """
+    Проверяет, что файл записан в текущем формате хранилища (по сигнатуре MAGIC).
+    """
+    with open(store_file, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def save_seeds_store(users: Iterable[SeedUserResult], scenario: str) -> None:
+    """
+    Сохраняет пользователей в компактный бинарный файл с индексом смещений.
+
+    Пользователи записываются потоково, в памяти хранится только индекс (8 байт на пользователя).
+    Запись идёт во временный файл, который атомарно заменяет хранилище по завершении.
+    """
+    store_file = get_seeds_store_file(scenario)
+    temp_file = store_file.with_name(f"{store_file.name}.{os.getpid()}.tmp")
+
+    offsets: list[int] = []
+    with open(temp_file, "wb") as f:
+        f.write(MAGIC)
+        for user in users:
+            offsets.append(f.tell())
+            f.write(encode_user(user))
+
+        index_offset = f.tell()
+        f.write(b"".join(OFFSET.pack(offset) for offset in offsets))
+        f.write(FOOTER.pack(index_offset, len(offsets)))
+
+    os.replace(temp_file, store_file)
+
+    logger.debug(f"Seeding store saved to file: {store_file}, users: {len(offsets)}")
+
+
+class SeedsStore:
+    """
+    Хранилище результата сидинга поверх memory-mapped бинарного файла.
+
+    В отличие от SeedsRecords, пользователи не загружаются в память целиком:
+    по индексу смещений за O(1) находится запись нужного пользователя, и в SeedUser
+    декодируется только она. Страницы файла разделяются всеми локальными процессами Locust
+    через page cache операционной системы.
+    """
+
+    def __init__(self, buffer: bytes | mmap.mmap | memoryview):
+        """
+        :param buffer: Содержимое бинарного файла хранилища (mmap, bytes или memoryview).
+        """
+        self.buffer = buffer
+        if bytes(buffer[:len(MAGIC)]) != MAGIC:
+            raise ValueError("Invalid seeds store: unknown file format")
+
+        self.index_offset, self.count = FOOTER.unpack_from(buffer, len(buffer) - FOOTER.size)
+        self.cursor = 0
+
+    @classmethod
+    def open(cls, scenario: str) -> "SeedsStore":
+        """
+        Открывает бинарное хранилище сценария только для чтения через mmap.
+
+        :param scenario: Имя сценария сидинга.
+        :return: Объект SeedsStore.
+        """
+        return cls.open_file(get_seeds_store_file(scenario))
+
+    @classmethod
+    def open_file(cls, store_file: Path) -> "SeedsStore":
+        """
+        Открывает бинарное хранилище по пути к файлу только для чтения через mmap.
+
+        :param store_file: Путь к файлу хранилища.
+        :return: Объект SeedsStore.
+        """
+        with open(store_file, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return cls(buffer)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def read_id(self, offset: int) -> tuple[str, int]:
+        """
+        Читает один ID, возвращает его и смещение следующего поля.
+        """
+        (length,) = LENGTH.unpack_from(self.buffer, offset)
+        offset += LENGTH.size
+        return str(self.buffer[offset:offset + length], "utf-8"), offset + length
+
+    def read_ids(self, offset: int) -> tuple[list[str], int]:
+        """
+        Читает группу ID, возвращает её и смещение следующего поля.
+        """
+        (count,) = COUNT.unpack_from(self.buffer, offset)
+        offset += COUNT.size
+
+        values = []
+        for _ in range(count):
+            value, offset = self.read_id(offset)
+            values.append(value)
+
+        return values, offset
+
+    def read_account(self, offset: int) -> tuple[SeedAccount, int]:
+        """
+        Читает счёт со всеми картами и операциями, возвращает его и смещение следующего поля.
+        """
+        account_id, offset = self.read_id(offset)
+
+        groups = []
+        for _ in ACCOUNT_CARDS:
+            card_ids, offset = self.read_ids(offset)
+            groups.append(tuple(SeedCard(card_id) for card_id in card_ids))
+        for _ in ACCOUNT_OPERATIONS:
+            operation_ids, offset = self.read_ids(offset)
+            groups.append(tuple(SeedOperation(operation_id) for operation_id in operation_ids))
+
+        return SeedAccount(account_id, *groups), offset
+
+    def get_user(self, index: int) -> SeedUser:
+        """
+        Декодирует пользователя по его порядковому номеру в дампе.
+
+        :param index: Индекс пользователя (0 <= index < len(store)).
+        :return: Объект SeedUser.
+        """
+        if not 0 <= index < self.count:
+            raise IndexError("Seeds store index out of range")
+
+        (offset,) = OFFSET.unpack_from(self.buffer, self.index_offset + index * OFFSET.size)
+        user_id, offset = self.read_id(offset)
+
+        groups = []
+        for _ in USER_ACCOUNTS:
+            (count,) = COUNT.unpack_from(self.buffer, offset)
+            offset += COUNT.size
+
+            accounts = []
+            for _ in range(count):
+                account, offset = self.read_account(offset)
+                accounts.append(account)
+            groups.append(tuple(accounts))
+
+        return SeedUser(user_id, *groups)
+
+    def get_next_user(self) -> SeedUser:
+        """Возвращает следующего пользователя; каждый пользователь выдаётся один раз."""
+        user = self.get_user(self.cursor)
+        self.cursor += 1
+        return user
+
+    def get_random_user(self) -> SeedUser:
+        """Возвращает случайного пользователя без удаления."""
+        return self.get_user(random.randrange(self.count))
+
+
+class SeedsStoreShard:
+    """
+    Шард хранилища сидинга: каждый count-й пользователь SeedsStore, начиная с index.
+
+    Повторяет интерфейс SeedsStore, но сам пользователей не хранит: обращения
+    пересчитываются в индексы исходного хранилища. Так локальные воркеры Locust
+    (--processes) работают со своим шардом поверх одного общего mmap-файла,
+    и память не растёт с количеством процессов.
+    """
+
+    def __init__(self, store: SeedsStore, index: int, count: int):
+        """
+        :param store: Хранилище со всеми пользователями сидинга.
+        :param index: Номер шарда (0 <= index < count).
+        :param count: Общее количество шардов.
+        """
+        self.store = store
+        self.index = index
+        self.count = count
+        self.size = len(range(index, len(store), count))
+        self.cursor = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def get_user(self, index: int) -> SeedUser:
+        """
+        Декодирует пользователя по его порядковому номеру в шарде.
+
+        :param index: Индекс пользователя в шарде (0 <= index < len(shard)).
+        :return: Объект SeedUser.
+        """
+        if not 0 <= index < self.size:
+            raise IndexError("Seeds store shard index out of range")
+
+        return self.store.get_user(self.index + index * self.count)
+
+    def get_next_user(self) -> SeedUser:
+        """Возвращает следующего пользователя шарда; каждый пользователь выдаётся один раз."""
+        user = self.get_user(self.cursor)
+        self.cursor += 1
+        return user
+
+    def get_random_user(self) -> SeedUser:
+        """Возвращает случайного пользователя шарда без удаления."""
+        return self.get_user(random.randrange(self.size))
@@ -0,0 +1,238 @@
+import bisect
+import time
+
+from pydantic import BaseModel
+
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_TELEMETRY")
+
+# Верхние границы корзин гистограммы задержек (в секундах): от 0.5 мс с шагом 25%, до ~4 минут.
+# Ошибка перцентиля не превышает ширины корзины, то есть 25% от значения.
+LATENCY_BUCKETS = tuple(0.0005 * 1.25 ** index for index in range(60))
+
+
+class SeedsLatencyHistogram:
+    """
+    Гистограмма задержек вызовов одного метода с логарифмическими корзинами.
+
+    Запись — O(log корзин), память не зависит от количества вызовов,
+    поэтому гистограмму можно вести для каждого из миллионов запросов сидинга.
+    """
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, latency: float) -> None:
+        """
+        Добавляет задержку одного вызова.
+
+        :param latency: Задержка (в секундах).
+        """
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+
+    def get_percentile(self, percentile: float) -> float:
+        """
+        Возвращает перцентиль задержки по верхней границе корзины (но не больше максимума).
+
+        :param percentile: Перцентиль в долях (0.95 — p95).
+        :return: Задержка (в секундах) или 0.0, если вызовов не было.
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = percentile * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                return min(LATENCY_BUCKETS[index], self.max) if index < len(LATENCY_BUCKETS) else self.max
+
+        return self.max
+
+
+class SeedsMethodStats(BaseModel):
+    """
+    Статистика вызовов одного метода при сидинге.
+
+    Attributes:
+        method (str): Имя метода клиента (например, make_purchase_operation).
+        calls (int): Сколько вызовов завершилось успешно.
+        errors (int): Сколько вызовов завершилось ошибкой (включая повторённые).
+        mean (float): Средняя задержка успешного вызова (в секундах).
+        p50 (float): Медиана задержки (в секундах).
+        p95 (float): 95-й перцентиль задержки (в секундах).
+        p99 (float): 99-й перцентиль задержки (в секундах).
+        max (float): Максимальная задержка (в секундах).
+        total (float): Суммарное время успешных вызовов (в секундах).
+    """
+    method: str
+    calls: int
+    errors: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    total: float
+
+
+class SeedsTelemetryReport(BaseModel):
+    """
+    Итоговый отчёт телеметрии сидинга.
+
+    Attributes:
+        users (int): Сколько пользователей сохранено в дамп.
+        elapsed (float): Длительность сидинга (в секундах).
+        throughput (float): Успешных вызовов в секунду.
+        methods (list[SeedsMethodStats]): Статистика по методам, самые затратные первыми.
+    """
+    users: int
+    elapsed: float
+    throughput: float
+    methods: list[SeedsMethodStats]
+
+    def get_latencies(self) -> dict[str, float]:
+        """
+        Возвращает среднюю задержку по методам — в формате SEEDS.DRY_RUN_LATENCIES_FILE.
+        """
+        return {stats.method: stats.mean for stats in self.methods if stats.calls}
+
+    def format_table(self) -> str:
+        """
+        Возвращает отчёт в виде текстовой таблицы для лога.
+        """
+        width = max(map(len, (*(stats.method for stats in self.methods), "method")))
+        lines = [
+            f"{'method':<{width}}  {'calls':>8}  {'errors':>6}  {'mean':>8}  "
+            f"{'p50':>8}  {'p95':>8}  {'p99':>8}  {'max':>8}  {'total':>9}"
+        ]
+        lines.extend(
+            f"{stats.method:<{width}}  {stats.calls:>8}  {stats.errors:>6}  {stats.mean * 1000:>6.1f}ms  "
+            f"{stats.p50 * 1000:>6.1f}ms  {stats.p95 * 1000:>6.1f}ms  {stats.p99 * 1000:>6.1f}ms  "
+            f"{stats.max * 1000:>6.1f}ms  {stats.total:>8.1f}s"
+            for stats in self.methods
+        )
+        lines.append("")
+        lines.append(f"users={self.users}, elapsed={self.elapsed:.1f}s, throughput={self.throughput:.1f} calls/s")
+        return "\n".join(lines)
+
+
+class SeedsTelemetry:
+    """
+    Телеметрия вызовов сидинга: гистограммы задержек и количество ошибок по методам.
+
+    Заполняется ограничителем запросов (SeedsLimiter.call) по имени вызываемого метода клиента,
+    поэтому для gateway имена совпадают с методами в оценке плана (seeds/estimator.py).
+    Все запросы сидинга выполняются в одном потоке (gevent), поэтому блокировки не нужны.
+    """
+
+    def __init__(self, progress_interval: float = 0.0):
+        """
+        :param progress_interval: Как часто выводить прогресс сидинга в лог (в секундах, 0 — не выводить).
+        """
+        self.progress_interval = progress_interval
+        self.histograms: dict[str, SeedsLatencyHistogram] = {}
+        self.errors: dict[str, int] = {}
+        self.started_at = time.perf_counter()
+        self.progress_at = self.started_at
+
+    def start(self) -> None:
+        """
+        Отмечает начало сидинга: от него считаются длительность, пропускная способность и ETA.
+        """
+        self.started_at = self.progress_at = time.perf_counter()
+
+    def record(self, method: str, latency: float) -> None:
+        """
+        Учитывает успешный вызов метода.
+
+        :param method: Имя метода.
+        :param latency: Задержка вызова (в секундах).
+        """
+        histogram = self.histograms.get(method)
+        if histogram is None:
+            histogram = self.histograms[method] = SeedsLatencyHistogram()
+
+        histogram.record(latency)
+
+    def record_error(self, method: str) -> None:
+        """
+        Учитывает вызов метода, завершившийся ошибкой.
+
+        :param method: Имя метода.
+        """
+        self.errors[method] = self.errors.get(method, 0) + 1
+
+    @property
+    def calls(self) -> int:
+        return sum(histogram.count for histogram in self.histograms.values())
+
+    def log_progress(self, users: int, total: int, force: bool = False) -> None:
+        """
+        Выводит в лог строку прогресса: готовые пользователи, пропускная способность и ETA.
+        Не чаще одного раза в progress_interval секунд.
+
+        :param users: Сколько пользователей уже готово.
+        :param total: Сколько пользователей в плане.
+        :param force: Вывести прогресс независимо от интервала.
+        """
+        if self.progress_interval == 0:
+            return
+
+        now = time.perf_counter()
+        if not force and now - self.progress_at < self.progress_interval:
+            return
+
+        self.progress_at = now
+        elapsed = now - self.started_at
+        users_rate = users / elapsed if elapsed > 0 else 0.0
+        eta = f"{(total - users) / users_rate:.0f}s" if users_rate > 0 else "n/a"
+
+        logger.info(
+            f"Seeding progress: users {users}/{total} ({users / max(total, 1):.0%}), "
+            f"{self.calls / elapsed if elapsed > 0 else 0.0:.1f} calls/s, "
+            f"errors {sum(self.errors.values())}, elapsed {elapsed:.0f}s, ETA {eta}"
+        )
+
+    def get_report(self, users: int) -> SeedsTelemetryReport:
+        """
+        Собирает итоговый отчёт.
+
+        :param users: Сколько пользователей сохранено в дамп.
+        :return: Объект SeedsTelemetryReport.
+        """
+        elapsed = time.perf_counter() - self.started_at
+        methods = [
+            SeedsMethodStats(
+                method=method,
+                calls=histogram.count,
+                errors=self.errors.get(method, 0),
+                mean=histogram.total / histogram.count if histogram.count else 0.0,
+                p50=histogram.get_percentile(0.5),
+                p95=histogram.get_percentile(0.95),
+                p99=histogram.get_percentile(0.99),
+                max=histogram.max,
+                total=histogram.total
+            )
+            for method, histogram in self.histograms.items()
+        ]
+        methods.extend(
+            SeedsMethodStats(method=method, calls=0, errors=errors, mean=0, p50=0, p95=0, p99=0, max=0, total=0)
+            for method, errors in self.errors.items()
+            if method not in self.histograms
+        )
+
+        return SeedsTelemetryReport(
+            users=users,
+            elapsed=elapsed,
+            throughput=self.calls / elapsed if elapsed > 0 else 0.0,
+            methods=sorted(methods, key=lambda stats: stats.total, reverse=True)
+        )
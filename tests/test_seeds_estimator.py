@@ -0,0 +1,133 @@
+import itertools
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from contracts.services.cards.card_pb2 import CardStatus, CardType
+from seeds.builder import SeedsBuilder, SeedsServicesBuilder
+from seeds.estimator import estimate_seeds_plan
+from seeds.limiter import SeedsLimiter
+from seeds.schema.plan import (
+    SeedsPlan,
+    SeedUsersPlan,
+    SeedAccountsPlan,
+    SeedCardsPlan,
+    SeedOperationsPlan,
+    SeedCountDistribution,
+    SeedCountDistributionKind
+)
+
+
+class FakeClient:
+    """
+    Клиент всех доменов сразу: любой метод создаёт сущность с новым ID и возвращает ответ
+    в форме ответов gateway и сервисов. Карточный счёт открывается с активной виртуальной картой.
+    """
+
+    def __init__(self):
+        self.ids = itertools.count()
+        self.accounts: dict[str, SimpleNamespace] = {}
+
+    def __getattr__(self, name: str):
+        def call(**kwargs):
+            return self.respond(name, **kwargs)
+
+        call.__name__ = name
+        return call
+
+    def new_id(self) -> str:
+        return str(next(self.ids))
+
+    def respond(self, name: str, **kwargs) -> SimpleNamespace:
+        if name == "create_user":
+            return SimpleNamespace(user=SimpleNamespace(id=self.new_id()))
+        if name.startswith("open_") or name == "create_account":
+            account_id = self.new_id()
+            card = SimpleNamespace(
+                id=self.new_id(),
+                account_id=account_id,
+                status=CardStatus.CARD_STATUS_ACTIVE,
+                type=CardType.CARD_TYPE_VIRTUAL
+            )
+            account = self.accounts[account_id] = SimpleNamespace(id=account_id, cards=[card])
+            return SimpleNamespace(account=account)
+        if name.startswith("issue_") or name == "create_card":
+            return SimpleNamespace(card=SimpleNamespace(id=self.new_id()))
+        if name.startswith("make_") or name == "create_operation":
+            return SimpleNamespace(operation=SimpleNamespace(id=self.new_id()))
+        if name == "get_accounts":
+            return SimpleNamespace(accounts=list(self.accounts.values()))
+        if name == "get_cards":
+            return SimpleNamespace(cards=self.accounts[kwargs["account_id"]].cards)
+
+        raise AttributeError(name)
+
+
+def build_builder(builder_class: type[SeedsBuilder]) -> SeedsBuilder:
+    client = FakeClient()
+    return builder_class(client, client, client, client, limiter=SeedsLimiter(concurrency=1))
+
+
+def get_calls(builder: SeedsBuilder) -> dict[str, int]:
+    return {method: histogram.count for method, histogram in builder.limiter.telemetry.histograms.items()}
+
+
+def build_plan(count: int, accounts: int, operations: int) -> SeedsPlan:
+    return SeedsPlan(
+        users=SeedUsersPlan(
+            count=count,
+            savings_accounts=SeedAccountsPlan(count=1),
+            credit_card_accounts=SeedAccountsPlan(
+                count=accounts,
+                physical_cards=SeedCardsPlan(count=1),
+                top_up_operations=SeedOperationsPlan(count=operations),
+                purchase_operations=SeedOperationsPlan(
+                    distribution=SeedCountDistribution(
+                        kind=SeedCountDistributionKind.ZIPF,
+                        min_count=0,
+                        max_count=operations * 3
+                    )
+                )
+            )
+        )
+    )
+
+
+@pytest.mark.parametrize("builder_class", [SeedsBuilder, SeedsServicesBuilder])
+def test_estimate_matches_seeding_calls(builder_class: type[SeedsBuilder]):
+    plan = build_plan(count=5, accounts=2, operations=2)
+    builder = build_builder(builder_class)
+
+    builder.build(plan)
+    estimate = estimate_seeds_plan(plan, builder=builder)
+
+    assert estimate.calls == get_calls(builder)
+    assert estimate.total_calls == sum(get_calls(builder).values())
+
+
+@pytest.mark.parametrize("builder_class", [SeedsBuilder, SeedsServicesBuilder])
+def test_estimate_matches_top_up_calls(builder_class: type[SeedsBuilder]):
+    old_plan = build_plan(count=3, accounts=1, operations=1)
+    new_plan = build_plan(count=5, accounts=2, operations=2)
+    builder = build_builder(builder_class)
+    result = builder.build(old_plan)
+    seeding_calls = Counter(get_calls(builder))
+
+    top_up = builder.top_up(new_plan, result)
+    estimate = estimate_seeds_plan(new_plan, builder=builder, existing_users=result.users)
+
+    assert estimate.existing_users == 3
+    assert estimate.calls == dict(Counter(get_calls(builder)) - seeding_calls)
+    assert len(top_up.users) == 5
+
+
+def test_estimate_of_matching_dump_has_no_calls():
+    plan = build_plan(count=3, accounts=1, operations=1)
+    builder = build_builder(SeedsBuilder)
+    result = builder.build(plan)
+
+    estimate = estimate_seeds_plan(plan, builder=builder, existing_users=result.users)
+
+    assert estimate.calls == {}
+    assert estimate.projected_seconds == 0
@@ -0,0 +1,96 @@
+import gevent
+import pytest
+
+from seeds.graph import SeedsGraph, SeedTask
+
+
+class Recorder:
+    """
+    Задачи графа, которые записывают порядок выполнения и количество одновременно выполняемых задач.
+    """
+
+    def __init__(self):
+        self.events: list[str] = []
+        self.inflight = 0
+        self.max_inflight = 0
+
+    def task(self, name: str, delay: float = 0.0, result=None):
+        def run(*parents):
+            self.inflight += 1
+            self.max_inflight = max(self.max_inflight, self.inflight)
+            self.events.append(f"start:{name}")
+            gevent.sleep(delay)
+            self.inflight -= 1
+            self.events.append(f"end:{name}")
+            return result if result is not None else (name, parents)
+
+        return run
+
+
+def compile_item(graph: SeedsGraph, recorder: Recorder, item: int) -> SeedTask:
+    # Элемент: корень -> два листа с разной задержкой -> итоговая задача
+    root = graph.add(recorder.task(f"{item}.root", result=item))
+    leaves = [
+        graph.add(recorder.task(f"{item}.leaf{leaf}", delay=0.001 * (3 - item % 3 + leaf)), root)
+        for leaf in range(2)
+    ]
+    return graph.add(lambda root_result, *_: root_result, root, *leaves, inline=True)
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_graph_yields_results_in_item_order(concurrency: int):
+    graph = SeedsGraph(concurrency=concurrency)
+    recorder = Recorder()
+
+    results = list(graph.imap(lambda item: compile_item(graph, recorder, item), range(10)))
+
+    assert results == list(range(10))
+    assert recorder.max_inflight <= concurrency
+    # Листья элемента запускаются только после его корня
+    for item in range(10):
+        root_end = recorder.events.index(f"end:{item}.root")
+        assert all(recorder.events.index(f"start:{item}.leaf{leaf}") > root_end for leaf in range(2))
+
+
+def test_graph_passes_parent_results():
+    graph = SeedsGraph(concurrency=2)
+
+    def compile(item: int) -> SeedTask:
+        left = graph.add(lambda: item * 10)
+        right = graph.add(lambda: item + 1)
+        return graph.add(lambda a, b: a + b, left, right)
+
+    assert list(graph.imap(compile, range(3))) == [1, 12, 23]
+
+
+def test_graph_runs_tasks_concurrently():
+    graph = SeedsGraph(concurrency=8)
+    recorder = Recorder()
+
+    list(graph.imap(lambda item: compile_item(graph, recorder, item), range(8)))
+
+    assert recorder.max_inflight > 1
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_graph_propagates_errors_and_stops_tasks(concurrency: int):
+    graph = SeedsGraph(concurrency=concurrency)
+    recorder = Recorder()
+
+    def fail(*parents):
+        raise RuntimeError("seeding failed")
+
+    def compile(item: int) -> SeedTask:
+        if item == 2:
+            return graph.add(fail)
+        return compile_item(graph, recorder, item)
+
+    results = graph.imap(compile, range(10))
+    with pytest.raises(RuntimeError, match="seeding failed"):
+        list(results)
+
+    # Задачи, запущенные до ошибки, остановлены, и после неё ничего не выполняется
+    events = len(recorder.events)
+    gevent.sleep(0.05)
+    assert len(recorder.events) == events
+    assert not graph.ready
@@ -0,0 +1,67 @@
+import pytest
+
+from seeds import dumps as dumps_module
+from seeds.dumps import SeedsJournal
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan
+from seeds.schema.result import SeedUserResult
+
+
+@pytest.fixture
+def dumps_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(dumps_module, "DUMPS_DIR", tmp_path)
+    return tmp_path
+
+
+def build_plan(count: int = 3) -> SeedsPlan:
+    return SeedsPlan(users=SeedUsersPlan(count=count))
+
+
+def write_journal(plan: SeedsPlan, users: list[SeedUserResult]) -> SeedsJournal:
+    with SeedsJournal(plan=plan, scenario="test") as journal:
+        assert journal.load() == 0
+        for user in users:
+            journal.append(user)
+
+    return journal
+
+
+@pytest.mark.parametrize("torn_line", [b'{"user_id": "us', b'{"user_id": "user-2"}'])
+def test_journal_resumes_after_torn_last_line(dumps_dir, torn_line: bytes):
+    plan = build_plan()
+    journal = write_journal(plan, [SeedUserResult(user_id="user-0"), SeedUserResult(user_id="user-1")])
+    committed = journal.journal_file.read_bytes()
+
+    # Аварийное завершение посреди записи: последняя строка без перевода строки
+    with open(journal.journal_file, "ab") as f:
+        f.write(torn_line)
+
+    with SeedsJournal(plan=plan, scenario="test") as journal:
+        assert journal.load() == 2
+        assert journal.journal_file.read_bytes() == committed
+
+        journal.append(SeedUserResult(user_id="user-2"))
+
+    assert [user.user_id for user in journal.iter_users()] == ["user-0", "user-1", "user-2"]
+
+
+def test_journal_stops_at_corrupted_line(dumps_dir):
+    plan = build_plan()
+    journal = write_journal(plan, [SeedUserResult(user_id="user-0")])
+
+    with open(journal.journal_file, "ab") as f:
+        f.write(b"not json\n")
+        f.write(SeedUserResult(user_id="user-1").model_dump_json().encode() + b"\n")
+
+    with SeedsJournal(plan=plan, scenario="test") as journal:
+        assert journal.load() == 1
+
+    assert [user.user_id for user in journal.iter_users()] == ["user-0"]
+
+
+def test_journal_restarts_for_another_plan(dumps_dir):
+    write_journal(build_plan(count=3), [SeedUserResult(user_id="user-0")])
+
+    with SeedsJournal(plan=build_plan(count=5), scenario="test") as journal:
+        assert journal.load() == 0
+
+    assert list(journal.iter_users()) == []
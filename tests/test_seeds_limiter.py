@@ -0,0 +1,82 @@
+import pytest
+
+from seeds import limiter as limiter_module
+from seeds.limiter import SeedsLimiter, LATENCY_INFLATION_STREAK
+
+
+class FakeClock:
+    """
+    Часы для limiter.time.perf_counter: время идёт только внутри вызовов запросов.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def request(self, name: str, latency: float):
+        def call() -> None:
+            self.now += latency
+
+        call.__name__ = name
+        return call
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(limiter_module.time, "perf_counter", clock.perf_counter)
+    return clock
+
+
+def test_adaptive_limit_does_not_collapse_on_mixed_method_latencies(clock: FakeClock):
+    limiter = SeedsLimiter(concurrency=16, adaptive=True)
+    create_user = clock.request("create_user", 0.005)
+    make_purchase_operation = clock.request("make_purchase_operation", 0.08)
+    issue_virtual_card = clock.request("issue_virtual_card", 0.05)
+
+    for _ in range(100):
+        limiter.call(create_user)
+        limiter.call(make_purchase_operation)
+        limiter.call(issue_virtual_card)
+
+    assert limiter.decreases == 0
+    assert int(limiter.limit) == 16
+
+
+def test_adaptive_limit_decreases_on_sustained_method_latency_inflation(clock: FakeClock):
+    limiter = SeedsLimiter(concurrency=16, adaptive=True, backoff=0.5)
+    create_user = clock.request("create_user", 0.005)
+    make_purchase_operation = clock.request("make_purchase_operation", 0.08)
+
+    for _ in range(20):
+        limiter.call(create_user)
+        limiter.call(make_purchase_operation)
+
+    # Одиночный выброс не считается перегрузкой
+    limiter.call(clock.request("create_user", 0.05))
+    limiter.call(create_user)
+    assert limiter.decreases == 0
+
+    # Устойчивый рост задержки метода уменьшает лимит
+    for _ in range(LATENCY_INFLATION_STREAK):
+        limiter.call(clock.request("create_user", 0.05))
+
+    assert limiter.decreases == 1
+    assert int(limiter.limit) == 8
+
+
+def test_telemetry_is_keyed_by_explicit_call_key(clock: FakeClock):
+    limiter = SeedsLimiter(concurrency=1)
+    create_operation = clock.request("create_operation", 0.01)
+
+    limiter.call(create_operation, key="create_top_up_operation")
+    limiter.call(create_operation, key="create_purchase_operation")
+    limiter.call(create_operation)
+
+    assert set(limiter.telemetry.histograms) == {
+        "create_top_up_operation",
+        "create_purchase_operation",
+        "create_operation"
+    }
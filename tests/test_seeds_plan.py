@@ -0,0 +1,85 @@
+import pytest
+from pydantic import ValidationError
+
+from seeds.schema.plan import (
+    SeedsPlan,
+    SeedUsersPlan,
+    SeedAccountsPlan,
+    SeedOperationsPlan,
+    SeedCountDistribution,
+    SeedCountDistributionKind
+)
+
+
+def build_plan(**purchase_operations) -> SeedsPlan:
+    return SeedsPlan(
+        users=SeedUsersPlan(
+            count=10,
+            credit_card_accounts=SeedAccountsPlan(
+                count=1,
+                purchase_operations=SeedOperationsPlan(**purchase_operations)
+            )
+        )
+    )
+
+
+def test_plan_hash_is_stable():
+    # Хэш сохраняется в дампах: его изменение инвалидирует кэш сидинга у всех
+    assert build_plan(count=5).get_hash() == "a5d0ac8cda4af11d27469f01406f475ceef61dd8589fdf718ab5a2ea7dd68678"
+
+
+def test_plan_hash_ignores_field_order_and_explicit_defaults():
+    plan = build_plan(count=5)
+    reordered = SeedsPlan.model_validate({
+        "users": {
+            "credit_card_accounts": {"purchase_operations": {"distribution": None, "count": 5}, "count": 1},
+            "seed": 0,
+            "count": 10
+        }
+    })
+
+    assert reordered.get_hash() == plan.get_hash()
+
+
+def test_plan_hash_changes_with_plan():
+    plan = build_plan(count=5)
+    distribution = SeedCountDistribution(kind=SeedCountDistributionKind.ZIPF, min_count=1, max_count=50)
+
+    assert build_plan(count=6).get_hash() != plan.get_hash()
+    assert build_plan(count=5, distribution=distribution).get_hash() != plan.get_hash()
+
+
+@pytest.mark.parametrize("kind", [
+    SeedCountDistributionKind.UNIFORM,
+    SeedCountDistributionKind.ZIPF,
+    SeedCountDistributionKind.LOGNORMAL
+])
+def test_distribution_requires_max_count(kind: SeedCountDistributionKind):
+    with pytest.raises(ValidationError):
+        SeedCountDistribution(kind=kind)
+
+    with pytest.raises(ValidationError):
+        SeedCountDistribution(kind=kind, min_count=5, max_count=4)
+
+
+@pytest.mark.parametrize("kind", [
+    SeedCountDistributionKind.UNIFORM,
+    SeedCountDistributionKind.ZIPF,
+    SeedCountDistributionKind.LOGNORMAL
+])
+def test_account_plan_is_deterministic_and_bounded(kind: SeedCountDistributionKind):
+    distribution = SeedCountDistribution(kind=kind, min_count=1, max_count=20, mu=2.0, sigma=2.0)
+    plan = build_plan(distribution=distribution).users
+
+    counts = [
+        plan.get_account_plan("credit_card_accounts", user_index, 0).purchase_operations.count
+        for user_index in range(200)
+    ]
+
+    assert all(1 <= count <= 20 for count in counts)
+    assert len(set(counts)) > 1
+    # Количество зависит только от номера пользователя и счёта, а не от порядка вызовов
+    assert [
+        plan.get_account_plan("credit_card_accounts", user_index, 0).purchase_operations.count
+        for user_index in reversed(range(200))
+    ] == counts[::-1]
@@ -0,0 +1,74 @@
+import gevent
+import pytest
+
+from seeds.pool import SeedUsersPool, SeedUsersPoolExhaustedError
+from seeds.records import SeedsRecords, SeedUser
+from tools.config.seeds import SeedsPoolExhaustion
+
+
+def build_seeds(count: int) -> SeedsRecords:
+    return SeedsRecords(SeedUser(user_id=f"user-{index}") for index in range(count))
+
+
+@pytest.mark.parametrize("exhaustion", list(SeedsPoolExhaustion))
+def test_pool_leases_are_exclusive_while_users_are_free(exhaustion: SeedsPoolExhaustion):
+    pool = SeedUsersPool(build_seeds(3), exhaustion=exhaustion, timeout=0.01)
+
+    leases = [pool.checkout() for _ in range(3)]
+
+    assert sorted(lease.index for lease in leases) == [0, 1, 2]
+    assert [lease.user.user_id for lease in leases] == [f"user-{lease.index}" for lease in leases]
+    assert pool.get_stats().leased == 3
+
+
+def test_pool_fail_raises_when_exhausted():
+    pool = SeedUsersPool(build_seeds(1), exhaustion=SeedsPoolExhaustion.FAIL)
+    lease = pool.checkout()
+
+    with pytest.raises(SeedUsersPoolExhaustedError):
+        pool.checkout()
+
+    pool.checkin(lease)
+    assert pool.checkout().index == lease.index
+
+
+def test_pool_block_waits_for_checkin():
+    pool = SeedUsersPool(build_seeds(1), exhaustion=SeedsPoolExhaustion.BLOCK, timeout=1.0)
+    lease = pool.checkout()
+
+    gevent.spawn_later(0.01, pool.checkin, lease)
+
+    assert pool.checkout().index == lease.index
+
+
+def test_pool_block_raises_after_timeout():
+    pool = SeedUsersPool(build_seeds(1), exhaustion=SeedsPoolExhaustion.BLOCK, timeout=0.01)
+    pool.checkout()
+
+    with pytest.raises(SeedUsersPoolExhaustedError):
+        pool.checkout()
+
+
+def test_pool_recycle_shares_users_when_exhausted():
+    pool = SeedUsersPool(build_seeds(2), exhaustion=SeedsPoolExhaustion.RECYCLE)
+    first, _ = pool.checkout(), pool.checkout()
+
+    recycled = [pool.checkout() for _ in range(4)]
+
+    assert [lease.index for lease in recycled] == [0, 1, 0, 1]
+    assert pool.get_stats().recycled == 4
+
+    # Пользователь снова свободен только после возврата всех его аренд
+    pool.checkin(first)
+    pool.checkin(recycled[0])
+    assert pool.free.qsize() == 0
+    pool.checkin(recycled[2])
+    assert pool.free.qsize() == 1
+    assert pool.free.peek() == first.index
+
+
+def test_pool_recycle_raises_on_empty_seeds():
+    pool = SeedUsersPool(build_seeds(0), exhaustion=SeedsPoolExhaustion.RECYCLE)
+
+    with pytest.raises(SeedUsersPoolExhaustedError):
+        pool.checkout()
@@ -0,0 +1,87 @@
+import random
+from collections import Counter
+
+import pytest
+
+from seeds.sampler import SeedsAliasTable, SeedsSampler
+from tools.config.seeds import SeedsAccessDistribution
+
+SAMPLES = 50_000
+
+
+def sample(sampler: SeedsSampler, samples: int = SAMPLES) -> Counter[int]:
+    sampler.rng = random.Random(1)
+    return Counter(sampler.sample() for _ in range(samples))
+
+
+def test_alias_table_follows_weights():
+    weights = [1.0, 2.0, 3.0, 4.0, 0.0]
+    table = SeedsAliasTable(weights)
+    rng = random.Random(1)
+
+    counts = Counter(table.sample(rng) for _ in range(SAMPLES))
+
+    for index, weight in enumerate(weights):
+        assert counts[index] / SAMPLES == pytest.approx(weight / sum(weights), abs=0.01)
+
+
+@pytest.mark.parametrize("weights", [[], [0.0, 0.0]])
+def test_alias_table_requires_positive_weight(weights: list[float]):
+    with pytest.raises(ValueError):
+        SeedsAliasTable(weights)
+
+
+def test_uniform_covers_all_keys():
+    counts = sample(SeedsSampler(count=10))
+
+    assert set(counts) == set(range(10))
+    assert max(counts.values()) / min(counts.values()) < 1.2
+
+
+def test_zipf_prefers_low_ranks():
+    sampler = SeedsSampler(count=100, distribution=SeedsAccessDistribution.ZIPF, zipf_exponent=1.0)
+
+    counts = sample(sampler)
+    by_rank = [counts[sampler.ranks[rank]] for rank in range(100)]
+
+    # Частота ключа ранга r пропорциональна 1 / r
+    assert by_rank[0] / by_rank[1] == pytest.approx(2.0, rel=0.1)
+    assert by_rank[0] / by_rank[9] == pytest.approx(10.0, rel=0.2)
+
+
+def test_hot_set_gets_hot_weight():
+    sampler = SeedsSampler(
+        count=100,
+        distribution=SeedsAccessDistribution.HOT_SET,
+        hot_fraction=0.1,
+        hot_weight=0.9
+    )
+
+    counts = sample(sampler)
+    hot = {sampler.ranks[rank] for rank in range(10)}
+
+    assert sum(counts[index] for index in hot) / SAMPLES == pytest.approx(0.9, abs=0.01)
+    assert set(counts) == set(range(100))
+
+
+def test_working_set_stays_in_window():
+    sampler = SeedsSampler(
+        count=100,
+        distribution=SeedsAccessDistribution.WORKING_SET,
+        working_set_size=10,
+        working_set_speed=0.0
+    )
+
+    counts = sample(sampler, samples=1000)
+
+    assert set(counts) == {sampler.ranks[rank] for rank in range(10)}
+
+
+def test_ranks_are_reproducible_by_seed():
+    assert SeedsSampler(count=50, seed=7).ranks == SeedsSampler(count=50, seed=7).ranks
+    assert SeedsSampler(count=50, seed=7).ranks != SeedsSampler(count=50, seed=8).ranks
+
+
+def test_empty_sampler_raises():
+    with pytest.raises(IndexError):
+        SeedsSampler(count=0, distribution=SeedsAccessDistribution.ZIPF).sample()
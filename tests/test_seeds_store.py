@@ -0,0 +1,90 @@
+import pytest
+
+from seeds import store as store_module
+from seeds.records import SeedUser
+from seeds.schema.result import SeedUserResult, SeedAccountResult, SeedCardResult, SeedOperationResult
+from seeds.store import SeedsStore, SeedsStoreShard, save_seeds_store, is_seeds_store_file, MAGIC
+
+
+@pytest.fixture
+def dumps_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(store_module, "DUMPS_DIR", tmp_path)
+    return tmp_path
+
+
+def build_users() -> list[SeedUserResult]:
+    return [
+        # Пользователь без счетов: все группы пустые
+        SeedUserResult(user_id="user-0"),
+        SeedUserResult(
+            user_id="user-1",
+            # Счёт без карт и операций
+            savings_accounts=[SeedAccountResult(account_id="savings-1")],
+            credit_card_accounts=[
+                SeedAccountResult(
+                    account_id="credit-1",
+                    virtual_cards=[SeedCardResult(card_id="virtual-1")],
+                    physical_cards=[SeedCardResult(card_id="physical-1"), SeedCardResult(card_id="physical-2")],
+                    purchase_operations=[SeedOperationResult(operation_id="покупка-1")]
+                )
+            ]
+        ),
+        SeedUserResult(
+            user_id="user-2",
+            # Группа больше 65535 элементов
+            debit_card_accounts=[
+                SeedAccountResult(
+                    account_id="debit-2",
+                    top_up_operations=[SeedOperationResult(operation_id=str(index)) for index in range(70_000)]
+                )
+            ]
+        )
+    ]
+
+
+def test_store_round_trip(dumps_dir):
+    users = build_users()
+    save_seeds_store(users=iter(users), scenario="test")
+
+    store = SeedsStore.open(scenario="test")
+
+    assert len(store) == len(users)
+    assert [store.get_user(index).to_dict() for index in range(len(store))] == [
+        SeedUser.from_result(user).to_dict() for user in users
+    ]
+
+
+def test_store_round_trip_empty(dumps_dir):
+    save_seeds_store(users=iter([]), scenario="test")
+
+    store = SeedsStore.open(scenario="test")
+
+    assert len(store) == 0
+    with pytest.raises(IndexError):
+        store.get_user(0)
+
+
+def test_store_shard_maps_indices(dumps_dir):
+    users = [SeedUserResult(user_id=f"user-{index}") for index in range(7)]
+    save_seeds_store(users=iter(users), scenario="test")
+    store = SeedsStore.open(scenario="test")
+
+    shard = SeedsStoreShard(store, index=1, count=3)
+
+    assert len(shard) == 2
+    assert [shard.get_user(index).user_id for index in range(len(shard))] == ["user-1", "user-4"]
+    with pytest.raises(IndexError):
+        shard.get_user(2)
+
+
+def test_store_rejects_unknown_format(dumps_dir):
+    store_file = dumps_dir / "test_seeds.bin"
+    store_file.write_bytes(b"SEEDBIN1" + bytes(16))
+
+    assert not is_seeds_store_file(store_file)
+    with pytest.raises(ValueError):
+        SeedsStore(store_file.read_bytes())
+
+    save_seeds_store(users=iter([]), scenario="test")
+    assert store_file.read_bytes().startswith(MAGIC)
+    assert is_seeds_store_file(store_file)
@@ -0,0 +1,84 @@
+"""
+Бенчмарк разбора ответов HTTP-клиентов gateway на больших ответах get_operations.
+
+Сравнивает прежний разбор (model_validate_json(response.text)) с HTTPResponseParser
+в режимах full, sampled и skipped (GATEWAY_HTTP_CLIENT.VALIDATION) и измеряет
+процессорное время на один ответ. Результат разбора, как в большинстве сценариев, не используется.
+
+Запуск:
+    python -m tools.benchmarks.gateway_http_parsing --operations 500 --responses 2000
+"""
+import argparse
+import json
+import time
+import uuid
+from typing import Callable
+
+from httpx import Response
+
+from clients.http.client import HTTPResponseParser
+from clients.http.gateway.operations.schema import GetOperationsResponseSchema
+from tools.config.http import HTTPClientValidation
+from tools.logger import get_logger
+
+logger = get_logger("GATEWAY_HTTP_PARSING_BENCHMARK")
+
+
+def build_response(operations: int) -> Response:
+    """
+    Создаёт ответ get_operations с operations операциями.
+    """
+    account_id = str(uuid.uuid4())
+    body = {
+        "operations": [
+            {
+                "id": str(uuid.uuid4()),
+                "type": "PURCHASE",
+                "status": "COMPLETED",
+                "amount": 1234.56,
+                "cardId": str(uuid.uuid4()),
+                "category": "supermarkets",
+                "createdAt": "2025-01-01T12:00:00",
+                "accountId": account_id
+            }
+            for _ in range(operations)
+        ]
+    }
+    return Response(200, content=json.dumps(body).encode())
+
+
+def measure(parse: Callable[[Response], object], operations: int, responses: int) -> float:
+    """
+    Разбирает responses новых ответов (у httpx.Response кэшируется text, поэтому ответ каждый раз новый).
+
+    :return: Процессорное время на ответ (в мс) без учёта создания ответов.
+    """
+    items = [build_response(operations) for _ in range(responses)]
+
+    started_at = time.process_time()
+    for response in items:
+        parse(response)
+    return (time.process_time() - started_at) / responses * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operations", type=int, default=500, help="Операций в одном ответе")
+    parser.add_argument("--responses", type=int, default=2000, help="Количество разбираемых ответов")
+    parser.add_argument("--sample-rate", type=float, default=0.1, help="Доля валидируемых ответов для sampled")
+    args = parser.parse_args()
+
+    variants: dict[str, Callable[[Response], object]] = {
+        "text (before)": lambda response: GetOperationsResponseSchema.model_validate_json(response.text)
+    }
+    for validation in HTTPClientValidation:
+        response_parser = HTTPResponseParser(validation=validation, sample_rate=args.sample_rate)
+        variants[str(validation)] = lambda response, p=response_parser: p.parse(response, GetOperationsResponseSchema)
+
+    for name, parse in variants.items():
+        cpu = measure(parse, operations=args.operations, responses=args.responses)
+        logger.info(f"{name}: operations={args.operations}, cpu_per_response={cpu:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
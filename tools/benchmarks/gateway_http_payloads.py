@@ -0,0 +1,77 @@
+"""
+Бенчмарк построения тел запросов HTTP-клиентов gateway: схема запроса с Faker в каждом запросе
+против заранее сгенерированных пулов тел запросов (GATEWAY_HTTP_CLIENT.PAYLOAD_POOL_SIZE).
+
+Запросы выполняются через httpx.MockTransport без сети, ответы не валидируются,
+поэтому замер показывает процессорное время генератора нагрузки на сборку и отправку запроса.
+
+Запуск:
+    python -m tools.benchmarks.gateway_http_payloads --requests 5000 --pool-size 1000
+"""
+import argparse
+import time
+import uuid
+from typing import Callable
+
+from httpx import Client, MockTransport, Request, Response
+
+from clients.http.client import HTTPResponseParser
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient, MAKE_OPERATION_REQUEST_SCHEMAS
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+from clients.http.gateway.users.schema import CreateUserRequestSchema
+from clients.http.payloads import HTTPPayloads
+from tools.config.http import HTTPClientValidation
+from tools.logger import get_logger
+
+logger = get_logger("GATEWAY_HTTP_PAYLOADS_BENCHMARK")
+
+
+def handle(request: Request) -> Response:
+    return Response(200, content=b"{}")
+
+
+def measure(call: Callable[[], object], requests: int) -> float:
+    """
+    :return: Процессорное время на запрос (в мс).
+    """
+    started_at = time.process_time()
+    for _ in range(requests):
+        call()
+    return (time.process_time() - started_at) / requests * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="Количество запросов каждого вида")
+    parser.add_argument("--pool-size", type=int, default=1000, help="Размер пула тел запросов каждого типа")
+    args = parser.parse_args()
+
+    card_id, account_id = str(uuid.uuid4()), str(uuid.uuid4())
+    response_parser = HTTPResponseParser(validation=HTTPClientValidation.SKIPPED)
+
+    for pool_size in (0, args.pool_size):
+        payloads = HTTPPayloads(size=pool_size)
+
+        started_at = time.perf_counter()
+        payloads.prepare(CreateUserRequestSchema, "email")
+        for schema in MAKE_OPERATION_REQUEST_SCHEMAS:
+            payloads.prepare(schema, "card_id", "account_id")
+        prepared = time.perf_counter() - started_at
+
+        client = Client(base_url="http://gateway", transport=MockTransport(handle))
+        users_client = UsersGatewayHTTPClient(client=client, parser=response_parser, payloads=payloads)
+        operations_client = OperationsGatewayHTTPClient(client=client, parser=response_parser, payloads=payloads)
+
+        create_user = measure(users_client.create_user, requests=args.requests)
+        make_purchase = measure(
+            lambda: operations_client.make_purchase_operation(card_id=card_id, account_id=account_id),
+            requests=args.requests
+        )
+        logger.info(
+            f"payload_pool_size={pool_size}: prepare={prepared:.2f}s, "
+            f"create_user={create_user:.3f}ms, make_purchase_operation={make_purchase:.3f}ms per request"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Бенчмарк пулов соединений HTTP-клиентов gateway: свой пул на каждый доменный клиент
+против одного пула на виртуального пользователя и одного пула на процесс (GATEWAY_HTTP_CLIENT.POOL_SCOPE).
+
+Поднимает локальный HTTP-сервер, создаёт клиентов для --users виртуальных пользователей
+так же, как GatewayHTTPTaskSet.on_start, и делает по одному запросу каждым доменным клиентом.
+Для каждой области пула измеряет количество TCP-соединений, которые увидел сервер,
+и память клиентов в расчёте на виртуального пользователя (по tracemalloc).
+
+Запуск:
+    python -m tools.benchmarks.gateway_http_pools --users 100
+"""
+import argparse
+import gc
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from locust.env import Environment
+
+from clients.http.gateway.accounts.client import build_accounts_gateway_locust_http_client
+from clients.http.gateway.cards.client import build_cards_gateway_locust_http_client
+from clients.http.gateway.client import build_gateway_locust_shared_http_client
+from clients.http.gateway.documents.client import build_documents_gateway_locust_http_client
+from clients.http.gateway.operations.client import build_operations_gateway_locust_http_client
+from clients.http.gateway.users.client import build_users_gateway_locust_http_client
+from config import settings
+from tools.config.http import HTTPClientPoolScope
+from tools.logger import get_logger
+
+logger = get_logger("GATEWAY_HTTP_POOLS_BENCHMARK")
+
+BUILDERS = (
+    build_users_gateway_locust_http_client,
+    build_cards_gateway_locust_http_client,
+    build_accounts_gateway_locust_http_client,
+    build_documents_gateway_locust_http_client,
+    build_operations_gateway_locust_http_client
+)
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    """
+    Отвечает пустым JSON на любой GET и запоминает адрес клиента — одно TCP-соединение.
+    """
+    protocol_version = "HTTP/1.1"
+    connections: set[tuple[str, int]] = set()
+
+    def do_GET(self) -> None:
+        self.connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def measure(scope: HTTPClientPoolScope, users: int) -> tuple[int, float]:
+    """
+    Создаёт клиентов users виртуальных пользователей и делает по запросу каждым доменным клиентом.
+
+    :return: Количество TCP-соединений и память клиентов на виртуального пользователя (в КБ).
+    """
+    settings.gateway_http_client.pool_scope = scope
+    environment = Environment()
+    CountingHandler.connections = set()
+
+    gc.collect()
+    tracemalloc.start()
+    clients = []
+    for _ in range(users):
+        client = build_gateway_locust_shared_http_client(environment)
+        for build in BUILDERS:
+            gateway_client = build(environment, client)
+            gateway_client.get("/")
+            clients.append(gateway_client)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    connections = len(CountingHandler.connections)
+    for gateway_client in clients:
+        gateway_client.client.close()
+
+    return connections, memory / 1024 / max(users, 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=100, help="Количество виртуальных пользователей")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CountingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    settings.gateway_http_client.url = f"http://127.0.0.1:{server.server_port}"
+
+    try:
+        for scope in HTTPClientPoolScope:
+            connections, memory = measure(scope=scope, users=args.users)
+            logger.info(
+                f"pool_scope={scope}: users={args.users}, connections={connections}, "
+                f"memory_per_user={memory:.1f}KB"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Бенчмарк транспортов HTTP-клиента gateway: httpx (httpcore) против geventhttpclient (GATEWAY_HTTP_CLIENT.TRANSPORT).
+
+Поднимает HTTP-сервер в отдельном процессе, чтобы его работа не попадала в замер,
+и делает --requests запросов из --users гринлетов через клиента Locust (с event hooks и route).
+Для каждого транспорта измеряет пропускную способность и процессорное время генератора
+нагрузки на один запрос — именно оно ограничивает RPS на ядро.
+
+Запуск:
+    python -m tools.benchmarks.gateway_http_transports --requests 20000 --users 50
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+import gevent
+from gevent.pool import Pool
+from locust.env import Environment
+
+from clients.http.client import HTTPClient
+from clients.http.gateway.client import build_gateway_locust_http_client
+from config import settings
+from tools.config.http import HTTPClientTransport
+from tools.logger import get_logger
+
+logger = get_logger("GATEWAY_HTTP_TRANSPORTS_BENCHMARK")
+
+# Сервер, отвечающий небольшим JSON на любой запрос (по ответу на пользователя gateway)
+SERVER_SCRIPT = """
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BODY = b'{"user": {"id": "8a7f0b8e-1c1f-4f7e-9f0e-3c9d2b1a0e5d", "email": "user@example.com"}}'
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+ThreadingHTTPServer.daemon_threads = True
+ThreadingHTTPServer(("127.0.0.1", int(sys.argv[1])), Handler).serve_forever()
+"""
+
+
+def measure(transport: HTTPClientTransport, requests: int, users: int) -> tuple[float, float, int]:
+    """
+    Выполняет requests запросов из users гринлетов, у каждого свой клиент.
+
+    :return: Запросов в секунду, процессорное время на запрос (в мс) и количество ошибок.
+    """
+    settings.gateway_http_client.transport = transport
+    environment = Environment()
+    failures = []
+    environment.events.request.add_listener(
+        lambda exception=None, **kwargs: exception and failures.append(exception)
+    )
+    clients = [HTTPClient(client=build_gateway_locust_http_client(environment)) for _ in range(users)]
+
+    def run(client: HTTPClient) -> None:
+        for _ in range(requests // users):
+            client.get("/api/v1/users/1", extensions={"route": "/api/v1/users/{user_id}"})
+
+    started_at, cpu_started_at = time.perf_counter(), time.process_time()
+    Pool(users).map(run, clients)
+    elapsed, cpu = time.perf_counter() - started_at, time.process_time() - cpu_started_at
+
+    for client in clients:
+        client.client.close()
+
+    total = requests // users * users
+    return total / elapsed, cpu / total * 1000, len(failures)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000, help="Количество запросов на транспорт")
+    parser.add_argument("--users", type=int, default=50, help="Количество одновременных клиентов (гринлетов)")
+    parser.add_argument("--port", type=int, default=18003, help="Порт локального сервера")
+    args = parser.parse_args()
+
+    server = subprocess.Popen([sys.executable, "-c", SERVER_SCRIPT, str(args.port)])
+    settings.gateway_http_client.url = f"http://127.0.0.1:{args.port}"
+    gevent.sleep(1)
+
+    try:
+        for transport in HTTPClientTransport:
+            rps, cpu, failures = measure(transport=transport, requests=args.requests, users=args.users)
+            logger.info(
+                f"transport={transport}: requests={args.requests}, rps={rps:.0f}, "
+                f"cpu_per_request={cpu:.3f}ms, failures={failures}"
+            )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Бенчмарк загрузки результата сидинга: pydantic-модели (SeedsResult) против облегчённых записей (SeedsRecords).
+
+Генерирует синтетический дамп и для каждого представления измеряет время загрузки
+и объём памяти, который занимают загруженные пользователи (по tracemalloc).
+
+Запуск:
+    python -m tools.benchmarks.seeds_records --users 100000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+import uuid
+from typing import Callable
+
+from seeds.dumps import SeedsWriter, get_seeds_result_file, load_seeds_result, load_seeds_records
+from seeds.records import USER_ACCOUNTS, ACCOUNT_CARDS, ACCOUNT_OPERATIONS
+from seeds.schema.result import SeedUserResult, SeedAccountResult, SeedCardResult, SeedOperationResult
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_RECORDS_BENCHMARK")
+
+BENCHMARK_SCENARIO = "benchmark_seeds_records"
+
+
+def build_user(accounts: int, cards: int, operations: int) -> SeedUserResult:
+    """
+    Создаёт синтетического пользователя: accounts счетов каждого типа,
+    cards карт каждого вида и operations операций каждого вида на счёт.
+    """
+    def build_account() -> SeedAccountResult:
+        return SeedAccountResult(
+            account_id=str(uuid.uuid4()),
+            **{name: [SeedCardResult(card_id=str(uuid.uuid4())) for _ in range(cards)] for name in ACCOUNT_CARDS},
+            **{
+                name: [SeedOperationResult(operation_id=str(uuid.uuid4())) for _ in range(operations)]
+                for name in ACCOUNT_OPERATIONS
+            }
+        )
+
+    return SeedUserResult(
+        user_id=str(uuid.uuid4()),
+        **{name: [build_account() for _ in range(accounts)] for name in USER_ACCOUNTS}
+    )
+
+
+def measure(load: Callable[[], object]) -> tuple[float, float]:
+    """
+    Загружает дамп дважды: без трассировки для замера времени и под tracemalloc для замера памяти.
+
+    :return: Время загрузки (в секундах) и память загруженного результата (в МБ).
+    """
+    gc.collect()
+    started_at = time.perf_counter()
+    result = load()
+    elapsed = time.perf_counter() - started_at
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = load()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return elapsed, memory / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=100_000, help="Количество пользователей в дампе")
+    parser.add_argument("--accounts", type=int, default=1, help="Счетов каждого типа на пользователя")
+    parser.add_argument("--cards", type=int, default=1, help="Карт каждого вида на счёт")
+    parser.add_argument("--operations", type=int, default=1, help="Операций каждого вида на счёт")
+    args = parser.parse_args()
+
+    with SeedsWriter(scenario=BENCHMARK_SCENARIO) as writer:
+        for _ in range(args.users):
+            writer.write(build_user(accounts=args.accounts, cards=args.cards, operations=args.operations))
+
+    try:
+        for name, load in (
+                ("pydantic (SeedsResult)", lambda: load_seeds_result(scenario=BENCHMARK_SCENARIO)),
+                ("records (SeedsRecords)", lambda: load_seeds_records(scenario=BENCHMARK_SCENARIO))
+        ):
+            elapsed, memory = measure(load)
+            logger.info(
+                f"{name}: users={args.users}, load={elapsed:.2f}s, memory={memory:.1f}MB, "
+                f"per_user={memory * 1024 * 1024 / max(args.users, 1):.0f}B"
+            )
+    finally:
+        get_seeds_result_file(scenario=BENCHMARK_SCENARIO).unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,31 @@
-from pydantic import BaseModel, HttpUrl
+from enum import StrEnum
+
+from pydantic import BaseModel, Field, HttpUrl, model_validator
+
+
+class HTTPClientPoolScope(StrEnum):
+    # Каждый доменный клиент (users, cards, accounts, ...) держит свой пул соединений
+    CLIENT = "client"
+    # Все доменные клиенты виртуального пользователя используют один пул соединений
+    USER = "user"
+    # Все виртуальные пользователи процесса используют один пул соединений
+    PROCESS = "process"
+
+
+class HTTPClientTransport(StrEnum):
+    # Стандартный транспорт httpx (httpcore)
+    HTTPX = "httpx"
+    # gevent-нативный транспорт на geventhttpclient, как у FastHttpUser в Locust (см. clients/http/transport.py)
+    GEVENT = "gevent"
+
+
+class HTTPClientValidation(StrEnum):
+    # Каждый ответ валидируется в pydantic-схему сразу
+    FULL = "full"
+    # Сразу валидируется доля validation_sample_rate ответов, остальные — при первом обращении к полям
+    SAMPLED = "sampled"
+    # Ответы валидируются только при первом обращении к полям (HTTPLazyResponse)
+    SKIPPED = "skipped"
 
 
 class HTTPClientConfig(BaseModel):
@@ -8,6 +35,55 @@ class HTTPClientConfig(BaseModel):
     # Таймаут для запросов в секундах (по умолчанию 100)
     timeout: float = 100.0
 
+    # Транспорт, через который httpx.Client выполняет запросы
+    transport: HTTPClientTransport = HTTPClientTransport.HTTPX
+
+    # Использовать HTTP/2: запросы всех виртуальных пользователей процесса мультиплексируются
+    # потоками в общих соединениях. Виртуальный пользователь отправляет запросы последовательно,
+    # поэтому мультиплексирование возможно только при общем пуле процесса:
+    # требует transport=httpx и pool_scope=process.
+    http2: bool = False
+
+    # Валидация ответов клиентами Locust (клиенты сидинга всегда валидируют ответы полностью)
+    validation: HTTPClientValidation = HTTPClientValidation.FULL
+
+    # Доля ответов, которые валидируются сразу при validation=sampled
+    validation_sample_rate: float = Field(default=0.1, ge=0, le=1)
+
+    # Сколько разных тел запросов каждого типа (создание пользователя, операции) заранее
+    # сгенерировать и сериализовать в процессе Locust. В запросе подставляются только ID,
+    # без Faker и pydantic. Значение 0 отключает пулы: тело запроса строится в каждом запросе.
+    payload_pool_size: int = Field(default=0, ge=0)
+
+    # Кто делит один пул соединений в нагрузочных тестах (см. build_gateway_locust_shared_http_client)
+    pool_scope: HTTPClientPoolScope = HTTPClientPoolScope.USER
+
+    # Лимиты пула соединений (httpx.Limits); по умолчанию совпадают со значениями httpx.
+    # Для pool_scope=process max_connections должен быть не меньше количества
+    # виртуальных пользователей процесса, иначе запросы будут ждать свободного соединения.
+    max_connections: int | None = Field(default=100, ge=1)
+    max_keepalive_connections: int | None = Field(default=20, ge=0)
+    keepalive_expiry: float | None = Field(default=5.0, ge=0)
+
+    @model_validator(mode="after")
+    def check_http2_transport(self) -> "HTTPClientConfig":
+        if self.http2 and self.transport != HTTPClientTransport.HTTPX:
+            raise ValueError("http2 is supported only with transport=httpx")
+        if self.http2 and self.pool_scope != HTTPClientPoolScope.PROCESS:
+            raise ValueError("http2 requires pool_scope=process: a virtual user sends requests sequentially")
+        return self
+
+    @property
+    def http1(self) -> bool:
+        """
+        Разрешён ли HTTP/1.1.
+
+        Для https версия согласуется через ALPN, и HTTP/1.1 остаётся запасным вариантом.
+        Для http:// согласования нет, поэтому при http2 клиент сразу говорит на HTTP/2
+        (prior knowledge), иначе httpx использовал бы HTTP/1.1.
+        """
+        return not (self.http2 and self.url.scheme == "http")
+
     @property
     def client_url(self) -> str:
         """
@@ -19,5 +95,3 @@ class HTTPClientConfig(BaseModel):
         - Если передать HttpUrl напрямую, будет ошибка типов.
         """
         return str(self.url)
-
-
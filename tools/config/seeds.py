@@ -0,0 +1,147 @@
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+
+class SeedsBackend(StrEnum):
+    # Результат сидинга загружается целиком в облегчённые записи (SeedsRecords)
+    JSONL = "jsonl"
+    # Результат сидинга читается по требованию из memory-mapped бинарного файла (SeedsStore)
+    MMAP = "mmap"
+
+
+class SeedsClient(StrEnum):
+    # Сидинг через gRPC gateway
+    GATEWAY_GRPC = "gateway_grpc"
+    # Сидинг через HTTP gateway
+    GATEWAY_HTTP = "gateway_http"
+    # Сидинг напрямую через внутренние gRPC-сервисы users, accounts, cards и operations
+    SERVICES_GRPC = "services_grpc"
+
+
+class SeedsPoolExhaustion(StrEnum):
+    # Ждать, пока другой виртуальный пользователь вернёт пользователя сидинга
+    BLOCK = "block"
+    # Выдать уже арендованного пользователя сидинга повторно (по кругу)
+    RECYCLE = "recycle"
+    # Завершить виртуального пользователя с ошибкой
+    FAIL = "fail"
+
+
+class SeedsAccessDistribution(StrEnum):
+    # Все пользователи сидинга одинаково популярны
+    UNIFORM = "uniform"
+    # Популярность пользователя ранга r пропорциональна 1 / r ** access_zipf_exponent
+    ZIPF = "zipf"
+    # Доля access_hot_fraction пользователей получает долю access_hot_weight обращений
+    HOT_SET = "hot_set"
+    # Обращения равномерны внутри окна из access_working_set_size пользователей, окно со временем сдвигается
+    WORKING_SET = "working_set"
+
+
+class SeedsConfig(BaseModel):
+    # Через какие клиенты выполняется сидинг
+    client: SeedsClient = SeedsClient.GATEWAY_GRPC
+
+    # Максимальное количество одновременных запросов сидинга к системе.
+    # Значение 1 означает последовательный сидинг (как раньше).
+    concurrency: int = Field(default=1, ge=1)
+
+    # Подбирать количество одновременных запросов автоматически (AIMD) в пределах 1..concurrency
+    # по задержке и ошибкам запросов. Итоговый лимит выводится в лог после сидинга.
+    adaptive: bool = False
+
+    # Во сколько раз задержка запроса может превысить минимальную, прежде чем считается перегрузкой
+    adaptive_latency_tolerance: float = Field(default=2.0, gt=1)
+
+    # Во сколько раз уменьшается лимит при перегрузке
+    adaptive_backoff: float = Field(default=0.5, gt=0, lt=1)
+
+    # Сколько раз повторять запрос сидинга, завершившийся ошибкой или таймаутом
+    retries: int = Field(default=0, ge=0)
+
+    # Вести журнал сидинга (dumps/<scenario>_seeds.journal.jsonl) и продолжать
+    # прерванный сидинг с последнего сохранённого пользователя.
+    journal: bool = False
+
+    # Переиспользовать существующий дамп, если он построен по тому же плану (по хэшу плана).
+    cache: bool = False
+
+    # Сколько случайных пользователей из дампа проверить в системе перед переиспользованием.
+    # Значение 0 отключает проверку.
+    cache_check_sample: int = Field(default=0, ge=0)
+
+    # Если дамп построен по другому плану, дозаполнять его до нового плана
+    # (создавать только недостающие сущности), а не строить данные заново.
+    top_up: bool = False
+
+    # Как часто выводить в лог прогресс сидинга: готовые пользователи, вызовы в секунду и ETA
+    # (в секундах). Значение 0 отключает вывод прогресса.
+    progress_interval: float = Field(default=10.0, ge=0)
+
+    # Не выполнять сидинг, а только оценить план: количество вызовов каждого метода клиентов сидинга (SEEDS.CLIENT),
+    # количество сущностей и прогноз времени при SEEDS.CONCURRENCY (см. seeds/estimator.py)
+    dry_run: bool = False
+
+    # Задержка одного вызова для прогноза времени (в секундах)
+    dry_run_latency: float = Field(default=0.05, gt=0)
+
+    # JSON-файл с задержками по методам клиентов сидинга ({"make_purchase_operation": 0.12, ...}).
+    # Методы, которых нет в файле, оцениваются по dry_run_latency. Если файл не задан, берутся
+    # средние задержки из телеметрии предыдущего сидинга (dumps/<scenario>_seeds.telemetry.json).
+    dry_run_latencies_file: str | None = None
+
+    # Распределять количество операций покупки на счёт в сценарии existing_user_get_operations
+    # по закону Zipf (от 1 до 100) вместо фиксированных 5: на «тяжёлых» счетах видны медленные запросы.
+    # Такой дамп сохраняется под отдельным именем сценария (existing_user_get_operations_skewed).
+    skewed_operations: bool = False
+
+    # Способ загрузки результата сидинга в процессы Locust
+    backend: SeedsBackend = SeedsBackend.JSONL
+
+    # Передавать воркерам Locust на той же машине (например, --processes N) не копию шарда,
+    # а путь к бинарному хранилищу сидинга: воркеры открывают его через mmap только для чтения,
+    # и все процессы используют одну копию данных в page cache. Удалённые воркеры по-прежнему
+    # получают свой шард целиком.
+    shared_store: bool = False
+
+    # Что делать, если все пользователи сидинга уже арендованы виртуальными пользователями
+    pool_exhaustion: SeedsPoolExhaustion = SeedsPoolExhaustion.RECYCLE
+
+    # Максимальное время ожидания свободного пользователя для pool_exhaustion=block (в секундах)
+    pool_timeout: float | None = None
+
+    # Сколько свежих пользователей (со счётом) держать в пуле для сценариев new_user_*.
+    # Значение 0 отключает пул: пользователи создаются прямо в задаче, как раньше.
+    fresh_pool_size: int = Field(default=0, ge=0)
+
+    # Количество фоновых гринлетов, пополняющих пул свежих пользователей
+    fresh_pool_producers: int = Field(default=1, ge=1)
+
+    # Учитывать запросы создания свежих пользователей в статистике Locust.
+    # По умолчанию создание изолировано от измеряемого пути.
+    fresh_pool_measured: bool = False
+
+    # Сколько последних ID созданных во время теста операций и счетов хранить в общих
+    # буферах процесса, из которых задачи чтения выбирают свежие сущности других пользователей.
+    # Значение 0 отключает буферы: задачи читают только то, что создали сами.
+    live_pool_size: int = Field(default=0, ge=0)
+
+    # Распределение популярности пользователей сидинга для задач чтения (SeedUsersPool.access).
+    # Если не задано, задачи чтения работают с арендованным пользователем виртуального пользователя.
+    access_distribution: SeedsAccessDistribution | None = None
+
+    # Показатель степени для access_distribution=zipf (чем больше, тем сильнее перекос)
+    access_zipf_exponent: float = Field(default=1.0, gt=0)
+
+    # Доля горячих пользователей (0 < x < 1) и доля обращений к ним (0 < x <= 1)
+    # для access_distribution=hot_set: при других значениях веса пользователей вырождаются
+    access_hot_fraction: float = Field(default=0.2, gt=0, lt=1)
+    access_hot_weight: float = Field(default=0.8, gt=0, le=1)
+
+    # Размер окна и скорость его сдвига (пользователей в секунду) для access_distribution=working_set
+    access_working_set_size: int = Field(default=100, ge=1)
+    access_working_set_speed: float = Field(default=1.0, ge=0)
+
+    # Seed перестановки рангов пользователей: при одинаковом seed горячие пользователи совпадают между запусками
+    access_seed: int = 0
@@ -1,4 +1,5 @@
 import time
+import uuid
 
 from faker import Faker
 from faker.providers.python import TEnum
@@ -43,6 +44,16 @@ class Fake:
         """
         return f"{time.time()}.{self.faker.email()}"
 
+    def unique_email(self) -> str:
+        """
+        Генерирует уникальный email без Faker: локальная часть — случайный UUID.
+
+        Дешевле email(), поэтому подходит для подстановки в каждый запрос
+        (например, в готовые тела запросов из пула, см. clients/http/payloads.py).
+        :return: Уникальный email.
+        """
+        return f"{uuid.uuid4().hex}@example.com"
+
     def category(self) -> str:
         """
         Генерирует случайную категорию покупки из предопределённого списка.
@@ -122,6 +133,54 @@ class Fake:
         """
         return self.float(1, 1000)
 
+    def pin(self) -> str:
+        """
+        Генерирует случайный PIN-код карты.
+
+        :return: Строка из 4 цифр.
+        """
+        return self.faker.numerify("####")
+
+    def cvv(self) -> str:
+        """
+        Генерирует случайный CVV-код карты.
+
+        :return: Строка из 3 цифр.
+        """
+        return self.faker.credit_card_security_code(card_type="visa")
+
+    def card_number(self) -> str:
+        """
+        Генерирует случайный номер карты.
+
+        :return: Номер карты из 16 цифр.
+        """
+        return self.faker.credit_card_number(card_type="visa16")
+
+    def card_holder(self) -> str:
+        """
+        Генерирует имя держателя карты.
+
+        :return: Имя и фамилия латиницей в верхнем регистре.
+        """
+        return f"{self.faker.first_name()} {self.faker.last_name()}".upper()
+
+    def expiry_date(self) -> str:
+        """
+        Генерирует срок действия карты в будущем.
+
+        :return: Дата в формате YYYY-MM-DD.
+        """
+        return self.faker.future_date(end_date="+5y").isoformat()
+
+    def date_time(self) -> str:
+        """
+        Генерирует случайные дату и время за последний год.
+
+        :return: Дата и время в формате ISO 8601.
+        """
+        return self.faker.date_time_between(start_date="-1y").isoformat()
+
 
 # Создаем экземпляр класса Fake с использованием Faker
 fake = Fake(faker=Faker())
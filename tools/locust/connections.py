@@ -0,0 +1,157 @@
+import time
+import weakref
+from collections import Counter
+
+from httpx import Request, Response
+from locust.env import Environment
+from pydantic import BaseModel
+
+from tools.logger import get_logger
+
+logger = get_logger("LOCUST_HTTP_CONNECTIONS")
+
+
+class HTTPConnectionsStats(BaseModel):
+    """
+    Статистика соединений и потоков HTTP-клиентов gateway.
+
+    Attributes:
+        requests (dict[str, int]): Сколько ответов получено по каждой версии протокола (HTTP/1.1, HTTP/2).
+        connections (int): Сколько TCP-соединений открыто за тест.
+        open_connections (int): Сколько соединений открыто сейчас.
+        requests_per_connection (float): Среднее количество запросов на соединение.
+        streams_per_connection (int): Наибольшее количество запросов, одновременно выполнявшихся
+            в одном соединении (в HTTP/1.1 всегда 1, в HTTP/2 — пик одновременных потоков).
+    """
+    requests: dict[str, int]
+    connections: int
+    open_connections: int
+    requests_per_connection: float
+    streams_per_connection: int
+
+
+class HTTPConnections:
+    """
+    Учёт соединений HTTP-клиентов gateway по ответам.
+
+    Соединение определяется по объекту network_stream из extensions ответа httpx (httpcore):
+    в HTTP/1.1 на нём выполняется один запрос за раз, в HTTP/2 — много потоков одновременно,
+    номер потока приходит в extensions["stream_id"]. Соединения хранятся по слабым ссылкам,
+    поэтому закрытые соединения не удерживаются в памяти. Для транспорта без network_stream
+    (geventhttpclient) считаются только ответы по версиям протокола.
+
+    Соединение запроса известно только в ответе, поэтому одновременность считается по интервалам:
+    запрос отмечается при отправке (start) и снимается при получении ответа (record), а интервал
+    [отправка, ответ] относится к соединению ответа. Для каждого соединения хранятся интервалы,
+    которые ещё могут пересечься с запросами в полёте, и по ним ведётся пик одновременных запросов.
+    """
+
+    def __init__(self):
+        self.requests: Counter[str] = Counter()
+        self.streams: weakref.WeakKeyDictionary[object, int] = weakref.WeakKeyDictionary()
+        # Запросы в полёте: время отправки в порядке отправки (запросы, завершившиеся ошибкой
+        # без ответа, уходят из словаря вместе с объектом запроса)
+        self.pending: weakref.WeakKeyDictionary[Request, float] = weakref.WeakKeyDictionary()
+        # Интервалы запросов соединения: [отправка, ответ, сколько запросов выполнялось в момент отправки]
+        self.intervals: weakref.WeakKeyDictionary[object, list[list]] = weakref.WeakKeyDictionary()
+        self.connections = 0
+        self.connection_requests = 0
+        self.streams_per_connection = 0
+
+    def start(self, request: Request) -> None:
+        """
+        Отмечает запрос в полёте.
+
+        :param request: Запрос httpx перед отправкой.
+        """
+        self.pending[request] = request.extensions.get("start_time", time.time())
+
+    def record(self, response: Response) -> None:
+        """
+        Учитывает ответ и соединение, по которому он получен.
+
+        :param response: Ответ httpx.
+        """
+        self.requests[response.http_version] += 1
+        start_time = self.pending.pop(response.request, None)
+
+        network_stream = response.extensions.get("network_stream")
+        if network_stream is None:
+            return
+
+        if network_stream not in self.streams:
+            self.connections += 1
+            self.streams[network_stream] = 0
+            self.intervals[network_stream] = []
+
+        self.connection_requests += 1
+        self.streams[network_stream] += 1
+
+        if start_time is not None:
+            self.record_interval(self.intervals[network_stream], start_time, time.time())
+
+    def record_interval(self, intervals: list[list], start_time: float, end_time: float) -> None:
+        """
+        Добавляет интервал запроса к интервалам соединения и обновляет пик одновременных запросов.
+
+        Пик пересечения интервалов достигается в момент отправки одного из запросов, поэтому
+        для каждого интервала хранится, сколько запросов соединения выполнялось в момент его отправки.
+
+        :param intervals: Интервалы соединения.
+        :param start_time: Время отправки запроса.
+        :param end_time: Время получения ответа.
+        """
+        in_flight = 1
+        for interval in intervals:
+            if interval[0] <= start_time < interval[1]:
+                in_flight += 1
+            if start_time <= interval[0] < end_time:
+                interval[2] += 1
+                self.streams_per_connection = max(self.streams_per_connection, interval[2])
+
+        intervals.append([start_time, end_time, in_flight])
+        self.streams_per_connection = max(self.streams_per_connection, in_flight)
+
+        # Запросы, которые ещё в полёте или будут отправлены позже, отправлены не раньше самого старого
+        # запроса в полёте, поэтому завершившиеся до него интервалы больше ни с чем не пересекутся
+        horizon = next(iter(self.pending.values()), start_time)
+        intervals[:] = [interval for interval in intervals if interval[1] > horizon]
+
+    def get_stats(self) -> HTTPConnectionsStats:
+        """
+        :return: Объект HTTPConnectionsStats.
+        """
+        return HTTPConnectionsStats(
+            requests=dict(self.requests),
+            connections=self.connections,
+            open_connections=len(self.streams),
+            requests_per_connection=self.connection_requests / self.connections if self.connections else 0.0,
+            streams_per_connection=self.streams_per_connection
+        )
+
+    def log_stats(self) -> None:
+        """
+        Выводит статистику соединений в лог.
+        """
+        logger.info(f"HTTP connections stats: {self.get_stats().model_dump_json()}")
+
+
+def get_http_connections(environment: Environment) -> HTTPConnections:
+    """
+    Возвращает учёт соединений окружения Locust (environment.http_connections),
+    создавая его при первом обращении. Статистика выводится в лог в test_stop.
+
+    :param environment: Объект окружения Locust.
+    :return: Объект HTTPConnections.
+    """
+    connections = getattr(environment, "http_connections", None)
+    if connections is not None:
+        return connections
+
+    connections = environment.http_connections = HTTPConnections()
+
+    @environment.events.test_stop.add_listener
+    def log_http_connections_stats(**kwargs):
+        connections.log_stats()
+
+    return connections
@@ -0,0 +1,185 @@
+from typing import Any, Callable, Generic, NamedTuple, TypeVar
+
+import gevent
+from gevent.queue import Queue
+from locust.env import Environment
+from locust.runners import MasterRunner
+from pydantic import BaseModel
+
+from clients.errors import REQUEST_ERRORS, RETRY_BACKOFF
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("LOCUST_FRESH_USERS")
+
+T = TypeVar("T")
+
+
+class FreshAccount(NamedTuple):
+    """
+    Свежий пользователь с открытым счётом.
+
+    Attributes:
+        create_user_response: Ответ на создание пользователя
+        open_account_response: Ответ на открытие счёта
+    """
+    create_user_response: Any
+    open_account_response: Any
+
+
+class FreshUsersPoolStats(BaseModel):
+    """
+    Статистика пула свежих пользователей.
+
+    Attributes:
+        size (int): Размер пула.
+        produced (int): Сколько пользователей создано.
+        failed (int): Сколько попыток создания завершилось ошибкой.
+        taken (int): Сколько пользователей выдано задачам.
+        waited (int): Сколько раз задаче пришлось ждать, потому что пул был пуст.
+    """
+    size: int
+    produced: int
+    failed: int
+    taken: int
+    waited: int
+
+
+class FreshUsersPool(Generic[T]):
+    """
+    Пул свежих пользователей для сценариев new_user_*.
+
+    Фоновые гринлеты-производители заранее создают пользователей (и их счета) и держат
+    пул заполненным до size элементов, а задачи забирают готовых пользователей через get.
+    Так создание пользователей не ограничивает пропускную способность измеряемого пути.
+
+    Каждый производитель строит свою функцию создания пользователя (и своих клиентов)
+    при запуске, поэтому область пула соединений (GATEWAY_HTTP_CLIENT.POOL_SCOPE)
+    соблюдается так же, как для виртуальных пользователей.
+    """
+
+    def __init__(self, build_produce: Callable[[], Callable[[], T]], size: int, producers: int = 1):
+        """
+        :param build_produce: Строит функцию, создающую одного пользователя.
+        :param size: Сколько готовых пользователей держать в пуле.
+        :param producers: Количество гринлетов-производителей.
+        """
+        self.build_produce = build_produce
+        self.size = size
+        self.producers = producers
+
+        self.queue: Queue = Queue(maxsize=size)
+        self.greenlets: list[gevent.Greenlet] = []
+
+        self.produced = 0
+        self.failed = 0
+        self.taken = 0
+        self.waited = 0
+
+    def start(self) -> None:
+        """
+        Запускает производителей (если они ещё не запущены).
+        """
+        if self.greenlets:
+            return
+
+        self.greenlets = [gevent.spawn(self.run_producer) for _ in range(self.producers)]
+
+    def stop(self) -> None:
+        """
+        Останавливает производителей. Уже созданные пользователи остаются в пуле.
+        """
+        gevent.killall(self.greenlets)
+        self.greenlets = []
+
+    def run_producer(self) -> None:
+        """
+        Цикл производителя: создаёт пользователей и кладёт их в пул, пока в нём есть место.
+        После ошибки делает паузу, растущую с количеством ошибок подряд.
+        """
+        produce = self.build_produce()
+
+        failures = 0
+        while True:
+            try:
+                item = produce()
+            except REQUEST_ERRORS as error:
+                self.failed += 1
+                failures += 1
+                logger.warning(f"Failed to create fresh user: {error!r}")
+                gevent.sleep(RETRY_BACKOFF * 2 ** min(failures, 6))
+                continue
+
+            failures = 0
+            self.produced += 1
+            self.queue.put(item)
+
+    def get(self) -> T:
+        """
+        Возвращает свежего пользователя. Если пул пуст, ждёт, пока производитель его создаст.
+
+        :return: Созданный пользователь.
+        """
+        self.taken += 1
+
+        if self.queue.empty():
+            self.waited += 1
+
+        return self.queue.get()
+
+    def get_stats(self) -> FreshUsersPoolStats:
+        """
+        :return: Объект FreshUsersPoolStats.
+        """
+        return FreshUsersPoolStats(
+            size=self.size,
+            produced=self.produced,
+            failed=self.failed,
+            taken=self.taken,
+            waited=self.waited
+        )
+
+    def log_stats(self) -> None:
+        """
+        Выводит статистику пула в лог.
+        """
+        logger.info(f"Fresh users pool stats: {self.get_stats().model_dump_json()}")
+
+
+def init_fresh_users_pool(
+        environment: Environment,
+        build_produce: Callable[[Environment | None], Callable[[], T]]
+) -> None:
+    """
+    Кладёт в окружение Locust пул свежих пользователей (environment.fresh_users).
+
+    Размер пула, количество производителей и то, попадают ли запросы производителей
+    в статистику Locust, задаются настройками SEEDS.FRESH_POOL_*. При SEEDS.FRESH_POOL_SIZE=0
+    (и на мастере распределённого запуска, где задачи не выполняются) пул не создаётся:
+    environment.fresh_users равен None, и сценарии создают пользователя и счёт своими клиентами, как раньше.
+    Производители запускаются в test_start и останавливаются в test_stop.
+
+    :param environment: Объект окружения Locust.
+    :param build_produce: Строит функцию создания пользователя: с клиентами Locust,
+        если передано окружение, или с обычными клиентами, если передан None.
+    """
+    size = settings.seeds.fresh_pool_size
+    if size == 0 or isinstance(environment.runner, MasterRunner):
+        environment.fresh_users = None
+        return
+
+    measured = settings.seeds.fresh_pool_measured
+    environment.fresh_users = FreshUsersPool(
+        build_produce=lambda: build_produce(environment if measured else None),
+        size=size,
+        producers=settings.seeds.fresh_pool_producers
+    )
+
+    @environment.events.test_start.add_listener
+    def start_fresh_users_producers(**kwargs):
+        environment.fresh_users.start()
+
+    @environment.events.test_stop.add_listener
+    def stop_fresh_users_producers(**kwargs):
+        environment.fresh_users.stop()
+        environment.fresh_users.log_stats()
@@ -0,0 +1,128 @@
+import random
+
+from locust.env import Environment
+from pydantic import BaseModel
+
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("LOCUST_LIVE_ENTITIES")
+
+
+class LiveEntitiesRing:
+    """
+    Кольцевой буфер ID сущностей, созданных во время теста.
+
+    Хранит последние capacity опубликованных ID: новая запись затирает самую старую.
+    Публикация и выбор случайного ID — O(1). При capacity=0 буфер выключен:
+    publish ничего не делает, а sample всегда возвращает None.
+
+    Attributes:
+        capacity: Сколько последних ID хранить
+        published: Сколько ID опубликовано за всё время
+    """
+    __slots__ = ("capacity", "items", "cursor", "published")
+
+    def __init__(self, capacity: int):
+        """
+        :param capacity: Сколько последних ID хранить (0 — буфер выключен).
+        """
+        self.capacity = capacity
+        self.items: list[str] = []
+        self.cursor = 0
+        self.published = 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def publish(self, entity_id: str) -> None:
+        """
+        Добавляет ID созданной сущности.
+
+        :param entity_id: ID сущности.
+        """
+        if self.capacity == 0:
+            return
+
+        if len(self.items) < self.capacity:
+            self.items.append(entity_id)
+        else:
+            self.items[self.cursor] = entity_id
+            self.cursor = (self.cursor + 1) % self.capacity
+
+        self.published += 1
+
+    def sample(self) -> str | None:
+        """
+        Возвращает случайный ID среди последних опубликованных.
+
+        :return: ID сущности или None, если буфер пуст.
+        """
+        if not self.items:
+            return None
+
+        return self.items[random.randrange(len(self.items))]
+
+
+class LiveEntitiesStats(BaseModel):
+    """
+    Статистика сущностей, опубликованных во время теста.
+
+    Attributes:
+        operations (int): Сколько ID операций опубликовано.
+        accounts (int): Сколько ID счетов опубликовано.
+    """
+    operations: int
+    accounts: int
+
+
+class LiveEntities:
+    """
+    Общие для процесса буферы недавно созданных операций и счетов.
+
+    Задачи записи всех виртуальных пользователей процесса публикуют сюда ID созданных
+    сущностей, а задачи чтения выбирают из них случайный ID. Так чтение попадает в свежие,
+    ещё не закэшированные строки, созданные другими пользователями, как у реальных клиентов.
+    Все виртуальные пользователи процесса работают в одном потоке (gevent), поэтому блокировки не нужны.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        :param capacity: Сколько последних ID каждого вида хранить (0 — буферы выключены).
+        """
+        self.operations = LiveEntitiesRing(capacity)
+        self.accounts = LiveEntitiesRing(capacity)
+
+    def get_stats(self) -> LiveEntitiesStats:
+        """
+        :return: Объект LiveEntitiesStats.
+        """
+        return LiveEntitiesStats(
+            operations=self.operations.published,
+            accounts=self.accounts.published
+        )
+
+    def log_stats(self) -> None:
+        """
+        Выводит статистику опубликованных сущностей в лог.
+        """
+        logger.info(f"Live entities stats: {self.get_stats().model_dump_json()}")
+
+
+def init_live_entities(environment: Environment) -> None:
+    """
+    Кладёт в окружение Locust общие буферы недавно созданных сущностей (environment.live).
+
+    Размер буферов задаётся SEEDS.LIVE_POOL_SIZE; при значении 0 задачи чтения
+    работают только с сущностями, созданными их же виртуальным пользователем.
+
+    :param environment: Объект окружения Locust.
+    """
+    environment.live = LiveEntities(capacity=settings.seeds.live_pool_size)
+
+    if settings.seeds.live_pool_size == 0:
+        return
+
+    @environment.events.test_stop.add_listener
+    def log_live_entities_stats(**kwargs):
+        environment.live.log_stats()
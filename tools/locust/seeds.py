@@ -0,0 +1,246 @@
+import socket
+from pathlib import Path
+
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from seeds.pool import SeedUsersPool
+from seeds.sampler import SeedsSampler
+from seeds.records import SeedsRecords
+from seeds.scenario import SeedsScenario
+from seeds.store import SeedsStore, SeedsStoreShard, get_seeds_store_file
+from tools.logger import get_logger
+
+logger = get_logger("LOCUST_SEEDS")
+
+# Тип кастомного сообщения Locust, в котором мастер отправляет воркеру его шард сидинга
+SEEDS_SHARD_MESSAGE = "seeds_shard"
+
+
+def get_seeds_shard(seeds: SeedsRecords | SeedsStore, index: int, count: int) -> SeedsRecords:
+    """
+    Возвращает шард результата сидинга: каждого count-го пользователя, начиная с index.
+
+    Шарды с разными index не пересекаются, а вместе покрывают всех пользователей.
+
+    :param seeds: Результат сидинга (SeedsRecords или SeedsStore).
+    :param index: Номер шарда (0 <= index < count).
+    :param count: Общее количество шардов.
+    :return: Объект SeedsRecords с пользователями шарда.
+    """
+    return SeedsRecords(seeds.get_user(i) for i in range(index, len(seeds), count))
+
+
+def is_local_worker(worker_id: str) -> bool:
+    """
+    Проверяет, запущен ли воркер на той же машине, что и мастер.
+
+    ID воркера Locust имеет вид <hostname>_<uuid>, поэтому достаточно сравнить имя хоста.
+    """
+    return worker_id.rsplit("_", 1)[0] == socket.gethostname()
+
+
+def build_seeds_pool(seeds: SeedsRecords | SeedsStore | SeedsStoreShard) -> SeedUsersPool:
+    """
+    Оборачивает результат сидинга в пул эксклюзивной аренды с настройками из settings.
+    Если задан SEEDS.ACCESS_DISTRIBUTION, к пулу подключается сэмплер популярности пользователей.
+    """
+    sampler = None
+    if settings.seeds.access_distribution is not None:
+        sampler = SeedsSampler(
+            count=len(seeds),
+            distribution=settings.seeds.access_distribution,
+            zipf_exponent=settings.seeds.access_zipf_exponent,
+            hot_fraction=settings.seeds.access_hot_fraction,
+            hot_weight=settings.seeds.access_hot_weight,
+            working_set_size=settings.seeds.access_working_set_size,
+            working_set_speed=settings.seeds.access_working_set_speed,
+            seed=settings.seeds.access_seed
+        )
+
+    return SeedUsersPool(
+        seeds=seeds,
+        exhaustion=settings.seeds.pool_exhaustion,
+        timeout=settings.seeds.pool_timeout,
+        sampler=sampler
+    )
+
+
+def init_seeds_pool(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Выполняет сидинг и кладёт в окружение Locust пул аренды пользователей сидинга.
+
+    Виртуальные пользователи берут пользователя через environment.seeds.checkout()
+    и возвращают его через environment.seeds.checkin(). По завершении теста
+    статистика равномерности использования пользователей выводится в лог.
+
+    В распределённом режиме (--master/--worker) сидинг выполняет только мастер.
+    Перед запуском пользователей он делит результат на непересекающиеся шарды
+    и отправляет каждому подключённому воркеру его шард кастомным сообщением Locust.
+    Воркеры сами сидинг не выполняют и не читают дамп: пул создаётся из полученного шарда.
+    При SEEDS.SHARED_STORE воркеры на той же машине вместо шарда получают путь к бинарному
+    хранилищу и открывают его через mmap: данные в памяти хранятся в одном экземпляре.
+
+    :param environment: Объект окружения Locust.
+    :param seeds_scenario: Сценарий сидинга, данные которого используются в тесте.
+    """
+    if isinstance(environment.runner, WorkerRunner):
+        init_worker_seeds_pool(environment)
+        return
+
+    # Генерируем данные (или переиспользуем уже готовый дамп)
+    seeds_scenario.build()
+
+    if isinstance(environment.runner, MasterRunner):
+        init_master_seeds_shards(environment, seeds_scenario)
+        return
+
+    # Загружаем сидинг и оборачиваем его в пул эксклюзивной аренды
+    environment.seeds = build_seeds_pool(seeds_scenario.load())
+
+    @environment.events.test_stop.add_listener
+    def log_seeds_pool_stats(**kwargs):
+        environment.seeds.log_stats()
+
+
+def init_master_seeds_shards(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Регистрирует на мастере рассылку шардов сидинга воркерам.
+
+    Шарды отправляются в test_start: мастер вызывает его до отправки сообщений spawn,
+    а сообщения одному воркеру доставляются по порядку, поэтому к моменту запуска
+    виртуальных пользователей пул на воркере уже создан.
+
+    Воркер, подключившийся во время теста (worker_connect), получает шард до своего
+    сообщения spawn: переподключившийся воркер — свой прежний шард, новый воркер — шард
+    воркера, который уже отключился. Шарды работающих воркеров не перераспределяются,
+    чтобы пользователи сидинга оставались эксклюзивными. Если свободного шарда нет,
+    воркер получает сообщение с ошибкой и останавливается.
+
+    Сообщение содержит либо пользователей шарда ({"users": [...]}), либо, для локальных
+    воркеров при SEEDS.SHARED_STORE, ссылку на шард общего хранилища
+    ({"store": путь, "index": номер шарда, "count": количество шардов}),
+    либо причину, по которой шард не выдан ({"error": текст}).
+    """
+    if settings.seeds.shared_store:
+        seeds = seeds_scenario.load_store()
+        store_file = get_seeds_store_file(scenario=seeds_scenario.scenario)
+    else:
+        seeds = seeds_scenario.load()
+        store_file = None
+
+    # Номер шарда каждого воркера текущего теста; пусто, пока тест не запущен
+    shards: dict[str, int] = {}
+
+    def send_seeds_shard(worker: str, index: int, count: int) -> bool:
+        """
+        Отправляет воркеру его шард.
+
+        :return: True, если воркер подключён к общему хранилищу.
+        """
+        if store_file is not None and is_local_worker(worker):
+            data = {"store": str(store_file.resolve()), "index": index, "count": count}
+        else:
+            data = {"users": get_seeds_shard(seeds, index=index, count=count).to_dicts()}
+
+        environment.runner.send_message(SEEDS_SHARD_MESSAGE, data, client_id=worker)
+        return "store" in data
+
+    @environment.events.test_start.add_listener
+    def send_seeds_shards(**kwargs):
+        runner: MasterRunner = environment.runner
+
+        workers = sorted(worker.id for worker in runner.clients.values())
+        if len(workers) > len(seeds):
+            logger.warning(
+                f"Seeded users ({len(seeds)}) are fewer than workers ({len(workers)}), "
+                f"some workers will get empty shards"
+            )
+
+        shards.clear()
+        shared = 0
+        for index, worker in enumerate(workers):
+            shards[worker] = index
+            shared += send_seeds_shard(worker, index=index, count=len(workers))
+
+        logger.info(
+            f"Sent {len(seeds)} seeded users to {len(workers)} workers "
+            f"({shared} attached to shared store)"
+        )
+
+    @environment.events.worker_connect.add_listener
+    def send_seeds_shard_to_connected_worker(client_id: str, **kwargs):
+        # До test_start шарды ещё не распределены: воркер получит свой вместе с остальными
+        if not shards:
+            return
+
+        runner: MasterRunner = environment.runner
+
+        index = shards.get(client_id)
+        if index is None:
+            # Шард отключившегося воркера: его уже нет среди воркеров мастера
+            # (пропавшие по heartbeat воркеры ещё могут вернуться, их шарды не трогаем)
+            free = [index for worker, index in shards.items() if worker not in runner.clients]
+            if not free:
+                error = (
+                    f"No free seeds shard for worker {client_id}: all {len(shards)} shards "
+                    f"are held by connected workers, restart the test to reshard"
+                )
+                logger.error(error)
+                runner.send_message(SEEDS_SHARD_MESSAGE, {"error": error}, client_id=client_id)
+                return
+
+            index = min(free)
+            for worker in [worker for worker, held in shards.items() if held == index]:
+                del shards[worker]
+            shards[client_id] = index
+
+        send_seeds_shard(client_id, index=index, count=len(shards))
+        logger.info(f"Sent seeds shard {index} to connected worker {client_id}")
+
+    @environment.events.test_stop.add_listener
+    def clear_seeds_shards(**kwargs):
+        shards.clear()
+
+
+def init_worker_seeds_pool(environment: Environment) -> None:
+    """
+    Регистрирует на воркере приём шарда сидинга от мастера.
+
+    При каждом новом запуске теста мастер присылает шард заново, и пул пересоздаётся.
+    Если к запуску виртуальных пользователей (test_start) шард не получен, воркер
+    останавливается с ошибкой, а не падает на environment.seeds.checkout().
+    """
+    environment.seeds = None
+    errors: list[str] = []
+
+    def receive_seeds_shard(environment: Environment, msg, **kwargs):
+        if "error" in msg.data:
+            errors.append(msg.data["error"])
+            logger.error(f"Master did not send seeds shard: {msg.data['error']}")
+            return
+
+        if "store" in msg.data:
+            store = SeedsStore.open_file(Path(msg.data["store"]))
+            shard = SeedsStoreShard(store, index=msg.data["index"], count=msg.data["count"])
+        else:
+            shard = SeedsRecords.from_dicts(msg.data["users"])
+
+        environment.seeds = build_seeds_pool(shard)
+
+        logger.info(f"Received seeds shard from master, users: {len(shard)}")
+
+    environment.runner.register_message(SEEDS_SHARD_MESSAGE, receive_seeds_shard)
+
+    @environment.events.test_start.add_listener
+    def check_seeds_shard(**kwargs):
+        if environment.seeds is None:
+            reason = errors[-1] if errors else "no shard message received"
+            logger.error(f"Seeds shard is missing ({reason}), stopping worker")
+            environment.runner.quit()
+
+    @environment.events.test_stop.add_listener
+    def log_seeds_pool_stats(**kwargs):
+        if environment.seeds is not None:
+            environment.seeds.log_stats()